@@ -280,7 +280,7 @@ def step5_add_widgets(
 
     # Build all widgets
     print("\n[BUILD] Building widget configurations...")
-    widgets = widget_builder.build_all_widgets(vendor_data=vendor_progress)
+    widgets = [w.to_dict() for w in widget_builder.build_all_widgets(vendor_data=vendor_progress)]
     print(f"   Built {len(widgets)} widgets")
 
     # Update dashboard with widgets
@@ -176,19 +176,26 @@ def analyze_timeline(tasks):
     return milestones, critical_path, go_live_date
 
 
-def find_new_variance_issues(tasks, old_data_file='sheet_data_audit.json'):
+def find_new_variance_issues(tasks, old_data_file='sheet_data_audit.json',
+                             snapshot_file='variance_snapshot.json'):
     """Find tasks with new negative variance"""
     print("\n  VARIANCE CHANGE ANALYSIS:")
     print(f"  {'-'*60}")
 
-    # Load old data for comparison
+    # Load old data for comparison - prefer the slim variance snapshot
+    # (row_number + Variance only), fall back to the full data dump
     try:
-        with open(old_data_file, 'r') as f:
+        with open(snapshot_file, 'r') as f:
             old_tasks = json.load(f)
         old_by_row = {t['row_number']: t for t in old_tasks}
     except:
-        print("  [WARN] Could not load previous data for comparison")
-        return []
+        try:
+            with open(old_data_file, 'r') as f:
+                old_tasks = json.load(f)
+            old_by_row = {t['row_number']: t for t in old_tasks}
+        except:
+            print("  [WARN] Could not load previous data for comparison")
+            return []
 
     new_issues = []
 
@@ -339,6 +346,16 @@ def save_refreshed_data(tasks):
     with open(filename, 'w') as f:
         json.dump(tasks, f, indent=2, default=str)
     print(f"  [OK] Refreshed data saved to {filename}")
+
+    # Side snapshot with only the columns the variance comparison needs
+    snapshot = [
+        {'row_number': t['row_number'], 'Variance': t.get('Variance')}
+        for t in tasks
+    ]
+    with open('variance_snapshot.json', 'w') as f:
+        json.dump(snapshot, f)
+    print(f"  [OK] Variance snapshot saved to variance_snapshot.json")
+
     return filename
 
 
@@ -8,8 +8,14 @@ This script generates the corrected schedule and Smartsheet update payload.
 """
 
 import json
+import re
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 TARGET_GO_LIVE = datetime(2026, 1, 13)
@@ -19,6 +25,9 @@ BASELINE_SHIFT = 6  # Days from Jan 7 to Jan 13
 # IGT completion date (per 12/05 note: 2-3 more weeks from Dec 8)
 IGT_STAGING_COMPLETE = datetime(2025, 12, 23)
 
+# Row holding the IGT SIP Trunks blocker
+IGT_BLOCKER_ROW = 24
+
 # Holidays to skip
 HOLIDAYS = [
     datetime(2025, 12, 24),  # Christmas Eve
@@ -27,9 +36,47 @@ HOLIDAYS = [
     datetime(2026, 1, 1),    # New Year's Day
 ]
 
+# Holiday lookup by ordinal so add_work_days can use pure integer math
+HOLIDAY_ORDS = frozenset(h.toordinal() for h in HOLIDAYS)
+
+# SOW milestone ordinals for the critical-path Delta columns
+_SOW_ORD = {
+    'cognigy_staging': datetime(2025, 12, 8).toordinal(),
+    'fps_qa': datetime(2025, 12, 12).toordinal(),
+    'frontier_uat': datetime(2025, 12, 19).toordinal(),
+    'cab': datetime(2026, 1, 6).toordinal(),
+    'prod_deploy': datetime(2026, 1, 7).toordinal(),
+}
+
+# Predecessor patterns like "24FS", "24FS +1d", "24SS", etc.
+_PRED_RE = re.compile(r'(\d+)(FS|SS|FF|SF)?\s*([+-]\d+d)?')
+
+# Categorical codes for baseline_action so downstream passes can
+# partition on integer equality instead of substring scans
+ACTION_NONE = 0
+ACTION_SHIFT = 1
+ACTION_PROPORTIONAL = 2
+ACTION_KEEP = 3
+ACTION_REVIEW = 4
+
+# Correction fields included in corrections_jan13.json
+EXPORT_KEYS = (
+    'row_number', 'row_id', 'task_name', 'assigned_to', 'status',
+    'current_baseline_finish', 'new_baseline_finish',
+    'baseline_action', 'notes'
+)
+
+
+def _enc(o):
+    """JSON encoder hook - render datetimes as YYYY-MM-DD"""
+    return o.isoformat()[:10] if isinstance(o, datetime) else None
+
 
 def load_schedule():
     """Load current schedule data"""
+    if orjson is not None:
+        with open('sheet_data_audit.json', 'rb') as f:
+            return orjson.loads(f.read())
     with open('sheet_data_audit.json', 'r') as f:
         return json.load(f)
 
@@ -38,38 +85,70 @@ def parse_date(date_str):
     """Parse date string to datetime"""
     if not date_str:
         return None
+    date_str = str(date_str)
     try:
-        if 'T' in str(date_str):
-            return datetime.strptime(str(date_str).split('T')[0], '%Y-%m-%d')
-        return datetime.strptime(str(date_str), '%Y-%m-%d')
-    except:
+        # fromisoformat is C-implemented and handles both date and
+        # datetime shapes; keep only the date part to match old behavior
+        return datetime.fromisoformat(date_str[:10])
+    except ValueError:
         return None
 
 
+def _is_work_ord(day_ord):
+    """True if the ordinal day is a weekday and not a holiday"""
+    return (day_ord - 1) % 7 < 5 and day_ord not in HOLIDAY_ORDS
+
+
+def _add_work_days_ord(day_ord, days):
+    """Integer-only core of add_work_days (ordinal in, ordinal out)"""
+    # Jump whole weeks at once (5 working days == 7 calendar days), then
+    # re-credit any weekday holidays that fell inside the jumped span
+    weeks, remaining = divmod(days, 5)
+    if weeks:
+        jumped = day_ord + weeks * 7
+        remaining += sum(1 for h in HOLIDAY_ORDS
+                         if day_ord < h <= jumped and (h - 1) % 7 < 5)
+        day_ord = jumped
+
+    # Walk out the remainder one day at a time
+    while remaining > 0:
+        day_ord += 1
+        if _is_work_ord(day_ord):
+            remaining -= 1
+
+    # Land on a working day (week jumps preserve the weekday, so a
+    # weekend/holiday start can leave us on a non-working day)
+    while not _is_work_ord(day_ord):
+        day_ord -= 1
+
+    return day_ord
+
+
 def add_work_days(start_date, days):
     """Add working days, skipping weekends and holidays"""
-    current = start_date
-    remaining = days
-    while remaining > 0:
-        current += timedelta(days=1)
-        # Skip weekends
-        if current.weekday() >= 5:
-            continue
-        # Skip holidays
-        if current in HOLIDAYS:
-            continue
-        remaining -= 1
-    return current
+    if days <= 0:
+        return start_date
+    return datetime.fromordinal(_add_work_days_ord(start_date.toordinal(), days))
+
+
+def _iso(dt):
+    """Format a datetime as YYYY-MM-DD (None-safe, cheaper than strftime)"""
+    return dt.isoformat()[:10] if dt else None
 
 
 def parse_duration(dur_str):
     """Parse duration string like '5d' to integer days"""
     if not dur_str:
         return 1
-    try:
-        return int(str(dur_str).replace('d', ''))
-    except:
-        return 1
+    # Walk the digits directly - the column is always 'Nd' shaped, so
+    # skip the intermediate string and exception machinery
+    days = 0
+    for ch in str(dur_str):
+        if '0' <= ch <= '9':
+            days = days * 10 + (ord(ch) - 48)
+        elif days:
+            break
+    return days or 1
 
 
 def parse_predecessor(pred_str):
@@ -77,9 +156,7 @@ def parse_predecessor(pred_str):
     if not pred_str:
         return None
 
-    import re
-    # Match patterns like "24FS", "24FS +1d", "24SS", etc.
-    match = re.match(r'(\d+)(FS|SS|FF|SF)?\s*([+-]\d+d)?', pred_str.strip())
+    match = _PRED_RE.match(pred_str.strip())
     if match:
         row = int(match.group(1))
         link_type = match.group(2) or 'FS'
@@ -90,26 +167,99 @@ def parse_predecessor(pred_str):
     return None
 
 
+def _topological_rows(pred_of):
+    """Order rows with Kahn's algorithm over the predecessor DAG"""
+    children = defaultdict(list)
+    indegree = {row: 0 for row in pred_of}
+    for row, pred in pred_of.items():
+        if pred and pred['row'] in indegree:
+            children[pred['row']].append(row)
+            indegree[row] += 1
+
+    queue = deque(row for row, deg in indegree.items() if deg == 0)
+    order = []
+    while queue:
+        row = queue.popleft()
+        order.append(row)
+        for child in children[row]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+    return order
+
+
+def _propagate_igt_dates(pred_of, duration_by_row):
+    """Forward-pass new start/end dates through chains rooted at the IGT blocker"""
+    new_start = {}
+    new_end = {IGT_BLOCKER_ROW: IGT_STAGING_COMPLETE}
+
+    for row in _topological_rows(pred_of):
+        if row == IGT_BLOCKER_ROW:
+            continue
+        pred = pred_of.get(row)
+        if not pred or pred['row'] not in new_end:
+            continue
+        start = add_work_days(new_end[pred['row']], pred.get('lag', 0))
+        duration = duration_by_row.get(row, 1)
+        end = add_work_days(start, duration - 1) if duration > 1 else start
+        new_start[row] = start
+        new_end[row] = end
+
+    return new_start, new_end
+
+
+def _tasks_to_columns(tasks):
+    """Parse the date/duration columns once into parallel lists (SoA layout)"""
+    columns = {
+        'end': [], 'start': [],
+        'baseline_finish': [], 'baseline_start': [],
+        'duration': []
+    }
+    for t in tasks:
+        columns['end'].append(parse_date(t.get('End Date')))
+        columns['start'].append(parse_date(t.get('Start Date')))
+        columns['baseline_finish'].append(parse_date(t.get('Baseline Finish')))
+        columns['baseline_start'].append(parse_date(t.get('Baseline Start')))
+        columns['duration'].append(parse_duration(t.get('Duration')))
+    return columns
+
+
 def calculate_corrected_schedule(tasks):
     """Calculate the corrected schedule based on Jan 13 target and IGT completion"""
 
     # Build task lookup by row
     task_by_row = {t['row_number']: t for t in tasks}
 
+    # Parse all date/duration columns in one pass up front
+    columns = _tasks_to_columns(tasks)
+
+    # Parse every predecessor once, then classify IGT dependencies with
+    # exact row matches (a substring test would also hit e.g. row "241")
+    pred_of = {t['row_number']: parse_predecessor(t.get('Predecessors'))
+               for t in tasks}
+    igt_direct = frozenset(
+        r for r, p in pred_of.items() if p and p['row'] == IGT_BLOCKER_ROW)
+
+    # One topological forward pass gives every cascaded chain its new
+    # dates instead of recomputing each task from Dec 23 in isolation
+    duration_by_row = {t['row_number']: columns['duration'][i]
+                       for i, t in enumerate(tasks)}
+    new_start_by_row, new_end_by_row = _propagate_igt_dates(pred_of, duration_by_row)
+
     corrections = []
 
     # Process each task
-    for task in tasks:
+    for i, task in enumerate(tasks):
         row = task['row_number']
         name = task['Tasks']
         assigned = task.get('Assigned To', '')
         status = task.get('Status', '')
 
-        current_end = parse_date(task.get('End Date'))
-        current_start = parse_date(task.get('Start Date'))
-        current_baseline_finish = parse_date(task.get('Baseline Finish'))
-        current_baseline_start = parse_date(task.get('Baseline Start'))
-        duration = parse_duration(task.get('Duration'))
+        current_end = columns['end'][i]
+        current_start = columns['start'][i]
+        current_baseline_finish = columns['baseline_finish'][i]
+        current_baseline_start = columns['baseline_start'][i]
+        duration = columns['duration'][i]
         pred_str = task.get('Predecessors')
 
         correction = {
@@ -131,6 +281,7 @@ def calculate_corrected_schedule(tasks):
             'new_end_date': None,
             'new_start_date': None,
             'baseline_action': '',
+            'action_code': ACTION_NONE,
             'schedule_action': '',
             'notes': ''
         }
@@ -138,6 +289,7 @@ def calculate_corrected_schedule(tasks):
         # Skip completed tasks - no baseline change needed
         if status == 'Complete':
             correction['baseline_action'] = 'KEEP (Complete)'
+            correction['action_code'] = ACTION_KEEP
             correction['notes'] = 'Task already complete - no changes needed'
             corrections.append(correction)
             continue
@@ -150,6 +302,7 @@ def calculate_corrected_schedule(tasks):
                 # Task was at Jan 7 baseline - shift to Jan 13
                 correction['new_baseline_finish'] = TARGET_GO_LIVE
                 correction['baseline_action'] = 'SHIFT +6d (Jan 7 -> Jan 13)'
+                correction['action_code'] = ACTION_SHIFT
                 if current_baseline_start:
                     correction['new_baseline_start'] = current_baseline_start + timedelta(days=BASELINE_SHIFT)
 
@@ -158,76 +311,59 @@ def calculate_corrected_schedule(tasks):
                 new_baseline = TARGET_GO_LIVE - timedelta(days=baseline_delta)
                 correction['new_baseline_finish'] = new_baseline
                 correction['baseline_action'] = f'PROPORTIONAL SHIFT ({baseline_delta}d before target)'
+                correction['action_code'] = ACTION_PROPORTIONAL
                 if current_baseline_start:
                     correction['new_baseline_start'] = current_baseline_start + timedelta(days=BASELINE_SHIFT)
 
             else:
                 # Task was after Jan 7 - should not happen for baseline
                 correction['baseline_action'] = 'REVIEW - baseline after original target'
-
-        # Check if task depends on IGT Row 24 (the SIP trunks blocker)
-        if pred_str and '24' in pred_str:
-            pred = parse_predecessor(pred_str)
-            if pred and pred['row'] == 24:
-                # This task depends on IGT - recalculate from Dec 23
-                new_start = add_work_days(IGT_STAGING_COMPLETE, pred.get('lag', 0))
-                new_end = add_work_days(new_start, duration - 1) if duration > 1 else new_start
-
-                correction['new_start_date'] = new_start
-                correction['new_end_date'] = new_end
+                correction['action_code'] = ACTION_REVIEW
+
+        # Tasks in an IGT-blocked chain pick up their cascaded dates
+        if row in new_start_by_row:
+            pred = pred_of[row]
+            correction['new_start_date'] = new_start_by_row[row]
+            correction['new_end_date'] = new_end_by_row[row]
+            if row in igt_direct:
                 correction['schedule_action'] = f'RECALC from IGT Dec 23 + {pred.get("lag", 0)}d'
                 correction['notes'] = 'Blocked by IGT Row 24 (SIP Trunks)'
-
-        # Check if task depends on another task that depends on Row 24
-        elif pred_str:
-            pred = parse_predecessor(pred_str)
-            if pred:
-                pred_task = task_by_row.get(pred['row'])
-                if pred_task:
-                    pred_pred = pred_task.get('Predecessors', '')
-                    if '24' in str(pred_pred):
-                        # Indirect dependency on IGT
-                        correction['notes'] = f"Indirect IGT dependency via Row {pred['row']}"
+            else:
+                correction['schedule_action'] = f"RECALC cascade via Row {pred['row']}"
+                correction['notes'] = f"Indirect IGT dependency via Row {pred['row']}"
 
         corrections.append(correction)
 
     return corrections
 
 
-def generate_smartsheet_updates(corrections):
-    """Generate the Smartsheet API update payload"""
-
-    updates = []
-
-    for corr in corrections:
-        if corr['status'] == 'Complete':
-            continue
-
-        row_update = {
-            'id': corr['row_id'],
-            'cells': []
-        }
-
-        # Baseline Finish update
-        if corr['new_baseline_finish']:
-            row_update['cells'].append({
-                'columnId': 'BASELINE_FINISH_COLUMN_ID',  # Will need actual column ID
-                'value': corr['new_baseline_finish'].strftime('%Y-%m-%d'),
-                'field': 'Baseline Finish'
-            })
-
-        # Baseline Start update
-        if corr['new_baseline_start']:
-            row_update['cells'].append({
-                'columnId': 'BASELINE_START_COLUMN_ID',  # Will need actual column ID
-                'value': corr['new_baseline_start'].strftime('%Y-%m-%d'),
-                'field': 'Baseline Start'
-            })
+def _baseline_cells(corr):
+    """Build the cell payloads for a correction's baseline changes"""
+    cells = []
+    if corr['new_baseline_finish']:
+        cells.append({
+            'columnId': 'BASELINE_FINISH_COLUMN_ID',  # Will need actual column ID
+            'value': _iso(corr['new_baseline_finish']),
+            'field': 'Baseline Finish'
+        })
+    if corr['new_baseline_start']:
+        cells.append({
+            'columnId': 'BASELINE_START_COLUMN_ID',  # Will need actual column ID
+            'value': _iso(corr['new_baseline_start']),
+            'field': 'Baseline Start'
+        })
+    return cells
 
-        if row_update['cells']:
-            updates.append(row_update)
 
-    return updates
+def generate_smartsheet_updates(corrections):
+    """Generate the Smartsheet API update payload"""
+    # Filter first so complete/unchanged rows never allocate a payload
+    return [
+        {'id': corr['row_id'], 'cells': _baseline_cells(corr)}
+        for corr in corrections
+        if corr['status'] != 'Complete'
+        and (corr['new_baseline_finish'] or corr['new_baseline_start'])
+    ]
 
 
 def calculate_critical_path_dates():
@@ -264,30 +400,30 @@ def calculate_critical_path_dates():
     # Cognigy Staging Phase 2 - starts after IGT + 1d
     cognigy_staging_start = add_work_days(igt_complete, 1)
     cognigy_staging_end = add_work_days(cognigy_staging_start, 2)  # 3d duration
-    print(f"  {'Cognigy Staging Phase 2':<40} | {'Dec 08':^12} | {cognigy_staging_end.strftime('%b %d'):^12} | {'+' + str((cognigy_staging_end - datetime(2025, 12, 8)).days) + 'd':^8}")
+    print(f"  {'Cognigy Staging Phase 2':<40} | {'Dec 08':^12} | {cognigy_staging_end.strftime('%b %d'):^12} | {'+' + str(cognigy_staging_end.toordinal() - _SOW_ORD['cognigy_staging']) + 'd':^8}")
 
     # FPS QA Testing - starts after IGT + 1d, 5 working days
     fps_qa_start = add_work_days(igt_complete, 1)
     fps_qa_end = add_work_days(fps_qa_start, 4)  # 5d including start
-    print(f"  {'FPS QA Testing':<40} | {'Dec 12':^12} | {fps_qa_end.strftime('%b %d'):^12} | {'+' + str((fps_qa_end - datetime(2025, 12, 12)).days) + 'd':^8}")
+    print(f"  {'FPS QA Testing':<40} | {'Dec 12':^12} | {fps_qa_end.strftime('%b %d'):^12} | {'+' + str(fps_qa_end.toordinal() - _SOW_ORD['fps_qa']) + 'd':^8}")
 
     # Frontier UAT - starts after FPS QA + 1d, 5 working days
     frontier_uat_start = add_work_days(fps_qa_end, 1)
     frontier_uat_end = add_work_days(frontier_uat_start, 4)  # 5d including start
-    print(f"  {'Frontier UAT Testing':<40} | {'Dec 19':^12} | {frontier_uat_end.strftime('%b %d'):^12} | {'+' + str((frontier_uat_end - datetime(2025, 12, 19)).days) + 'd':^8}")
+    print(f"  {'Frontier UAT Testing':<40} | {'Dec 19':^12} | {frontier_uat_end.strftime('%b %d'):^12} | {'+' + str(frontier_uat_end.toordinal() - _SOW_ORD['frontier_uat']) + 'd':^8}")
 
     # UAT Approval - 1 day after UAT
     uat_approval = add_work_days(frontier_uat_end, 1)
-    print(f"  {'Frontier UAT Approval':<40} | {'Dec 19':^12} | {uat_approval.strftime('%b %d'):^12} | {'+' + str((uat_approval - datetime(2025, 12, 19)).days) + 'd':^8}")
+    print(f"  {'Frontier UAT Approval':<40} | {'Dec 19':^12} | {uat_approval.strftime('%b %d'):^12} | {'+' + str(uat_approval.toordinal() - _SOW_ORD['frontier_uat']) + 'd':^8}")
 
     # CAB Approval - after UAT Approval + 1d, 2 working days
     cab_start = add_work_days(uat_approval, 1)
     cab_end = add_work_days(cab_start, 1)  # 2d duration
-    print(f"  {'CAB Approval':<40} | {'Jan 06':^12} | {cab_end.strftime('%b %d'):^12} | {'+' + str((cab_end - datetime(2026, 1, 6)).days) + 'd':^8}")
+    print(f"  {'CAB Approval':<40} | {'Jan 06':^12} | {cab_end.strftime('%b %d'):^12} | {'+' + str(cab_end.toordinal() - _SOW_ORD['cab']) + 'd':^8}")
 
     # Production Deployment - after CAB + 1d
     prod_deploy = add_work_days(cab_end, 1)
-    print(f"  {'Production Deployment':<40} | {'Jan 07':^12} | {prod_deploy.strftime('%b %d'):^12} | {'+' + str((prod_deploy - datetime(2026, 1, 7)).days) + 'd':^8}")
+    print(f"  {'Production Deployment':<40} | {'Jan 07':^12} | {prod_deploy.strftime('%b %d'):^12} | {'+' + str(prod_deploy.toordinal() - _SOW_ORD['prod_deploy']) + 'd':^8}")
 
     # Gap analysis
     print(f"\n  [GAP ANALYSIS]")
@@ -313,10 +449,18 @@ def generate_baseline_update_report(corrections):
     print("  BASELINE UPDATE REPORT - Target: Jan 13, 2026")
     print("=" * 90)
 
-    # Group by update type
-    shift_to_jan13 = [c for c in corrections if 'Jan 7 -> Jan 13' in c.get('baseline_action', '')]
-    proportional = [c for c in corrections if 'PROPORTIONAL' in c.get('baseline_action', '')]
-    keep = [c for c in corrections if 'KEEP' in c.get('baseline_action', '')]
+    # Group by update type in one pass over corrections
+    shift_to_jan13, proportional, keep, igt_blocked = [], [], [], []
+    for c in corrections:
+        code = c.get('action_code', ACTION_NONE)
+        if code == ACTION_SHIFT:
+            shift_to_jan13.append(c)
+        elif code == ACTION_PROPORTIONAL:
+            proportional.append(c)
+        elif code == ACTION_KEEP:
+            keep.append(c)
+        if 'IGT' in c.get('notes', ''):
+            igt_blocked.append(c)
 
     print(f"\n  Summary:")
     print(f"    Tasks to shift to Jan 13 baseline:  {len(shift_to_jan13)}")
@@ -329,12 +473,11 @@ def generate_baseline_update_report(corrections):
         print(f"  {'-'*4}-+-{'-'*45}-+-{'-'*12}-+-{'-'*12}")
 
         for c in shift_to_jan13:
-            curr = c['current_baseline_finish'].strftime('%Y-%m-%d') if c['current_baseline_finish'] else 'N/A'
-            new = c['new_baseline_finish'].strftime('%Y-%m-%d') if c['new_baseline_finish'] else 'N/A'
+            curr = _iso(c['current_baseline_finish']) or 'N/A'
+            new = _iso(c['new_baseline_finish']) or 'N/A'
             print(f"  {c['row_number']:>4} | {c['task_name'][:45]:<45} | {curr:^12} | {new:^12}")
 
     # Show IGT-blocked tasks
-    igt_blocked = [c for c in corrections if 'IGT' in c.get('notes', '')]
     if igt_blocked:
         print(f"\n  TASKS BLOCKED BY IGT (will cascade from Dec 23):")
         print(f"  {'Row':>4} | {'Task':<45} | {'Assigned':^10}")
@@ -351,7 +494,11 @@ def generate_smartsheet_api_script(corrections, tasks):
     # First, get column IDs from existing data structure
     # We'll create a script that fetches them first
 
-    script = '''"""
+    # Collect the script in parts and join once at the end - repeated
+    # string += is quadratic in the number of rows
+    parts = []
+
+    parts.append('''"""
 Smartsheet Schedule Update Script
 Generated: {timestamp}
 Target: Jan 13, 2026 Baseline
@@ -402,7 +549,7 @@ def update_baselines(column_map):
 
     # Baseline updates for Jan 13 target
     baseline_updates = [
-'''.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+'''.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
 
     # Add each update
     for c in corrections:
@@ -411,18 +558,18 @@ def update_baselines(column_map):
         if not c.get('new_baseline_finish'):
             continue
 
-        new_finish = c['new_baseline_finish'].strftime('%Y-%m-%d')
-        new_start = c['new_baseline_start'].strftime('%Y-%m-%d') if c.get('new_baseline_start') else None
+        new_finish = _iso(c['new_baseline_finish'])
+        new_start = _iso(c.get('new_baseline_start'))
 
-        script += f'''        # Row {c['row_number']}: {c['task_name'][:40]}
+        parts.append(f'''        # Row {c['row_number']}: {c['task_name'][:40]}
         {{
             'row_id': {c['row_id']},
             'baseline_finish': '{new_finish}',
             'baseline_start': {f"'{new_start}'" if new_start else 'None'},
         }},
-'''
+''')
 
-    script += '''    ]
+    parts.append('''    ]
 
     # Build row updates
     for update in baseline_updates:
@@ -477,9 +624,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-'''
+''')
 
-    return script
+    return ''.join(parts)
 
 
 def print_summary_report(corrections, projected_date, gap):
@@ -574,24 +721,12 @@ def main():
     # Print summary
     print_summary_report(corrections, projected_date, gap)
 
-    # Save corrections to JSON for Excel generation
-    corrections_export = []
-    for c in corrections:
-        export = {
-            'row_number': c['row_number'],
-            'row_id': c['row_id'],
-            'task_name': c['task_name'],
-            'assigned_to': c['assigned_to'],
-            'status': c['status'],
-            'current_baseline_finish': c['current_baseline_finish'].strftime('%Y-%m-%d') if c['current_baseline_finish'] else None,
-            'new_baseline_finish': c['new_baseline_finish'].strftime('%Y-%m-%d') if c.get('new_baseline_finish') else None,
-            'baseline_action': c['baseline_action'],
-            'notes': c['notes']
-        }
-        corrections_export.append(export)
-
+    # Save corrections to JSON for Excel generation - project each dict
+    # down to the export keys and let the encoder stringify datetimes
     with open('corrections_jan13.json', 'w') as f:
-        json.dump(corrections_export, f, indent=2)
+        json.dump(
+            [{k: c.get(k) for k in EXPORT_KEYS} for c in corrections],
+            f, indent=2, default=_enc)
     print(f"  [OK] Generated corrections_jan13.json")
 
     print("\n" + "=" * 90)
@@ -4,48 +4,137 @@ Comprehensive analysis of task hierarchy, predecessors, durations, and baselines
 Target: Identify ALL issues for cleanup to meet Jan 13, 2026 go-live
 """
 
+import argparse
+import functools
+import heapq
 import json
+import sys
+import os
+import pickle
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from itertools import chain
+from collections import Counter, defaultdict, namedtuple
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_data():
-    """Load current schedule data"""
-    with open('sheet_data_audit.json', 'r') as f:
-        return json.load(f)
+DATA_FILE = 'sheet_data_audit.json'
+DATA_CACHE_FILE = 'sheet_data_audit.cache.pkl'
+
+# Compiled once - these run per task per audit pass
+_DUR_RE = re.compile(r'(\d+)d')
+_PRED_RE = re.compile(r'(\d+)(FS|SS|FF|SF)?\s*([+-]\d+d)?')
+_TOKEN_RE = re.compile(r'[^a-z0-9]+')
+
+# Columns with a small repeating vocabulary - interned at load so every
+# task shares one str object per value and == hits the pointer fast path
+_VOCAB_COLS = ('Assigned To', 'Status', 'Health')
+_DONE_OR_ACTIVE = frozenset({sys.intern('Complete'), sys.intern('In Progress')})
+
+
+def _intern_vocab(tasks):
+    """Deduplicate vocabulary-column strings across tasks via sys.intern"""
+    interned = {}
+    for task in tasks:
+        for col in _VOCAB_COLS:
+            value = task.get(col)
+            if value is not None:
+                task[col] = interned.setdefault(value, sys.intern(value))
+    return tasks
+
+
+def load_data(use_cache=True, cache_dir=None):
+    """Load current schedule data (pickle-cached keyed on the JSON's mtime+size)"""
+    cache_file = DATA_CACHE_FILE
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, DATA_CACHE_FILE)
+    st = os.stat(DATA_FILE)
+    cache_key = (st.st_mtime_ns, st.st_size)
+
+    if use_cache:
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_key, tasks = pickle.load(f)
+            if cached_key == cache_key:
+                return _intern_vocab(tasks)
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+            pass
+
+    if orjson is not None:
+        with open(DATA_FILE, 'rb') as f:
+            tasks = orjson.loads(f.read())
+    else:
+        with open(DATA_FILE, 'r') as f:
+            tasks = json.load(f)
+
+    if use_cache:
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump((cache_key, tasks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Cache is best-effort only
+
+    return _intern_vocab(tasks)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(date_str):
+    """Cached core of parse_date (str input only)"""
+    # The data is uniformly 'YYYY-MM-DD' (optionally 'T...' suffixed),
+    # so slice the fields directly instead of going through strptime
+    try:
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except (ValueError, IndexError):
+        return None
 
 
 def parse_date(date_str):
     """Parse date string to datetime"""
     if not date_str:
         return None
-    try:
-        if 'T' in str(date_str):
-            return datetime.strptime(str(date_str).split('T')[0], '%Y-%m-%d')
-        return datetime.strptime(str(date_str), '%Y-%m-%d')
-    except:
-        return None
+    # The same handful of strings are re-parsed across all six audit
+    # passes, so everything after the first call is a cache hit
+    return _parse_date_str(str(date_str))
 
 
-def parse_duration(dur_str):
-    """Parse duration string like '3d' to integer days"""
-    if not dur_str:
-        return None
-    match = re.match(r'(\d+)d', str(dur_str))
+def count_business_days(start, end):
+    """Count weekdays between start and end inclusive (closed-form, no loop)"""
+    total = (end - start).days + 1
+    if total <= 0:
+        return 0
+    full_weeks, rem = divmod(total, 7)
+    start_weekday = start.weekday()
+    return full_weeks * 5 + sum(1 for i in range(rem) if (start_weekday + i) % 7 < 5)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_duration_str(dur_str):
+    """Cached core of parse_duration (str input only)"""
+    match = _DUR_RE.match(dur_str)
     if match:
         return int(match.group(1))
     return None
 
 
-def parse_predecessor(pred_str):
-    """Parse predecessor string like '24FS +1d' into components"""
-    if not pred_str:
+def parse_duration(dur_str):
+    """Parse duration string like '3d' to integer days"""
+    if not dur_str:
         return None
+    return _parse_duration_str(dur_str if isinstance(dur_str, str) else str(dur_str))
+
 
+@functools.lru_cache(maxsize=4096)
+def _parse_predecessor_str(pred_str):
+    """Cached core of parse_predecessor (str input only)"""
     # Pattern: row_number + relationship_type + optional_lag
     # Examples: "24FS", "24FS +1d", "5FS", "3FS"
-    match = re.match(r'(\d+)(FS|SS|FF|SF)?\s*([+-]\d+d)?', str(pred_str))
+    match = _PRED_RE.match(pred_str)
     if match:
         return {
             'row': int(match.group(1)),
@@ -55,37 +144,169 @@ def parse_predecessor(pred_str):
     return None
 
 
-def audit_hierarchy(tasks):
-    """Audit task hierarchy and groupings"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 1: TASK HIERARCHY AND GROUPINGS")
-    print("=" * 80)
+def parse_predecessor(pred_str):
+    """Parse predecessor string like '24FS +1d' into components"""
+    if not pred_str:
+        return None
+    # Note: cache hits share the returned dict - callers only read it
+    return _parse_predecessor_str(pred_str if isinstance(pred_str, str) else str(pred_str))
 
-    issues = []
 
-    # Build parent-child relationships
-    parents = {}  # row_id -> task
-    children = defaultdict(list)  # parent_id -> [child tasks]
+# Issue records - fixed-slot tuples are smaller and faster to access
+# than the per-issue dicts they replace
+Issue = namedtuple('Issue', 'type row task issue severity')
+DurIssue = namedtuple('DurIssue', 'type row task stated actual_cal actual_biz issue severity')
+
+
+class Out:
+    """Buffered audit output - collect lines, hit stdout once per audit"""
+
+    def __init__(self):
+        self.buf = []
 
+    def p(self, *args):
+        self.buf.append(' '.join(map(str, args)) if args else '')
+
+    def text(self):
+        return '\n'.join(self.buf)
+
+    def flush(self):
+        sys.stdout.write('\n'.join(self.buf) + '\n')
+        self.buf.clear()
+
+
+@dataclass
+class Indexes:
+    """Shared lookups built once per run and passed to every audit"""
+    task_by_row: dict = field(default_factory=dict)     # row_number -> task
+    parents: dict = field(default_factory=dict)         # row_id -> task
+    children: dict = field(default_factory=dict)        # parent_id -> [tasks]
+    pred_of: dict = field(default_factory=dict)         # row_number -> parsed predecessor
+    children_with_pred_count: dict = field(default_factory=dict)  # parent_id -> count
+    start_dates: dict = field(default_factory=dict)     # row_number -> datetime | None
+    end_dates: dict = field(default_factory=dict)       # row_number -> datetime | None
+    baseline_finishes: dict = field(default_factory=dict)
+
+
+def build_indexes(tasks):
+    """Build all shared indexes in a single pass over tasks"""
+    idx = Indexes(children=defaultdict(list),
+                  children_with_pred_count=defaultdict(int))
     for task in tasks:
-        parents[task['row_id']] = task
-        if task.get('parent_id'):
-            children[task['parent_id']].append(task)
+        row = task['row_number']
+        idx.task_by_row[row] = task
+        idx.parents[task['row_id']] = task
+        parent_id = task.get('parent_id')
+        if parent_id:
+            idx.children[parent_id].append(task)
+            if task.get('Predecessors'):
+                idx.children_with_pred_count[parent_id] += 1
+        idx.pred_of[row] = parse_predecessor(task.get('Predecessors'))
+        idx.start_dates[row] = parse_date(task.get('Start Date'))
+        idx.end_dates[row] = parse_date(task.get('End Date'))
+        idx.baseline_finishes[row] = parse_date(task.get('Baseline Finish'))
+    return idx
+
+
+def find_dependency_cycles(tasks):
+    """Find predecessor cycles with an iterative Tarjan SCC pass
+
+    Returns a list of row-number groups, one per strongly connected
+    component of size >= 2 (i.e. a real dependency cycle).
+    """
+    succ = defaultdict(list)
+    rows = []
+    for t in tasks:
+        row = t['row_number']
+        rows.append(row)
+        pred = parse_predecessor(t.get('Predecessors'))
+        if pred:
+            succ[pred['row']].append(row)
+
+    index_of = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    next_index = 0
+    cycles = []
+
+    for root in rows:
+        if root in index_of:
+            continue
+        # Explicit work stack - recursion depth would track chain length
+        work = [(root, 0)]
+        while work:
+            node, child_i = work.pop()
+            if child_i == 0:
+                index_of[node] = lowlink[node] = next_index
+                next_index += 1
+                stack.append(node)
+                on_stack.add(node)
+
+            descended = False
+            children = succ.get(node, ())
+            for j in range(child_i, len(children)):
+                child = children[j]
+                if child not in index_of:
+                    work.append((node, j + 1))
+                    work.append((child, 0))
+                    descended = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+            if descended:
+                continue
+
+            if lowlink[node] == index_of[node]:
+                scc = []
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    scc.append(w)
+                    if w == node:
+                        break
+                if len(scc) > 1:
+                    cycles.append(scc)
+
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return cycles
+
+
+def audit_hierarchy(tasks, idx):
+    """Audit task hierarchy and groupings"""
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 1: TASK HIERARCHY AND GROUPINGS")
+    out.p("=" * 80)
+
+    issues = []
+
+    # Parent-child relationships come prebuilt on the shared indexes
+    parents = idx.parents
+    children = idx.children
 
     # Find top-level phases
     phases = [t for t in tasks if t.get('parent_id') is None]
-    print(f"\n  Top-Level Phases ({len(phases)}):")
+    out.p(f"\n  Top-Level Phases ({len(phases)}):")
     for phase in phases:
         child_count = len(children.get(phase['row_id'], []))
-        print(f"    Row {phase['row_number']:2}: {phase['Tasks']} ({child_count} children)")
+        out.p(f"    Row {phase['row_number']:2}: {phase['Tasks']} ({child_count} children)")
 
     # Check for orphaned tasks (no parent but should have one)
-    print(f"\n  Hierarchy Issues:")
+    out.p(f"\n  Hierarchy Issues:")
 
-    # Check each task's logical grouping
+    # Single pass: logical-grouping checks for child tasks, empty-summary
+    # detection for top-level ones - each task dict is walked exactly once
     for task in tasks:
+        # Bind the hot fields once per task - LOAD_FAST beats repeated
+        # dict lookups, and .lower() runs once instead of per check
+        row_no = task['row_number']
+        task_title = task['Tasks']
+        task_name = task_title.lower()
         parent_id = task.get('parent_id')
-        task_name = task['Tasks'].lower()
         assigned = task.get('Assigned To', '')
 
         if parent_id:
@@ -93,161 +314,122 @@ def audit_hierarchy(tasks):
             if parent:
                 parent_name = parent['Tasks'].lower()
                 parent_assigned = parent.get('Assigned To', '')
+                parent_row = parent['row_number']
 
                 # Check if child task vendor matches parent expectation
                 if parent_assigned and assigned and parent_assigned != assigned:
-                    issues.append({
-                        'type': 'VENDOR_MISMATCH',
-                        'row': task['row_number'],
-                        'task': task['Tasks'],
-                        'issue': f"Assigned to {assigned} but parent (Row {parent['row_number']}) is {parent_assigned}",
-                        'severity': 'WARN'
-                    })
+                    issues.append(Issue(
+                        'VENDOR_MISMATCH', row_no, task_title,
+                        f"Assigned to {assigned} but parent (Row {parent_row}) is {parent_assigned}", 'WARN'))
 
                 # Check for misplaced tasks (e.g., QA task under Development)
                 if 'qa' in task_name or 'test' in task_name:
                     if 'development' in parent_name and 'qa' not in parent_name:
-                        issues.append({
-                            'type': 'MISPLACED_TASK',
-                            'row': task['row_number'],
-                            'task': task['Tasks'],
-                            'issue': f"QA/Test task under Development phase (Row {parent['row_number']})",
-                            'severity': 'WARN'
-                        })
-
-                if 'production' in task_name.lower():
+                        issues.append(Issue(
+                            'MISPLACED_TASK', row_no, task_title,
+                            f"QA/Test task under Development phase (Row {parent_row})", 'WARN'))
+
+                if 'production' in task_name:
                     if 'staging' in parent_name:
-                        issues.append({
-                            'type': 'MISPLACED_TASK',
-                            'row': task['row_number'],
-                            'task': task['Tasks'],
-                            'issue': f"Production task under Staging parent (Row {parent['row_number']})",
-                            'severity': 'ERROR'
-                        })
-
-    # Check for summary tasks without children
-    for task in tasks:
-        if task.get('parent_id') is None:  # Top-level
-            child_list = children.get(task['row_id'], [])
-            if len(child_list) == 0 and task['row_number'] > 1:
-                issues.append({
-                    'type': 'EMPTY_SUMMARY',
-                    'row': task['row_number'],
-                    'task': task['Tasks'],
-                    'issue': 'Summary task has no children',
-                    'severity': 'WARN'
-                })
+                        issues.append(Issue(
+                            'MISPLACED_TASK', row_no, task_title,
+                            f"Production task under Staging parent (Row {parent_row})", 'ERROR'))
+        else:
+            # Top-level: flag summary tasks without children
+            if not children.get(task['row_id']) and row_no > 1:
+                issues.append(Issue(
+                    'EMPTY_SUMMARY', row_no, task_title,
+                    'Summary task has no children', 'WARN'))
 
     if issues:
-        print(f"\n  Found {len(issues)} hierarchy issues:")
+        out.p(f"\n  Found {len(issues)} hierarchy issues:")
         for issue in issues:
-            print(f"    [{issue['severity']:5}] Row {issue['row']:2}: {issue['type']}")
-            print(f"           {issue['issue']}")
+            out.p(f"    [{issue.severity:5}] Row {issue.row:2}: {issue.type}")
+            out.p(f"           {issue.issue}")
     else:
-        print("    No hierarchy issues found")
+        out.p("    No hierarchy issues found")
 
-    return issues
+    return issues, out.text()
 
 
-def audit_predecessors(tasks):
+def audit_predecessors(tasks, idx):
     """Audit predecessor relationships"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 2: PREDECESSOR RELATIONSHIPS")
-    print("=" * 80)
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 2: PREDECESSOR RELATIONSHIPS")
+    out.p("=" * 80)
 
     issues = []
-    task_by_row = {t['row_number']: t for t in tasks}
-
-    # Count predecessor references
-    pred_counts = defaultdict(int)
+    task_by_row = idx.task_by_row
 
-    for task in tasks:
-        pred_str = task.get('Predecessors')
-        if pred_str:
-            pred = parse_predecessor(pred_str)
-            if pred:
-                pred_counts[pred['row']] += 1
+    # Count predecessor references in one C-level pass
+    pred_counts = Counter(pred['row'] for pred in idx.pred_of.values() if pred)
 
-    print(f"\n  Most Referenced Predecessors (blocking others):")
-    for row, count in sorted(pred_counts.items(), key=lambda x: -x[1])[:10]:
+    out.p(f"\n  Most Referenced Predecessors (blocking others):")
+    for row, count in pred_counts.most_common(10):
         if row in task_by_row:
             t = task_by_row[row]
             status = t.get('Status', 'N/A')
             health = t.get('Health', 'N/A')
-            print(f"    Row {row:2}: Blocks {count:2} tasks | {status:12} | {health:6} | {t['Tasks'][:40]}")
+            out.p(f"    Row {row:2}: Blocks {count:2} tasks | {status:12} | {health:6} | {t['Tasks'][:40]}")
 
-    print(f"\n  Predecessor Issues:")
+    out.p(f"\n  Predecessor Issues:")
 
     for task in tasks:
+        # Local-bind the per-task fields used repeatedly below
+        row_no = task['row_number']
+        task_title = task['Tasks']
+        status = task.get('Status')
         pred_str = task.get('Predecessors')
+
         if not pred_str:
             # Check if task should have a predecessor
-            if task.get('Status') != 'Complete' and task.get('parent_id'):
+            if status != 'Complete' and task.get('parent_id'):
                 # Non-complete tasks under a parent might need predecessors
                 pass  # Not necessarily an issue
             continue
 
-        pred = parse_predecessor(pred_str)
+        pred = idx.pred_of[row_no]
         if not pred:
-            issues.append({
-                'type': 'INVALID_PREDECESSOR',
-                'row': task['row_number'],
-                'task': task['Tasks'],
-                'issue': f"Cannot parse predecessor: '{pred_str}'",
-                'severity': 'ERROR'
-            })
+            issues.append(Issue(
+                'INVALID_PREDECESSOR', row_no, task_title,
+                f"Cannot parse predecessor: '{pred_str}'", 'ERROR'))
             continue
 
         pred_row = pred['row']
 
         # Check if predecessor exists
         if pred_row not in task_by_row:
-            issues.append({
-                'type': 'MISSING_PREDECESSOR',
-                'row': task['row_number'],
-                'task': task['Tasks'],
-                'issue': f"Predecessor Row {pred_row} does not exist",
-                'severity': 'ERROR'
-            })
+            issues.append(Issue(
+                'MISSING_PREDECESSOR', row_no, task_title,
+                f"Predecessor Row {pred_row} does not exist", 'ERROR'))
             continue
 
         pred_task = task_by_row[pred_row]
 
         # Check for self-reference
-        if pred_row == task['row_number']:
-            issues.append({
-                'type': 'SELF_REFERENCE',
-                'row': task['row_number'],
-                'task': task['Tasks'],
-                'issue': 'Task references itself as predecessor',
-                'severity': 'ERROR'
-            })
+        if pred_row == row_no:
+            issues.append(Issue(
+                'SELF_REFERENCE', row_no, task_title,
+                'Task references itself as predecessor', 'ERROR'))
             continue
 
         # Check date logic (successor should start after predecessor ends)
-        task_start = parse_date(task.get('Start Date'))
-        pred_end = parse_date(pred_task.get('End Date'))
+        task_start = idx.start_dates[row_no]
+        pred_end = idx.end_dates.get(pred_row)
 
         if task_start and pred_end:
             if pred['type'] == 'FS' and task_start < pred_end:
                 # This might be okay with lag, but flag for review
-                issues.append({
-                    'type': 'DATE_OVERLAP',
-                    'row': task['row_number'],
-                    'task': task['Tasks'],
-                    'issue': f"Starts {task_start.strftime('%Y-%m-%d')} before predecessor Row {pred_row} ends {pred_end.strftime('%Y-%m-%d')}",
-                    'severity': 'WARN'
-                })
+                issues.append(Issue(
+                    'DATE_OVERLAP', row_no, task_title,
+                    f"Starts {task_start.strftime('%Y-%m-%d')} before predecessor Row {pred_row} ends {pred_end.strftime('%Y-%m-%d')}", 'WARN'))
 
         # Check if predecessor is complete but successor not started
-        if pred_task.get('Status') == 'Complete' and task.get('Status') == 'Not Started':
-            issues.append({
-                'type': 'BLOCKED_BY_COMPLETE',
-                'row': task['row_number'],
-                'task': task['Tasks'],
-                'issue': f"Not started, but predecessor Row {pred_row} is Complete",
-                'severity': 'INFO'
-            })
+        if pred_task.get('Status') == 'Complete' and status == 'Not Started':
+            issues.append(Issue(
+                'BLOCKED_BY_COMPLETE', row_no, task_title,
+                f"Not started, but predecessor Row {pred_row} is Complete", 'INFO'))
 
         # Check vendor dependency logic
         task_vendor = task.get('Assigned To')
@@ -257,103 +439,100 @@ def audit_predecessors(tasks):
             # Cross-vendor dependency - flag for review
             pass  # This is normal, not an issue
 
+    # Cycle detection across the whole predecessor graph - the
+    # self-reference check above only catches single-row loops
+    for cycle in find_dependency_cycles(tasks):
+        cycle_rows = sorted(cycle)
+        first_task = task_by_row.get(cycle_rows[0], {})
+        issues.append(Issue(
+            'CYCLIC_DEPENDENCY', cycle_rows[0], first_task.get('Tasks', ''),
+            f"Dependency cycle through rows {cycle_rows}", 'ERROR'))
+
     # Check for potential missing predecessors
-    print(f"\n  Tasks Without Predecessors (potential issues):")
+    out.p(f"\n  Tasks Without Predecessors (potential issues):")
     no_pred_issues = []
     for task in tasks:
         if not task.get('Predecessors') and task.get('parent_id'):
             status = task.get('Status', '')
-            if status not in ['Complete', 'In Progress']:
-                # Check if siblings have predecessors
+            if status not in _DONE_OR_ACTIVE:
+                # Sibling groups come prebuilt on the shared indexes
                 parent_id = task.get('parent_id')
-                siblings = [t for t in tasks if t.get('parent_id') == parent_id]
-                siblings_with_pred = [s for s in siblings if s.get('Predecessors')]
-
-                if len(siblings_with_pred) > 0 and len(siblings_with_pred) < len(siblings):
-                    no_pred_issues.append({
-                        'type': 'MISSING_PREDECESSOR',
-                        'row': task['row_number'],
-                        'task': task['Tasks'],
-                        'issue': f"No predecessor but {len(siblings_with_pred)}/{len(siblings)} siblings have predecessors",
-                        'severity': 'WARN'
-                    })
+                siblings = idx.children[parent_id]
+                with_pred = idx.children_with_pred_count[parent_id]
+
+                if 0 < with_pred < len(siblings):
+                    no_pred_issues.append(Issue(
+                        'MISSING_PREDECESSOR', task['row_number'], task['Tasks'],
+                        f"No predecessor but {with_pred}/{len(siblings)} siblings have predecessors", 'WARN'))
 
     issues.extend(no_pred_issues)
 
     if issues:
-        print(f"\n  Found {len(issues)} predecessor issues:")
-        for issue in sorted(issues, key=lambda x: (x['severity'], x['row'])):
-            print(f"    [{issue['severity']:5}] Row {issue['row']:2}: {issue['type']}")
-            print(f"           {issue['issue']}")
+        out.p(f"\n  Found {len(issues)} predecessor issues:")
+        for issue in sorted(issues, key=lambda x: (x.severity, x.row)):
+            out.p(f"    [{issue.severity:5}] Row {issue.row:2}: {issue.type}")
+            out.p(f"           {issue.issue}")
 
-    return issues
+    return issues, out.text()
 
 
-def audit_durations(tasks):
+def audit_durations(tasks, idx):
     """Audit durations vs actual date spans"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 3: DURATION VALIDATION")
-    print("=" * 80)
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 3: DURATION VALIDATION")
+    out.p("=" * 80)
 
     issues = []
 
-    print(f"\n  Duration Mismatches:")
+    out.p(f"\n  Duration Mismatches:")
 
-    for task in tasks:
-        dur_str = task.get('Duration')
-        start = parse_date(task.get('Start Date'))
-        end = parse_date(task.get('End Date'))
+    # Durations are only needed here; dates come pre-parsed on idx
+    stated_durs = [parse_duration(t.get('Duration')) for t in tasks]
 
-        if not dur_str or not start or not end:
-            continue
+    for i, task in enumerate(tasks):
+        row = task['row_number']
+        stated_dur = stated_durs[i]
+        start = idx.start_dates[row]
+        end = idx.end_dates[row]
 
-        stated_dur = parse_duration(dur_str)
-        if stated_dur is None:
+        if stated_dur is None or not start or not end:
             continue
 
         # Calculate actual calendar days
         actual_days = (end - start).days + 1  # Inclusive
 
         # Calculate business days (rough estimate, excluding weekends)
-        business_days = 0
-        current = start
-        while current <= end:
-            if current.weekday() < 5:  # Monday = 0, Friday = 4
-                business_days += 1
-            current += timedelta(days=1)
+        business_days = count_business_days(start, end)
 
         # Check for significant mismatches
         # Smartsheet durations are typically business days
         if abs(stated_dur - business_days) > 2:
-            issues.append({
-                'type': 'DURATION_MISMATCH',
-                'row': task['row_number'],
-                'task': task['Tasks'],
-                'stated': stated_dur,
-                'actual_cal': actual_days,
-                'actual_biz': business_days,
-                'issue': f"Stated {stated_dur}d but spans {actual_days} calendar days ({business_days} business days)",
-                'severity': 'WARN'
-            })
+            issues.append(DurIssue(
+                'DURATION_MISMATCH', task['row_number'], task['Tasks'],
+                stated_dur, actual_days, business_days,
+                f"Stated {stated_dur}d but spans {actual_days} calendar days ({business_days} business days)",
+                'WARN'))
 
     if issues:
-        print(f"\n  Found {len(issues)} duration issues:")
+        out.p(f"\n  Found {len(issues)} duration issues:")
         for issue in issues[:15]:  # Show first 15
-            print(f"    Row {issue['row']:2}: {issue['task'][:40]}")
-            print(f"           Stated: {issue['stated']}d | Calendar: {issue['actual_cal']}d | Business: {issue['actual_biz']}d")
+            out.p(f"    Row {issue.row:2}: {issue.task[:40]}")
+            out.p(f"           Stated: {issue.stated}d | Calendar: {issue.actual_cal}d | Business: {issue.actual_biz}d")
         if len(issues) > 15:
-            print(f"    ... and {len(issues) - 15} more")
+            out.p(f"    ... and {len(issues) - 15} more")
     else:
-        print("    No significant duration mismatches found")
+        out.p("    No significant duration mismatches found")
 
-    return issues
+    return issues, out.text()
 
 
-def audit_baselines(tasks):
+def audit_baselines(tasks, idx):
     """Audit baselines and calculate correct values for Jan 13 target"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 4: BASELINE ANALYSIS FOR JAN 13, 2026 TARGET")
-    print("=" * 80)
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 4: BASELINE ANALYSIS FOR JAN 13, 2026 TARGET")
+    out.p("=" * 80)
 
     target_date = datetime(2026, 1, 13)
     original_baseline = datetime(2026, 1, 7)
@@ -361,9 +540,9 @@ def audit_baselines(tasks):
     issues = []
     recommendations = []
 
-    print(f"\n  Target Go-Live: {target_date.strftime('%Y-%m-%d')}")
-    print(f"  Original Baseline: {original_baseline.strftime('%Y-%m-%d')}")
-    print(f"  Baseline Shift Needed: +6 days")
+    out.p(f"\n  Target Go-Live: {target_date.strftime('%Y-%m-%d')}")
+    out.p(f"  Original Baseline: {original_baseline.strftime('%Y-%m-%d')}")
+    out.p(f"  Baseline Shift Needed: +6 days")
 
     # Analyze current baselines
     baseline_stats = {
@@ -374,7 +553,7 @@ def audit_baselines(tasks):
     }
 
     for task in tasks:
-        bf = parse_date(task.get('Baseline Finish'))
+        bf = idx.baseline_finishes[task['row_number']]
         if not bf:
             baseline_stats['missing'].append(task)
             continue
@@ -386,16 +565,16 @@ def audit_baselines(tasks):
         else:
             baseline_stats['after_original'].append(task)
 
-    print(f"\n  Current Baseline Distribution:")
-    print(f"    At Jan 7 (original):     {len(baseline_stats['at_original'])} tasks")
-    print(f"    Before Jan 7:            {len(baseline_stats['before_original'])} tasks")
-    print(f"    After Jan 7:             {len(baseline_stats['after_original'])} tasks (should not exist)")
-    print(f"    Missing baseline:        {len(baseline_stats['missing'])} tasks")
+    out.p(f"\n  Current Baseline Distribution:")
+    out.p(f"    At Jan 7 (original):     {len(baseline_stats['at_original'])} tasks")
+    out.p(f"    Before Jan 7:            {len(baseline_stats['before_original'])} tasks")
+    out.p(f"    After Jan 7:             {len(baseline_stats['after_original'])} tasks (should not exist)")
+    out.p(f"    Missing baseline:        {len(baseline_stats['missing'])} tasks")
 
     # Tasks ending on baseline need adjustment
-    print(f"\n  Tasks Requiring Baseline Update to Jan 13:")
+    out.p(f"\n  Tasks Requiring Baseline Update to Jan 13:")
     for task in baseline_stats['at_original']:
-        print(f"    Row {task['row_number']:2}: {task['Tasks'][:50]}")
+        out.p(f"    Row {task['row_number']:2}: {task['Tasks'][:50]}")
         recommendations.append({
             'row': task['row_number'],
             'task': task['Tasks'],
@@ -405,12 +584,11 @@ def audit_baselines(tasks):
         })
 
     # Calculate what end dates should be
-    print(f"\n  End Date Analysis (Current vs Target):")
+    out.p(f"\n  End Date Analysis (Current vs Target):")
 
     end_date_issues = []
     for task in tasks:
-        end = parse_date(task.get('End Date'))
-        bf = parse_date(task.get('Baseline Finish'))
+        end = idx.end_dates[task['row_number']]
 
         if end and end > target_date:
             days_over = (end - target_date).days
@@ -423,172 +601,156 @@ def audit_baselines(tasks):
             })
 
     if end_date_issues:
-        print(f"\n  Tasks Ending AFTER Jan 13 Target ({len(end_date_issues)}):")
-        end_date_issues.sort(key=lambda x: -x['days_over'])
-        for issue in end_date_issues[:20]:
+        out.p(f"\n  Tasks Ending AFTER Jan 13 Target ({len(end_date_issues)}):")
+        for issue in heapq.nlargest(20, end_date_issues, key=itemgetter('days_over')):
             assigned = issue['assigned'] or 'N/A'
-            print(f"    Row {issue['row']:2} | +{issue['days_over']:2}d | {assigned:10} | {issue['task'][:40]}")
+            out.p(f"    Row {issue['row']:2} | +{issue['days_over']:2}d | {assigned:10} | {issue['task'][:40]}")
 
-        print(f"\n  [CRITICAL] To meet Jan 13, these {len(end_date_issues)} tasks need schedule compression")
+        out.p(f"\n  [CRITICAL] To meet Jan 13, these {len(end_date_issues)} tasks need schedule compression")
 
-    return issues, recommendations, end_date_issues
+    return (issues, recommendations, end_date_issues), out.text()
 
 
-def audit_logical_sequence(tasks):
+def audit_logical_sequence(tasks, idx):
     """Audit logical sequence of tasks"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 5: LOGICAL SEQUENCE ANALYSIS")
-    print("=" * 80)
-
-    issues = []
-
-    # Define expected phase sequence
-    expected_phases = [
-        'development',
-        'qa', 'testing', 'test',
-        'uat',
-        'production', 'deployment'
-    ]
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 5: LOGICAL SEQUENCE ANALYSIS")
+    out.p("=" * 80)
 
     # Check if tasks follow logical sequence
-    print(f"\n  Task Sequence Issues:")
+    out.p(f"\n  Task Sequence Issues:")
 
-    for task in tasks:
-        task_name = task['Tasks'].lower()
-        end = parse_date(task.get('End Date'))
+    # Bucket tasks by phase keyword once so the comparisons below only
+    # cross-join the handful of relevant pairs instead of all N^2
+    uat_tasks = []
+    qa_tasks = []
+    prod_deploy_tasks = []
 
-        # Find other related tasks
-        for other in tasks:
-            if other['row_number'] == task['row_number']:
-                continue
-
-            other_name = other['Tasks'].lower()
-            other_end = parse_date(other.get('End Date'))
-
-            if not end or not other_end:
-                continue
-
-            # Check for sequence violations
-            # UAT should come after QA
-            if 'uat' in task_name and 'qa' in other_name and 'uat' not in other_name:
-                if end < other_end:
-                    issues.append({
-                        'type': 'SEQUENCE_VIOLATION',
-                        'row': task['row_number'],
-                        'task': task['Tasks'],
-                        'issue': f"UAT (Row {task['row_number']}) ends before QA (Row {other['row_number']})",
-                        'severity': 'ERROR'
-                    })
-
-            # Production should come after UAT
-            if 'production deploy' in task_name and 'uat' in other_name:
-                if end < other_end:
-                    issues.append({
-                        'type': 'SEQUENCE_VIOLATION',
-                        'row': task['row_number'],
-                        'task': task['Tasks'],
-                        'issue': f"Production Deploy ends before UAT (Row {other['row_number']})",
-                        'severity': 'ERROR'
-                    })
-
-    # Remove duplicates
+    for task in tasks:
+        end = idx.end_dates[task['row_number']]
+        if not end:
+            continue
+        # Tokenize once; set membership beats substring scans per pair
+        tokens = {w for w in _TOKEN_RE.split(task['Tasks'].lower()) if w}
+        if 'uat' in tokens:
+            uat_tasks.append((task, end))
+        elif 'qa' in tokens:
+            qa_tasks.append((task, end))
+        if 'production' in tokens and any(t.startswith('deploy') for t in tokens):
+            prod_deploy_tasks.append((task, end))
+
+    # Dedup on (row, type) as issues are recorded
     seen = set()
     unique_issues = []
-    for issue in issues:
-        key = (issue['row'], issue['type'])
+
+    def record(task, issue_text):
+        key = (task['row_number'], 'SEQUENCE_VIOLATION')
         if key not in seen:
             seen.add(key)
-            unique_issues.append(issue)
+            unique_issues.append(Issue(
+                'SEQUENCE_VIOLATION', task['row_number'], task['Tasks'],
+                issue_text, 'ERROR'))
+
+    # UAT should come after QA
+    for task, end in uat_tasks:
+        for other, other_end in qa_tasks:
+            if end < other_end:
+                record(task, f"UAT (Row {task['row_number']}) ends before QA (Row {other['row_number']})")
+
+    # Production should come after UAT
+    for task, end in prod_deploy_tasks:
+        for other, other_end in uat_tasks:
+            if other['row_number'] == task['row_number']:
+                continue
+            if end < other_end:
+                record(task, f"Production Deploy ends before UAT (Row {other['row_number']})")
 
     if unique_issues:
-        print(f"\n  Found {len(unique_issues)} sequence issues:")
+        out.p(f"\n  Found {len(unique_issues)} sequence issues:")
         for issue in unique_issues[:10]:
-            print(f"    [{issue['severity']:5}] {issue['issue']}")
+            out.p(f"    [{issue.severity:5}] {issue.issue}")
     else:
-        print("    No sequence issues found")
+        out.p("    No sequence issues found")
 
-    return unique_issues
+    return unique_issues, out.text()
 
 
-def calculate_critical_path(tasks):
+def calculate_critical_path(tasks, idx):
     """Calculate the critical path to Jan 13"""
-    print("\n" + "=" * 80)
-    print("  AUDIT 6: CRITICAL PATH TO JAN 13, 2026")
-    print("=" * 80)
+    out = Out()
+    out.p("\n" + "=" * 80)
+    out.p("  AUDIT 6: CRITICAL PATH TO JAN 13, 2026")
+    out.p("=" * 80)
 
     target = datetime(2026, 1, 13)
     today = datetime(2025, 12, 9)
 
     days_remaining = (target - today).days
-    print(f"\n  Days Remaining to Target: {days_remaining} days")
+    out.p(f"\n  Days Remaining to Target: {days_remaining} days")
 
     # Find tasks on critical path (those that must complete for go-live)
-    task_by_row = {t['row_number']: t for t in tasks}
+    task_by_row = idx.task_by_row
 
     # Start from final deployment and trace back
     final_tasks = [t for t in tasks if 'production deployment' in t['Tasks'].lower()
                    or 'fps production' in t['Tasks'].lower()]
 
-    print(f"\n  Final Deployment Tasks:")
+    out.p(f"\n  Final Deployment Tasks:")
     for t in final_tasks:
-        end = parse_date(t.get('End Date'))
+        end = idx.end_dates[t['row_number']]
         end_str = end.strftime('%Y-%m-%d') if end else 'N/A'
         variance = (end - target).days if end else 0
-        print(f"    Row {t['row_number']:2}: {t['Tasks'][:40]}")
-        print(f"           End: {end_str} | Days from target: {variance:+d}")
+        out.p(f"    Row {t['row_number']:2}: {t['Tasks'][:40]}")
+        out.p(f"           End: {end_str} | Days from target: {variance:+d}")
 
     # Trace critical path backwards
-    print(f"\n  Critical Path (tracing backwards from deployment):")
-
-    def trace_path(row_num, depth=0, visited=None):
-        if visited is None:
-            visited = set()
-        if row_num in visited or depth > 15:
-            return []
-        visited.add(row_num)
-
-        task = task_by_row.get(row_num)
-        if not task:
-            return []
-
-        path = [task]
-
-        pred_str = task.get('Predecessors')
-        if pred_str:
-            pred = parse_predecessor(pred_str)
-            if pred:
-                path.extend(trace_path(pred['row'], depth + 1, visited))
-
+    out.p(f"\n  Critical Path (tracing backwards from deployment):")
+
+    # Each row has at most one parsed predecessor, so the trace is a
+    # simple chain walk over the shared index
+    pred_row_of = {row: (pred or {}).get('row') for row, pred in idx.pred_of.items()}
+
+    def trace_path(row_num):
+        path = []
+        visited = set()
+        while row_num is not None and row_num not in visited:
+            visited.add(row_num)
+            task = task_by_row.get(row_num)
+            if not task:
+                break
+            path.append(task)
+            row_num = pred_row_of.get(row_num)
         return path
 
     # Get critical path from row 72 (FPS Production Deployment)
     critical_path = trace_path(72)
 
     if critical_path:
-        print(f"\n  Critical Path ({len(critical_path)} tasks):")
+        out.p(f"\n  Critical Path ({len(critical_path)} tasks):")
         for i, task in enumerate(critical_path):
             indent = "  " * i
-            end = parse_date(task.get('End Date'))
+            end = idx.end_dates[task['row_number']]
             end_str = end.strftime('%m/%d') if end else 'N/A'
             status = task.get('Status', 'N/A')[:8]
             assigned = task.get('Assigned To', 'N/A') or 'N/A'
-            print(f"    {indent}Row {task['row_number']:2} | {end_str} | {status:8} | {assigned:10} | {task['Tasks'][:35]}")
+            out.p(f"    {indent}Row {task['row_number']:2} | {end_str} | {status:8} | {assigned:10} | {task['Tasks'][:35]}")
 
     # Calculate required compression
-    current_end = parse_date(tasks[0].get('End Date'))  # Development phase
+    current_end = idx.end_dates[tasks[0]['row_number']]  # Development phase
     for t in tasks:
-        end = parse_date(t.get('End Date'))
+        end = idx.end_dates[t['row_number']]
         if end and (not current_end or end > current_end):
             current_end = end
 
     if current_end:
         compression_needed = (current_end - target).days
-        print(f"\n  [SCHEDULE COMPRESSION NEEDED]")
-        print(f"    Current End:      {current_end.strftime('%Y-%m-%d')}")
-        print(f"    Target:           {target.strftime('%Y-%m-%d')}")
-        print(f"    Days to Compress: {compression_needed} days")
+        out.p(f"\n  [SCHEDULE COMPRESSION NEEDED]")
+        out.p(f"    Current End:      {current_end.strftime('%Y-%m-%d')}")
+        out.p(f"    Target:           {target.strftime('%Y-%m-%d')}")
+        out.p(f"    Days to Compress: {compression_needed} days")
 
-    return critical_path
+    return critical_path, out.text()
 
 
 def generate_correction_plan(tasks, all_issues):
@@ -597,13 +759,10 @@ def generate_correction_plan(tasks, all_issues):
     print("  COMPREHENSIVE CORRECTION PLAN")
     print("=" * 80)
 
-    # Group issues by type
+    # Group issues by type - every audit returns a list of typed dicts
     by_type = defaultdict(list)
-    for issue_list in all_issues:
-        if isinstance(issue_list, list):
-            for issue in issue_list:
-                if isinstance(issue, dict) and 'type' in issue:
-                    by_type[issue['type']].append(issue)
+    for issue in chain.from_iterable(all_issues):
+        by_type[issue.type].append(issue)
 
     print(f"""
   PHASE 1: BASELINE UPDATES (Immediate)
@@ -632,7 +791,7 @@ def generate_correction_plan(tasks, all_issues):
     # List rows with predecessor issues
     pred_issues = by_type.get('DATE_OVERLAP', []) + by_type.get('BLOCKED_BY_COMPLETE', [])
     for issue in pred_issues[:10]:
-        print(f"    Row {issue['row']:2}: {issue['issue'][:60]}")
+        print(f"    Row {issue.row:2}: {issue.issue[:60]}")
 
     print(f"""
   PHASE 3: DURATION ADJUSTMENTS (Medium Priority)
@@ -643,7 +802,7 @@ def generate_correction_plan(tasks, all_issues):
 
     dur_issues = by_type.get('DURATION_MISMATCH', [])
     for issue in dur_issues[:5]:
-        print(f"    Row {issue['row']:2}: {issue.get('issue', 'Duration mismatch')[:60]}")
+        print(f"    Row {issue.row:2}: {issue.issue[:60]}")
 
     print(f"""
   PHASE 4: HIERARCHY CLEANUP (Low Priority)
@@ -653,7 +812,7 @@ def generate_correction_plan(tasks, all_issues):
 
     hier_issues = by_type.get('MISPLACED_TASK', []) + by_type.get('VENDOR_MISMATCH', [])
     for issue in hier_issues[:5]:
-        print(f"    Row {issue['row']:2}: {issue['issue'][:60]}")
+        print(f"    Row {issue.row:2}: {issue.issue[:60]}")
 
     print(f"""
   PHASE 5: SCHEDULE COMPRESSION (Critical)
@@ -686,42 +845,91 @@ def generate_correction_plan(tasks, all_issues):
 """)
 
 
+# Audit registry: CLI name -> (function, empty result for skipped audits)
+AUDITS = [
+    ('hierarchy', audit_hierarchy, []),
+    ('predecessors', audit_predecessors, []),
+    ('durations', audit_durations, []),
+    ('baselines', audit_baselines, ([], [], [])),
+    ('sequence', audit_logical_sequence, []),
+    ('critical-path', calculate_critical_path, []),
+]
+
+
+def parse_args():
+    """Parse command-line options"""
+    names = [name for name, _, _ in AUDITS]
+    parser = argparse.ArgumentParser(description='Deep schedule audit')
+    parser.add_argument('--audits', default=','.join(names),
+                        help='Comma-separated audits to run (default: all of %s)' % ','.join(names))
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Skip the pickle cache and re-parse the JSON')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Directory for the pickle cache (default: script directory)')
+    args = parser.parse_args()
+
+    selected = {a.strip() for a in args.audits.split(',') if a.strip()}
+    unknown = selected - set(names)
+    if unknown:
+        parser.error(f"unknown audits: {', '.join(sorted(unknown))}")
+    args.selected = selected
+    return args
+
+
 def main():
     """Main entry point"""
+    args = parse_args()
+
     print("\n" + "=" * 80)
     print("  DEEP SCHEDULE AUDIT - PHASE 2 AGENTIC VOICE")
     print(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("  Target: Identify ALL issues for Jan 13, 2026 go-live")
     print("=" * 80)
 
-    tasks = load_data()
+    tasks = load_data(use_cache=not args.no_cache, cache_dir=args.cache_dir)
     print(f"\n  Analyzing {len(tasks)} tasks...")
 
+    # Build all shared lookups once; every audit reads from these
+    idx = build_indexes(tasks)
+
+    # The audits are pure functions of (tasks, idx) - run the selected
+    # ones in worker processes and print their buffered output in audit
+    # order; skipped audits contribute an empty result downstream
+    to_run = [(name, fn) for name, fn, _ in AUDITS if name in args.selected]
+    with ProcessPoolExecutor(max_workers=len(to_run)) as executor:
+        futures = {name: executor.submit(fn, tasks, idx) for name, fn in to_run}
+        results = []
+        for name, fn, empty in AUDITS:
+            if name in futures:
+                results.append(futures[name].result())
+            else:
+                results.append((empty, ''))
+
     all_issues = []
 
-    # Run all audits
-    hierarchy_issues = audit_hierarchy(tasks)
-    all_issues.append(hierarchy_issues)
+    hierarchy_result, predecessor_result, duration_result, \
+        baseline_result, sequence_result, critical_result = results
 
-    predecessor_issues = audit_predecessors(tasks)
-    all_issues.append(predecessor_issues)
+    for _, text in results:
+        if text:
+            sys.stdout.write(text + '\n')
 
-    duration_issues = audit_durations(tasks)
-    all_issues.append(duration_issues)
+    all_issues.append(hierarchy_result[0])
+    all_issues.append(predecessor_result[0])
+    all_issues.append(duration_result[0])
 
-    baseline_issues, recommendations, end_date_issues = audit_baselines(tasks)
+    baseline_issues, recommendations, end_date_issues = baseline_result[0]
     all_issues.append(baseline_issues)
 
-    sequence_issues = audit_logical_sequence(tasks)
-    all_issues.append(sequence_issues)
+    all_issues.append(sequence_result[0])
 
-    critical_path = calculate_critical_path(tasks)
+    critical_path = critical_result[0]
 
     # Generate correction plan
     generate_correction_plan(tasks, all_issues)
 
     # Summary
-    total_issues = sum(len(i) for i in all_issues if isinstance(i, list))
+    total_issues = sum(map(len, all_issues))
 
     print("\n" + "=" * 80)
     print(f"  AUDIT SUMMARY")
@@ -11,9 +11,56 @@ This script implements:
 
 import smartsheet
 import json
+import os
+import requests
+import shutil
+import sys
+import re
+from collections import defaultdict, deque, namedtuple
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import SMARTSHEET_API_TOKEN, TASK_SHEET_ID
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+API_ROWS_URL = 'https://api.smartsheet.com/2.0/sheets/{sheet_id}/rows'
+
+# Direct REST session for bulk row updates - skips the SDK's per-cell
+# model validation and reuses one keepalive connection with 429/5xx retry
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=['PUT'],
+)))
+_session.headers.update({
+    'Authorization': f'Bearer {SMARTSHEET_API_TOKEN}',
+    'Content-Type': 'application/json',
+})
+
+
+# Fixed-slot change-log record - far smaller than a dict per entry and
+# converted back to a mapping only at serialization time
+ChangeEntry = namedtuple('ChangeEntry', 'row type field old_value new_value rationale')
+
+
+def json_line(obj):
+    """Serialize one change-log record to a bytes line"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode()
+
 
 def get_client():
     """Initialize Smartsheet client"""
@@ -31,28 +78,33 @@ def get_column_map(client, sheet_id):
     return column_map, sheet
 
 
-def get_current_notes(row, notes_col_id):
-    """Get current notes value from a row"""
-    for cell in row.cells:
-        if cell.column_id == notes_col_id:
-            return cell.value or ""
-    return ""
+# Snapshot of every cell value keyed (row_id, column_id) - populated once
+# per sheet load so repeated reads never rescan a row's cell list
+_CELL_CACHE = {}
+
 
+def cache_sheet_cells(sheet):
+    """Populate the (row_id, column_id) -> value cell snapshot"""
+    _CELL_CACHE.clear()
+    for row in sheet.rows:
+        row_id = row.id
+        for cell in row.cells:
+            _CELL_CACHE[(row_id, cell.column_id)] = cell.value
+
+
+def get_current_notes(row_id, notes_col_id):
+    """Get current notes value from the cell snapshot"""
+    return _CELL_CACHE.get((row_id, notes_col_id)) or ""
 
-def get_current_predecessor(row, pred_col_id):
-    """Get current predecessor value from a row"""
-    for cell in row.cells:
-        if cell.column_id == pred_col_id:
-            return cell.value or ""
-    return ""
 
+def get_current_predecessor(row_id, pred_col_id):
+    """Get current predecessor value from the cell snapshot"""
+    return _CELL_CACHE.get((row_id, pred_col_id)) or ""
 
-def get_current_status(row, status_col_id):
-    """Get current status value from a row"""
-    for cell in row.cells:
-        if cell.column_id == status_col_id:
-            return cell.value or ""
-    return ""
+
+def get_current_status(row_id, status_col_id):
+    """Get current status value from the cell snapshot"""
+    return _CELL_CACHE.get((row_id, status_col_id)) or ""
 
 
 # ============================================================================
@@ -165,7 +217,92 @@ TASKS TO MOVE (if choosing Option A):
 """
 
 
-def apply_updates(client, sheet_id, column_map, sheet, dry_run=True):
+def collect_compression(row_id, row_num, suggestion, notes_col):
+    """Build the note fragment to append for one compression candidate"""
+    current_notes = get_current_notes(row_id, notes_col)
+    new_note = f"[12/09 Review] Schedule compression candidate - {suggestion}"
+
+    # Idempotent re-runs: the note is already on the row
+    if new_note in current_notes:
+        return None, [f"  Row {row_num}: Compression note already present - skipping"], None
+
+    entry = ChangeEntry(row_num, "COMPRESSION_NOTE", "Notes",
+                        current_notes[:50] if current_notes else "(empty)",
+                        new_note[:50],
+                        "Schedule compression candidate identified in 12/09 review")
+    return new_note, [f"  Row {row_num}: Adding compression note"], entry
+
+
+def collect_predecessor(row_id, row_num, correction, pred_col):
+    """Build the predecessor-cell update for one correction"""
+    current_pred = get_current_predecessor(row_id, pred_col)
+    new_pred = correction["new_pred"]
+    rationale = correction["rationale"]
+
+    # Skip writes that would not change the cell - they still count
+    # against the API rate limit
+    if str(current_pred).strip() == new_pred.strip():
+        return None, [f"  Row {row_num}: Already '{new_pred}' - no change needed"], None
+
+    entry = ChangeEntry(row_num, "PREDECESSOR", "Predecessors",
+                        current_pred, new_pred, rationale)
+    return new_pred, [f"  Row {row_num}: {current_pred} -> {new_pred}",
+                      f"           Rationale: {rationale}"], entry
+
+
+def collect_status(row_id, row_num, update, status_col):
+    """Build the status-cell update, or a no-op when already current"""
+    current_status = get_current_status(row_id, status_col)
+    new_status = update["new_status"]
+    rationale = update["rationale"]
+
+    if current_status == new_status:
+        return None, [f"  Row {row_num}: Already '{new_status}' - no change needed"], None
+
+    entry = ChangeEntry(row_num, "STATUS", "Status",
+                        current_status, new_status, rationale)
+    return new_status, [f"  Row {row_num}: {current_status} -> {new_status}",
+                        f"           Rationale: {rationale}"], entry
+
+
+# Leading row number of a predecessor string like "24FS +1d"
+_PRED_ROW_RE = re.compile(r'(\d+)')
+
+
+def validate_predecessor_graph(row_by_number, pred_col):
+    """Detect cycles in the proposed predecessor graph before any API call
+
+    Overlays PREDECESSOR_CORRECTIONS on the sheet's existing predecessors
+    and runs Kahn's topological sort; returns the rows caught in a cycle
+    (empty when the combined graph is a valid DAG).
+    """
+    edges = defaultdict(list)   # pred row -> dependent rows
+    in_degree = defaultdict(int)
+
+    for row_num, row in row_by_number.items():
+        if row_num in PREDECESSOR_CORRECTIONS:
+            pred_str = PREDECESSOR_CORRECTIONS[row_num]["new_pred"]
+        else:
+            pred_str = get_current_predecessor(row.id, pred_col)
+        match = _PRED_ROW_RE.match(str(pred_str)) if pred_str else None
+        if match:
+            pred_row = int(match.group(1))
+            if pred_row in row_by_number:
+                edges[pred_row].append(row_num)
+                in_degree[row_num] += 1
+
+    queue = deque(n for n in row_by_number if in_degree[n] == 0)
+    while queue:
+        node = queue.popleft()
+        for dependent in edges.get(node, ()):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    return sorted(n for n in row_by_number if in_degree[n] > 0)
+
+
+def apply_updates(client, sheet_id, column_map, sheet, dry_run=True, quiet=False, run_ts=None):
     """Apply all updates to Smartsheet"""
 
     notes_col = column_map.get('Notes')
@@ -179,14 +316,40 @@ def apply_updates(client, sheet_id, column_map, sheet, dry_run=True):
         print(f"  Status: {status_col}")
         return
 
-    # Build row lookup by row number
+    # Build row lookup by row number and snapshot the cell values so
+    # the get_current_* helpers are O(1) dict gets with zero rescans
     row_by_number = {}
     for row in sheet.rows:
         row_by_number[row.row_number] = row
+    cache_sheet_cells(sheet)
+
+    # Reject the whole run if the corrected predecessor graph has a
+    # cycle - cheaper to catch in memory than via failed API calls
+    cycle_rows = validate_predecessor_graph(row_by_number, pred_col)
+    if cycle_rows:
+        print("\n  [ERROR] Predecessor cycle detected - aborting before any update")
+        print(f"  Rows in cycle: {', '.join(map(str, cycle_rows))}")
+        return None
 
     # Collect all updates by row_id to avoid duplicates
     updates_by_row = {}  # row_id -> {row_id, cells: {col_id: value}}
-    change_log = []
+
+    # One timestamp per run - reused for the banner, the log filename
+    # and the log header instead of repeated datetime.now() calls
+    if run_ts is None:
+        run_ts = datetime.now()
+
+    # Stream change-log entries to disk as they are generated (JSONL)
+    # instead of holding the whole list in memory
+    change_log_file = f"change_log_{run_ts.strftime('%Y%m%d_%H%M%S')}.jsonl"
+    log_f = open(change_log_file + '.tmp', 'wb')
+    total_changes = 0
+
+    def log_change(entry):
+        """Write one change record to the streaming log"""
+        nonlocal total_changes
+        log_f.write(json_line(entry._asdict()))
+        total_changes += 1
 
     def add_cell_update(row_id, row_num, col_id, value):
         """Add a cell update, combining with existing row updates"""
@@ -194,103 +357,92 @@ def apply_updates(client, sheet_id, column_map, sheet, dry_run=True):
             updates_by_row[row_id] = {'row_id': row_id, 'row_num': row_num, 'cells': {}}
         updates_by_row[row_id]['cells'][col_id] = value
 
-    # ---- Priority 1: Compression Notes ----
-    print("\n" + "=" * 70)
-    print("  PRIORITY 1: Compression Suggestion Notes")
-    print("=" * 70)
-
+    # ---- Combine the three priority tables into one row_num -> ops map
+    # so sheet.rows is walked exactly once for all of them ----
+    all_updates = defaultdict(list)
     for row_num, suggestion in COMPRESSION_CANDIDATES.items():
-        row = row_by_number.get(row_num)
-        if not row:
-            print(f"  [WARN] Row {row_num} not found")
-            continue
-
-        current_notes = get_current_notes(row, notes_col)
-        new_note = f"[12/09 Review] Schedule compression candidate - {suggestion}"
-
-        # Append to existing notes
-        if current_notes:
-            updated_notes = f"{current_notes}\n{new_note}"
-        else:
-            updated_notes = new_note
-
-        print(f"  Row {row_num}: Adding compression note")
-
-        # Add to combined updates
-        add_cell_update(row.id, row_num, notes_col, updated_notes)
-
-        change_log.append({
-            "row": row_num,
-            "type": "COMPRESSION_NOTE",
-            "field": "Notes",
-            "old_value": current_notes[:50] if current_notes else "(empty)",
-            "new_value": new_note[:50],
-            "rationale": "Schedule compression candidate identified in 12/09 review"
-        })
-
-    # ---- Priority 2: Predecessor Corrections ----
-    print("\n" + "=" * 70)
-    print("  PRIORITY 2: Predecessor Corrections")
-    print("=" * 70)
-
+        all_updates[row_num].append(('note', suggestion))
     for row_num, correction in PREDECESSOR_CORRECTIONS.items():
-        row = row_by_number.get(row_num)
-        if not row:
-            print(f"  [WARN] Row {row_num} not found")
-            continue
-
-        current_pred = get_current_predecessor(row, pred_col)
-        new_pred = correction["new_pred"]
-        rationale = correction["rationale"]
-
-        print(f"  Row {row_num}: {current_pred} -> {new_pred}")
-        print(f"           Rationale: {rationale}")
-
-        # Add to combined updates
-        add_cell_update(row.id, row_num, pred_col, new_pred)
-
-        change_log.append({
-            "row": row_num,
-            "type": "PREDECESSOR",
-            "field": "Predecessors",
-            "old_value": current_pred,
-            "new_value": new_pred,
-            "rationale": rationale
-        })
-
-    # ---- Priority 3: Status Updates ----
-    print("\n" + "=" * 70)
-    print("  PRIORITY 3: Status Updates (from meetings)")
-    print("=" * 70)
-
+        all_updates[row_num].append(('pred', correction))
     for row_num, update in STATUS_UPDATES.items():
-        row = row_by_number.get(row_num)
-        if not row:
-            print(f"  [WARN] Row {row_num} not found")
-            continue
+        all_updates[row_num].append(('status', update))
 
-        current_status = get_current_status(row, status_col)
-        new_status = update["new_status"]
-        rationale = update["rationale"]
+    # Per-priority output is buffered during the single pass and printed
+    # in the original section order afterwards
+    lines = {'note': [], 'pred': [], 'status': []}
+    seen = set()
 
-        if current_status == new_status:
-            print(f"  Row {row_num}: Already '{new_status}' - no change needed")
-            continue
+    # Notes are appended as fragments and joined once per row at the end,
+    # so repeated additions never recopy the growing string
+    note_fragments = {}  # row_id -> (row_num, [fragment, ...])
 
-        print(f"  Row {row_num}: {current_status} -> {new_status}")
-        print(f"           Rationale: {rationale}")
+    # Hoist method lookups out of the row pass - LOAD_FAST per iteration
+    # instead of re-resolving the attributes
+    _get_ops = all_updates.get
+    _add = add_cell_update
+    _log = log_change
+    _seen_add = seen.add
 
-        # Add to combined updates
-        add_cell_update(row.id, row_num, status_col, new_status)
-
-        change_log.append({
-            "row": row_num,
-            "type": "STATUS",
-            "field": "Status",
-            "old_value": current_status,
-            "new_value": new_status,
-            "rationale": rationale
-        })
+    for row in sheet.rows:
+        row_num = row.row_number
+        ops = _get_ops(row_num)
+        if not ops:
+            continue
+        _seen_add(row_num)
+        row_id = row.id
+
+        for kind, payload in ops:
+            if kind == 'note':
+                fragment, op_lines, entry = collect_compression(row_id, row_num, payload, notes_col)
+                if fragment is None:
+                    lines[kind].extend(op_lines)
+                    continue
+                if row_id not in note_fragments:
+                    frags = []
+                    current_notes = get_current_notes(row_id, notes_col)
+                    if current_notes:
+                        frags.append(current_notes)
+                    note_fragments[row_id] = (row_num, frags)
+                note_fragments[row_id][1].append(fragment)
+                lines[kind].extend(op_lines)
+                _log(entry)
+                continue
+            elif kind == 'pred':
+                value, op_lines, entry = collect_predecessor(row_id, row_num, payload, pred_col)
+                col_id = pred_col
+            else:  # status
+                value, op_lines, entry = collect_status(row_id, row_num, payload, status_col)
+                col_id = status_col
+
+            lines[kind].extend(op_lines)
+            if value is not None:
+                _add(row_id, row_num, col_id, value)
+                _log(entry)
+
+    # Join each row's accumulated note fragments into its cell value
+    for frag_row_id, (frag_row_num, frags) in note_fragments.items():
+        add_cell_update(frag_row_id, frag_row_num, notes_col, "\n".join(frags))
+
+    # Rows referenced in the tables but missing from the sheet
+    for row_num, ops in all_updates.items():
+        if row_num not in seen:
+            for kind, _ in ops:
+                lines[kind].append(f"  [WARN] Row {row_num} not found")
+
+    # ---- Emit the buffered priority sections: one stdout write per
+    # section instead of a syscall per line; --quiet skips them ----
+    if not quiet:
+        sections = [
+            ("PRIORITY 1: Compression Suggestion Notes", lines['note']),
+            ("PRIORITY 2: Predecessor Corrections", lines['pred']),
+            ("PRIORITY 3: Status Updates (from meetings)", lines['status']),
+        ]
+        for title, section_lines in sections:
+            sys.stdout.write("\n" + "=" * 70 + "\n")
+            sys.stdout.write(f"  {title}\n")
+            sys.stdout.write("=" * 70 + "\n")
+            if section_lines:
+                sys.stdout.write("\n".join(section_lines) + "\n")
 
     # ---- Issue B: Structure Documentation ----
     print("\n" + "=" * 70)
@@ -298,17 +450,14 @@ def apply_updates(client, sheet_id, column_map, sheet, dry_run=True):
     print("=" * 70)
     print(STRUCTURE_ISSUES)
 
-    # ---- Convert combined updates to Smartsheet row objects ----
-    updates = []
-    for row_id, row_data in updates_by_row.items():
-        row_update = smartsheet.models.Row()
-        row_update.id = row_id
-        for col_id, value in row_data['cells'].items():
-            cell = smartsheet.models.Cell()
-            cell.column_id = col_id
-            cell.value = value
-            row_update.cells.append(cell)
-        updates.append(row_update)
+    # ---- Convert combined updates to raw API row payloads ----
+    # Plain dicts matching the REST schema - no SDK Row/Cell reflection
+    updates = [
+        {'id': row_id,
+         'cells': [{'columnId': col_id, 'value': value}
+                   for col_id, value in row_data['cells'].items()]}
+        for row_id, row_data in updates_by_row.items()
+    ]
 
     # ---- Apply Updates ----
     print("\n" + "=" * 70)
@@ -316,37 +465,80 @@ def apply_updates(client, sheet_id, column_map, sheet, dry_run=True):
         print("  DRY RUN - No changes applied")
         print("=" * 70)
         print(f"\n  Total rows to update: {len(updates)}")
-        print(f"  Total cell changes: {len(change_log)}")
+        print(f"  Total cell changes: {total_changes}")
         print(f"  Run without --dry-run to apply these changes")
     else:
         print("  APPLYING UPDATES")
         print("=" * 70)
 
-        # Apply in batches
-        batch_size = 50
-        for i in range(0, len(updates), batch_size):
-            batch = updates[i:i + batch_size]
+        # Apply in batches - the API accepts up to 500 rows per call, so
+        # one call normally covers the whole update set
+        batch_size = 500
+        url = API_ROWS_URL.format(sheet_id=sheet_id)
+
+        # With httpx installed, one HTTP/2 connection multiplexes every
+        # batch PUT; otherwise fall back to the keepalive session
+        http2_client = None
+        if httpx is not None:
             try:
-                result = client.Sheets.update_rows(sheet_id, batch)
+                http2_client = httpx.Client(http2=True, headers=dict(_session.headers),
+                                            timeout=30.0)
+            except ImportError:
+                http2_client = None  # h2 extra not installed
+
+        try:
+            for i in range(0, len(updates), batch_size):
+                batch = updates[i:i + batch_size]
+                body = orjson.dumps(batch) if orjson is not None else json.dumps(batch).encode()
+                if http2_client is not None:
+                    response = http2_client.put(url, content=body)
+                else:
+                    response = _session.put(url, data=body, timeout=30)
+                if response.status_code != 200:
+                    print(f"  ERROR in batch {i//batch_size + 1}: {response.status_code} {response.text[:200]}")
+                    response.raise_for_status()
                 print(f"  Updated batch {i//batch_size + 1}: {len(batch)} rows")
-            except Exception as e:
-                print(f"  ERROR in batch {i//batch_size + 1}: {e}")
-                raise
+        finally:
+            if http2_client is not None:
+                http2_client.close()
 
-        print(f"\n  [SUCCESS] Updated {len(updates)} rows with {len(change_log)} changes")
+        print(f"\n  [SUCCESS] Updated {len(updates)} rows with {total_changes} changes")
 
     # ---- Save Change Log ----
-    change_log_file = f"change_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(change_log_file, 'w') as f:
-        json.dump({
-            "timestamp": datetime.now().isoformat(),
+    # Entries were streamed while generated; prepend the header line and
+    # move the file into place under its final name
+    log_f.close()
+    with open(change_log_file, 'wb') as f:
+        f.write(json_line({
+            "timestamp": run_ts.isoformat(),
             "dry_run": dry_run,
-            "total_changes": len(change_log),
-            "changes": change_log
-        }, f, indent=2)
+            "total_changes": total_changes,
+        }))
+        with open(change_log_file + '.tmp', 'rb') as tmp:
+            shutil.copyfileobj(tmp, f)
+    os.remove(change_log_file + '.tmp')
     print(f"\n  [LOG] Change log saved to {change_log_file}")
 
-    return change_log
+    return change_log_file
+
+
+# Static verification tables - built once at import instead of being
+# re-allocated on every verify_logical_dependencies call
+EXPECTED_CHAIN = (
+    (28, "FPS Development - Knowledgebase", None),
+    (36, "FPS Development - Partner Integrations", "28FS"),
+    (40, "FPS QA Testing", "36FS"),
+    (56, "Frontier UAT Testing", "40FS +1d"),
+    (62, "Frontier UAT Approval", "56FS +1d"),
+    (69, "Frontier Production Go-Live Approval (CAB)", "62FS +1d"),
+    (72, "FPS Production Deployment", "69FS +1d"),
+)
+
+PARALLEL_TRACKS = (
+    ("IGT", ((22, "IGT Staging"), (51, "IGT Production -> 22FS"))),
+    ("Cognigy", ((13, "Phase 1"), (17, "Phase 2 -> 13FS"), (46, "Production -> 17FS"))),
+    ("CSG", ((43, "Staging"), (59, "Production"))),
+)
 
 
 def verify_logical_dependencies(sheet, column_map):
@@ -359,33 +551,16 @@ def verify_logical_dependencies(sheet, column_map):
     pred_col = column_map.get('Predecessors')
     task_col = column_map.get('Tasks')
 
-    # Expected dependency chain
-    expected_chain = [
-        (28, "FPS Development - Knowledgebase", None),
-        (36, "FPS Development - Partner Integrations", "28FS"),
-        (40, "FPS QA Testing", "36FS"),
-        (56, "Frontier UAT Testing", "40FS +1d"),
-        (62, "Frontier UAT Approval", "56FS +1d"),
-        (69, "Frontier Production Go-Live Approval (CAB)", "62FS +1d"),
-        (72, "FPS Production Deployment", "69FS +1d"),
-    ]
-
     print("\n  Expected Critical Path:")
     print(f"  {'Row':>4} | {'Task':<45} | {'Expected Pred':^15}")
     print(f"  {'-'*4}-+-{'-'*45}-+-{'-'*15}")
 
-    for row_num, task_name, expected_pred in expected_chain:
+    for row_num, task_name, expected_pred in EXPECTED_CHAIN:
         exp = expected_pred if expected_pred else "(start)"
         print(f"  {row_num:>4} | {task_name:<45} | {exp:^15}")
 
     print("\n  Parallel Infrastructure Track:")
-    parallel_tracks = [
-        ("IGT", [(22, "IGT Staging"), (51, "IGT Production -> 22FS")]),
-        ("Cognigy", [(13, "Phase 1"), (17, "Phase 2 -> 13FS"), (46, "Production -> 17FS")]),
-        ("CSG", [(43, "Staging"), (59, "Production")]),
-    ]
-
-    for vendor, track in parallel_tracks:
+    for vendor, track in PARALLEL_TRACKS:
         track_str = " -> ".join([f"Row {r}" for r, _ in track])
         print(f"  {vendor}: {track_str}")
 
@@ -394,11 +569,14 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='Apply schedule rigor updates')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
+    parser.add_argument('--quiet', action='store_true', help='Suppress per-row change output')
     args = parser.parse_args()
 
+    run_ts = datetime.now()
+
     print("\n" + "=" * 70)
     print("  SCHEDULE RIGOR UPDATES - Phase 2 Agentic Voice")
-    print(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"  Generated: {run_ts.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
 
     # Initialize
@@ -410,7 +588,8 @@ def main():
     print(f"  [OK] Found {len(column_map)} columns")
 
     # Apply updates
-    change_log = apply_updates(client, TASK_SHEET_ID, column_map, sheet, dry_run=args.dry_run)
+    apply_updates(client, TASK_SHEET_ID, column_map, sheet, dry_run=args.dry_run,
+                  quiet=args.quiet, run_ts=run_ts)
 
     # Verify dependencies
     verify_logical_dependencies(sheet, column_map)
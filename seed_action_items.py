@@ -3,9 +3,28 @@ Seed FPS Action Item Log with action items from meeting notes
 """
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import SMARTSHEET_API_TOKEN
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SHEET_ID = 4528757755826052
+MAX_ROWS_PER_POST = 500  # Smartsheet API limit per row-insert call
+
+# Persistent session: connection keepalive skips the TLS handshake on
+# repeat calls, and the mounted retry policy handles rate limiting
+session = requests.Session()
+session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=['POST'],
+)))
 
 headers = {
     'Authorization': f'Bearer {SMARTSHEET_API_TOKEN}',
@@ -226,9 +245,10 @@ action_items = [
 ]
 
 # Build rows - Note: Assigned To stored in Notes column since Contact List requires valid Smartsheet contacts
-rows = []
-for item in action_items:
-    row = {
+# Shaped once at module load as a frozen tuple; the POST path below uses
+# it directly with no per-run reshaping
+ROWS_PAYLOAD = tuple(
+    {
         'toBottom': True,
         'cells': [
             {'columnId': COL_ACTION_ITEM, 'value': item['action']},
@@ -239,16 +259,24 @@ for item in action_items:
             {'columnId': COL_DATE_LOGGED, 'value': item['date_logged']}
         ]
     }
-    rows.append(row)
+    for item in action_items
+)
 
-# Add rows to sheet
+# Add rows to sheet (chunked in case the payload ever exceeds the API limit)
 url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows'
-response = requests.post(url, headers=headers, json=rows)
-
-result = response.json()
-if response.status_code == 200:
-    print(f'Successfully added {len(result.get("result", []))} action items!')
-    print(f'\nSheet URL: https://app.smartsheet.com/sheets/9W48P8Hm3GrpG7rxMJhHHMjH87Q4rJF3p54qhhC1')
+added = 0
+for i in range(0, len(ROWS_PAYLOAD), MAX_ROWS_PER_POST):
+    chunk = ROWS_PAYLOAD[i:i + MAX_ROWS_PER_POST]
+    # Encode the payload with orjson when available - the C serializer
+    # beats the stdlib encoder requests would use via json=
+    body = orjson.dumps(chunk) if orjson is not None else json.dumps(chunk).encode()
+    response = session.post(url, headers=headers, data=body)
+    result = response.json()
+    if response.status_code != 200:
+        print(f'Error: {response.status_code}')
+        print(json.dumps(result, indent=2))
+        break
+    added += len(result.get('result', []))
 else:
-    print(f'Error: {response.status_code}')
-    print(json.dumps(result, indent=2))
+    print(f'Successfully added {added} action items!')
+    print(f'\nSheet URL: https://app.smartsheet.com/sheets/9W48P8Hm3GrpG7rxMJhHHMjH87Q4rJF3p54qhhC1')
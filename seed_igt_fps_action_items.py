@@ -4,9 +4,40 @@ Uses objectValue format with CONTACT types for proper API compatibility and chec
 """
 import requests
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
 from datetime import datetime, timedelta
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import SMARTSHEET_API_TOKEN
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+except ImportError:
+    _rf_fuzz = None
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 SHEET_ID = 4528757755826052
 
 headers = {
@@ -14,6 +45,18 @@ headers = {
     'Content-Type': 'application/json'
 }
 
+# Persistent session: connection keepalive skips the TLS handshake on
+# repeat calls, and the mounted retry policy handles rate limiting
+session = requests.Session()
+session.headers.update(headers)
+session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=['GET', 'PUT', 'POST'],
+)))
+
 # Column IDs
 COL_ACTION_ITEM = 1272434926505860
 COL_STATUS = 5776034553876356
@@ -39,6 +82,9 @@ CONTACTS = {
     'Jimmy': 'jimmy.mctiernan@cognigy.nice.com',
 }
 
+# Lowercased lookup so assignee matching is case-insensitive
+_CONTACTS_LOWER = {name.lower(): email for name, email in CONTACTS.items()}
+
 # Due date rules (business days from date logged)
 PRIORITY_DAYS = {
     'Critical': 2,
@@ -49,36 +95,87 @@ PRIORITY_DAYS = {
 
 COL_OCCURRENCE_COUNT = 7996699210108804
 
-def get_existing_actions():
-    """Get existing action items with row IDs for duplicate detection and occurrence counting"""
-    url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}'
-    response = requests.get(url, headers=headers)
-    sheet = response.json()
+# Local cache of existing rows, keyed by the sheet's version number so
+# unchanged sheets skip the full GET on repeat runs
+CACHE_DB = '.smartsheet_cache.db'
+
+def _prefix_key(prefix):
+    """Dict key for a 50-char prefix - a 64-bit xxh3 fingerprint when available"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(prefix.encode())
+    return prefix
+
 
-    existing_prefixes = {}  # prefix -> row_id
+def _index_rows(rows):
+    """Build the prefix map and full list from (row_id, action_lower, count, terms) tuples"""
+    existing_prefixes = {}  # prefix -> full item dict
     existing_full = []  # List of {action, row_id, occurrence_count}
+    for row_id, action_lower, occurrence_count, terms in rows:
+        item = {
+            'action': action_lower,
+            'row_id': row_id,
+            'occurrence_count': occurrence_count,
+            # Computed once here instead of per comparison in the
+            # duplicate-check inner loop
+            'terms': terms
+        }
+        existing_prefixes[_prefix_key(action_lower[:50])] = item
+        existing_full.append(item)
+    return existing_prefixes, existing_full
 
-    for row in sheet.get('rows', []):
-        row_id = row.get('id')
-        action = ''
-        occurrence_count = 1
 
-        for cell in row['cells']:
-            if cell['columnId'] == COL_ACTION_ITEM:
-                action = cell.get('value', '') or ''
-            elif cell['columnId'] == COL_OCCURRENCE_COUNT:
-                occurrence_count = int(cell.get('value') or 1)
+def _fetch_sheet_version():
+    """Current sheet version via the lightweight /version endpoint"""
+    response = session.get(f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/version')
+    if response.status_code != 200:
+        return None
+    payload = orjson.loads(response.content) if orjson is not None else response.json()
+    return payload.get('version')
+
 
+def get_existing_actions():
+    """Get existing action items with row IDs for duplicate detection and occurrence counting"""
+    conn = sqlite3.connect(CACHE_DB)
+    conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+    conn.execute('CREATE TABLE IF NOT EXISTS rows '
+                 '(row_id INTEGER PRIMARY KEY, action TEXT, occurrence_count INTEGER, terms INTEGER)')
+
+    # The tiny version probe decides whether the full GET is needed
+    version = _fetch_sheet_version()
+    cached = conn.execute("SELECT value FROM meta WHERE key = 'sheet_version'").fetchone()
+    if version is not None and cached is not None and cached[0] == str(version):
+        rows = conn.execute('SELECT row_id, action, occurrence_count, terms FROM rows').fetchall()
+        conn.close()
+        print(f"  (loaded from cache, sheet version {version})")
+        return _index_rows(rows)
+
+    # Only the two columns we read come back, which shrinks the payload
+    # and the JSON parse roughly in proportion to the sheet's column count
+    url = (f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}'
+           f'?columnIds={COL_ACTION_ITEM},{COL_OCCURRENCE_COUNT}&pageSize=10000')
+    response = session.get(url)
+    # orjson parses the raw bytes several times faster than the stdlib
+    # decoder behind response.json()
+    sheet = orjson.loads(response.content) if orjson is not None else response.json()
+
+    rows = []
+    for row in sheet.get('rows', []):
+        values = {cell['columnId']: cell.get('value') for cell in row['cells']}
+        action = values.get(COL_ACTION_ITEM) or ''
         if action:
-            prefix = action[:50].lower()
-            existing_prefixes[prefix] = row_id
-            existing_full.append({
-                'action': action.lower(),
-                'row_id': row_id,
-                'occurrence_count': occurrence_count
-            })
+            action_lower = action.lower()
+            rows.append((row.get('id'), action_lower,
+                         int(values.get(COL_OCCURRENCE_COUNT) or 1),
+                         extract_key_terms(action_lower)))
 
-    return existing_prefixes, existing_full
+    conn.execute('DELETE FROM rows')
+    conn.executemany('INSERT INTO rows VALUES (?, ?, ?, ?)', rows)
+    if version is not None:
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('sheet_version', ?)", (str(version),))
+    conn.commit()
+    conn.close()
+
+    return _index_rows(rows)
 
 
 # Critical terms that indicate true duplicates when shared
@@ -93,85 +190,141 @@ CRITICAL_TERMS = {
 }
 
 
+# Multi-word phrases recognized by extract_key_terms
+PHRASES = (
+    'sip trunk', 'signal api', 'screen pop', 'speech keys', 'bearer token',
+    'project plan', 'project baseline', 'project schedule', 'action item',
+    '800 number', '800 test', 'test number', 'phone number',
+    'cab approval', 'arb approval', 'nice cx1', 'nice platform',
+    'azure speech', 'signal api configuration', 'sip trunk timeline'
+)
+
+# One bit per phrase: term sets become ints and the critical-term
+# overlap check collapses to a couple of bitwise ANDs
+PHRASE_BITS = {phrase: 1 << i for i, phrase in enumerate(PHRASES)}
+CRITICAL_MASK = 0
+for _term in CRITICAL_TERMS:
+    CRITICAL_MASK |= PHRASE_BITS[_term]
+
+# With pyahocorasick installed, all phrases are matched in one linear
+# traversal of the text instead of one substring scan per phrase
+if _ahocorasick is not None:
+    _PHRASE_AUTOMATON = _ahocorasick.Automaton()
+    for _phrase in PHRASES:
+        _PHRASE_AUTOMATON.add_word(_phrase, PHRASE_BITS[_phrase])
+    _PHRASE_AUTOMATON.make_automaton()
+else:
+    _PHRASE_AUTOMATON = None
+
+
 def extract_key_terms(text):
-    """Extract key terms and phrases from action item text"""
-    import re
+    """Extract key terms from action item text as a phrase bitmask"""
     if not text:
-        return set()
+        return 0
 
     text_lower = text.lower()
-    terms = set()
+    mask = 0
+    if _PHRASE_AUTOMATON is not None:
+        for _, bit in _PHRASE_AUTOMATON.iter(text_lower):
+            mask |= bit
+    else:
+        for phrase, bit in PHRASE_BITS.items():
+            if phrase in text_lower:
+                mask |= bit
+    return mask
 
-    # Multi-word phrases
-    phrases = [
-        'sip trunk', 'signal api', 'screen pop', 'speech keys', 'bearer token',
-        'project plan', 'project baseline', 'project schedule', 'action item',
-        '800 number', '800 test', 'test number', 'phone number',
-        'cab approval', 'arb approval', 'nice cx1', 'nice platform',
-        'azure speech', 'signal api configuration', 'sip trunk timeline'
-    ]
 
-    for phrase in phrases:
-        if phrase in text_lower:
-            terms.add(phrase)
+def decode_terms(mask):
+    """Phrase strings for a term bitmask, for human-readable output"""
+    return [phrase for phrase, bit in PHRASE_BITS.items() if mask & bit]
 
-    return terms
 
+def similarity(a, b):
+    """Similarity ratio in [0, 1] - rapidfuzz's C matcher when installed"""
+    if _rf_fuzz is not None:
+        return _rf_fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
 
-def is_duplicate(new_action, existing_prefixes, existing_full, threshold=0.75):
+
+def is_duplicate(new_lower, new_prefix, existing_prefixes, existing_full, threshold=0.75, new_terms=None):
     """
     Enhanced duplicate detection using:
     1. Prefix match (first 50 chars)
     2. Text similarity (>75%)
     3. Critical term matching
 
+    new_lower/new_prefix are precomputed by the caller so no lowering or
+    slicing happens per call.
+
     Returns: (is_duplicate, reason, matching_row_info)
     matching_row_info contains row_id and occurrence_count if duplicate found
     """
-    from difflib import SequenceMatcher
-
-    new_lower = new_action.lower()
-    new_prefix = new_lower[:50]
-
-    # Strategy 1: Exact prefix match
-    if new_prefix in existing_prefixes:
-        row_id = existing_prefixes[new_prefix]
-        # Find the full item info
-        for item in existing_full:
-            if item['row_id'] == row_id:
-                return True, "prefix match", item
-        return True, "prefix match", {'row_id': row_id, 'occurrence_count': 1}
+    # Strategy 1: Exact prefix match - the map holds the full item, so
+    # no scan of existing_full is needed
+    match = existing_prefixes.get(_prefix_key(new_prefix))
+    if match is not None:
+        return True, "prefix match", match
 
     # Strategy 2: Text similarity + Critical term matching
-    new_terms = extract_key_terms(new_lower)
+    if new_terms is None:
+        new_terms = extract_key_terms(new_lower)
+    # Intersect with the critical mask once per item; when the new action
+    # carries no critical terms the whole branch is dead for every row
+    new_critical = new_terms & CRITICAL_MASK
 
     for existing in existing_full:
         existing_text = existing['action']
 
+        # Identical strings never reach the matcher
+        if new_lower == existing_text:
+            return True, "exact match", existing
+
+        # 2*min/(sum) is an upper bound on the similarity ratio; if even
+        # that cannot reach the weakest cutoff, skip the matcher
+        len_new, len_existing = len(new_lower), len(existing_text)
+        if 2.0 * min(len_new, len_existing) / (len_new + len_existing) < 0.55:
+            continue
+
         # Check text similarity
-        ratio = SequenceMatcher(None, new_lower, existing_text).ratio()
+        ratio = similarity(new_lower, existing_text)
         if ratio >= threshold:
             return True, f"{ratio:.0%} similar", existing
 
         # Check critical term overlap (requires 50%+ similarity to avoid false positives)
-        existing_terms = extract_key_terms(existing_text)
-        shared_critical = (new_terms & existing_terms) & CRITICAL_TERMS
-
-        if shared_critical and ratio >= 0.55:
-            return True, f"critical match ({ratio:.0%}): {', '.join(shared_critical)}", existing
+        if new_critical and ratio >= 0.55:
+            shared_critical = new_critical & existing['terms']
+            if shared_critical:
+                return True, f"critical match ({ratio:.0%}): {', '.join(decode_terms(shared_critical))}", existing
 
     return False, None, None
 
+def _business_day_delta(weekday, num_days):
+    """Calendar-day delta covering num_days business days from a weekday start"""
+    weeks, remainder = divmod(num_days, 5)
+    days = weeks * 7 + remainder
+    if weekday + remainder >= 5:  # remainder spills over a weekend
+        days += 2
+    return days
+
+
+# Pure integer arithmetic, so numba can compile it to machine code when
+# installed; cache=True keeps the compile cost to the first run only
+if njit is not None:
+    _business_day_delta = njit(cache=True)(_business_day_delta)
+
+
 def add_business_days(start_date, num_days):
     """Add business days to a date (skip weekends)"""
-    current = start_date
-    days_added = 0
-    while days_added < num_days:
-        current += timedelta(days=1)
-        if current.weekday() < 5:  # Monday=0, Friday=4
-            days_added += 1
-    return current
-
+    if num_days <= 0:
+        return start_date
+    start_ord = start_date.toordinal()
+    weekday = start_date.weekday()
+    if weekday >= 5:  # weekend start counts from the preceding Friday
+        start_ord -= weekday - 4
+        weekday = 4
+    return datetime.fromordinal(start_ord + _business_day_delta(weekday, num_days))
+
+@lru_cache(maxsize=None)
 def calculate_due_date(date_logged_str, priority='Medium'):
     """Calculate due date based on date logged and priority (business days)"""
     logged = datetime.strptime(date_logged_str, '%Y-%m-%d')
@@ -179,13 +332,14 @@ def calculate_due_date(date_logged_str, priority='Medium'):
     due = add_business_days(logged, days_to_add)
     return due.strftime('%Y-%m-%d')
 
+@lru_cache(maxsize=None)
 def get_contact_object(assigned_str):
     """Convert assigned names to Smartsheet contact objectValue"""
-    names = [n.strip() for n in assigned_str.split(',')]
+    names = [n.strip().lower() for n in assigned_str.split(',')]
     contacts = []
     for name in names:
-        if name in CONTACTS:
-            contacts.append({'objectType': 'CONTACT', 'email': CONTACTS[name]})
+        if name in _CONTACTS_LOWER:
+            contacts.append({'objectType': 'CONTACT', 'email': _CONTACTS_LOWER[name]})
 
     if not contacts:
         return None
@@ -501,9 +655,31 @@ def main():
     rows_to_update = []  # {row_id, new_count}
     updated_row_ids = set()  # Prevent double-counting same row
 
-    for item in action_items:
+    # Parallel arrays over action_items, built in one precompute pass:
+    # the loop below indexes into these instead of re-deriving strings
+    # and term sets from the item dicts
+    items_lower = [item['action'].lower() for item in action_items]
+    items_prefix = [text[:50] for text in items_lower]
+    items_terms = [extract_key_terms(text) for text in items_lower]
+
+    # Collapse in-batch items sharing a 50-char prefix before scanning
+    # the existing rows: one representative per group goes through
+    # duplicate detection, carrying the group's occurrence count
+    prefix_groups = {}
+    for i, prefix in enumerate(items_prefix):
+        prefix_groups.setdefault(prefix, []).append(i)
+
+    for indices in prefix_groups.values():
+        i = indices[0]
+        item = action_items[i]
+        group_count = len(indices)
+        if group_count > 1:
+            print(f"  MERGE (in-batch x{group_count}): {item['action'][:50]}...")
+
         # Check for duplicate using multiple strategies
-        is_dup, reason, match_info = is_duplicate(item['action'], existing_prefixes, existing_full)
+        is_dup, reason, match_info = is_duplicate(items_lower[i], items_prefix[i],
+                                                  existing_prefixes, existing_full,
+                                                  new_terms=items_terms[i])
 
         if is_dup and match_info:
             row_id = match_info['row_id']
@@ -511,7 +687,7 @@ def main():
             # Only increment each row once per run
             if row_id not in updated_row_ids:
                 current_count = match_info.get('occurrence_count', 1)
-                new_count = current_count + 1
+                new_count = current_count + group_count
                 rows_to_update.append({
                     'row_id': row_id,
                     'new_count': new_count,
@@ -525,7 +701,7 @@ def main():
                 print(f"  SKIP (already counted): {item['action'][:50]}...")
             continue
 
-        # New item - add with occurrence count = 1
+        # New item - occurrence count starts at the in-batch group size
         due_date = calculate_due_date(item['date_logged'], item['priority'])
         contact_obj = get_contact_object(item['assigned'])
 
@@ -536,7 +712,7 @@ def main():
             {'columnId': COL_PRIORITY, 'objectValue': item['priority']},
             {'columnId': COL_MEETING_SOURCE, 'objectValue': item['meeting']},
             {'columnId': COL_DATE_LOGGED, 'value': item['date_logged']},
-            {'columnId': COL_OCCURRENCE_COUNT, 'value': 1}  # Initialize count
+            {'columnId': COL_OCCURRENCE_COUNT, 'value': group_count}
         ]
 
         if contact_obj:
@@ -548,10 +724,10 @@ def main():
         })
 
     # Update occurrence counts for existing items with recurrence comments
+    update_payload = []
     if rows_to_update:
         print(f"\nUpdating occurrence counts for {len(rows_to_update)} existing items...")
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        update_payload = []
         for row in rows_to_update:
             # Add comment documenting the recurrence
             meeting_source = row.get('meeting', 'Meeting')
@@ -566,22 +742,32 @@ def main():
                 ]
             })
 
-        update_url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows'
-        response = requests.put(update_url, headers=headers, json=update_payload)
+    if new_rows:
+        print(f"\nAdding {len(new_rows)} new action items...")
 
+    # Dispatch the occurrence-count PUT and the new-row POST together so
+    # the two HTTP waits overlap instead of running back to back
+    rows_url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows'
+    update_future = post_future = None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if update_payload:
+            body = orjson.dumps(update_payload) if orjson is not None else json.dumps(update_payload).encode()
+            update_future = pool.submit(session.put, rows_url, data=body)
+        if new_rows:
+            body = orjson.dumps(new_rows) if orjson is not None else json.dumps(new_rows).encode()
+            post_future = pool.submit(session.post, rows_url, data=body)
+
+    if update_future is not None:
+        response = update_future.result()
         if response.status_code == 200:
             print(f"  [OK] Updated {len(rows_to_update)} occurrence counts")
         else:
             print(f"  [ERROR] Failed to update: {response.status_code}")
             print(response.text)
 
-    # Add new rows
-    if new_rows:
-        print(f"\nAdding {len(new_rows)} new action items...")
-        url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows'
-        response = requests.post(url, headers=headers, json=new_rows)
-
-        result = response.json()
+    if post_future is not None:
+        response = post_future.result()
+        result = orjson.loads(response.content) if orjson is not None else response.json()
         if response.status_code == 200:
             print(f'  [OK] Added {len(result.get("result", []))} new items!')
         else:
@@ -7,10 +7,37 @@ SAFETY: Validates no duplicates exist before sending to prevent duplicate notifi
 import requests
 import json
 import re
-from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from difflib import SequenceMatcher
 from config import SMARTSHEET_API_TOKEN
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Below this many items the quadratic scan is cheap enough that LSH
+# candidate generation isn't worth its indexing overhead
+LSH_MIN_ITEMS = 200
+
 SHEET_ID = 4528757755826052
 
 # Column IDs
@@ -25,6 +52,10 @@ EXCLUDED_STATUSES = ['complete', 'completed', 'done', 'cancelled', 'canceled', '
 # Duplicate detection threshold
 DUPLICATE_THRESHOLD = 0.60
 
+# Column-ID -> field-name map for the single-pass cell scan in
+# collect_sheet_items
+SCAN_COLUMNS = {COL_STATUS: 'status', COL_ASSIGNED_TO: 'assignee', COL_ACTION_ITEM: 'action'}
+
 # Columns to include in update request (editable by recipient)
 EDITABLE_COLUMNS = [COL_STATUS, COL_NOTES]
 
@@ -55,6 +86,18 @@ NAME_TO_EMAIL = {
     'Shiva': 'shiva@igtsolutions.com',
 }
 
+# Email values pre-lowered once so extract_emails_from_value skips the
+# per-call .lower() on mapped addresses
+NAME_TO_EMAIL_LC = {name: email.lower() for name, email in NAME_TO_EMAIL.items()}
+
+# One compiled alternation scans the whole cell value in C: known names
+# (longest first, so full names win over bare first names) or literal
+# email addresses
+_NAME_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(NAME_TO_EMAIL, key=len, reverse=True))) + r')\b'
+    r'|([\w.+-]+@[\w.-]+)'
+)
+
 # CC recipients on all update requests
 CC_RECIPIENTS = [
     'Leonardo.Declich@flyfrontier.com',
@@ -70,109 +113,252 @@ headers = {
     'Content-Type': 'application/json'
 }
 
+# Persistent session: the HTTPS connection to api.smartsheet.com is
+# reused across the per-assignee POST loop instead of redoing the TLS
+# handshake each call, and 429/5xx responses retry with backoff
+_session = requests.Session()
+_session.headers.update(headers)
+_session.mount('https://', HTTPAdapter(pool_maxsize=16, max_retries=Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=['GET', 'POST'],
+)))
+
+# Only the columns this script reads come back, and link/filter details
+# are stripped - a fraction of the full-sheet payload
+_SHEET_URL = (f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}'
+              f'?columnIds={COL_STATUS},{COL_ASSIGNED_TO},{COL_ACTION_ITEM},{COL_NOTES}'
+              f'&exclude=filteredOutRows,linkInFromCellDetails,linksOutToCellsDetails&level=0')
+
 def get_sheet_data():
     """Get sheet with rows and identify assignees"""
-    url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}'
-    response = requests.get(url, headers=headers)
-    return response.json()
+    response = _session.get(_SHEET_URL)
+    # orjson decodes the raw bytes several times faster than the stdlib
+    # parser behind response.json()
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+def iter_sheet_rows():
+    """Yield sheet rows one at a time
+
+    With ijson installed the response is stream-parsed, so peak memory
+    stays at one row instead of the whole sheet JSON; otherwise falls
+    back to a full fetch.
+    """
+    if ijson is not None:
+        response = _session.get(_SHEET_URL, stream=True)
+        response.raw.decode_content = True  # transparent gzip
+        yield from ijson.items(response.raw, 'rows.item')
+        return
+    yield from get_sheet_data().get('rows', [])
 
 def extract_emails_from_value(value):
     """Extract emails from cell value (handles mixed names and emails)"""
     if not value:
         return []
 
-    emails = set()
-    # Split by comma
-    parts = [p.strip() for p in str(value).split(',')]
-
-    for part in parts:
-        # Check if it's already an email
-        if '@' in part:
-            emails.add(part.lower())
-        # Otherwise look up in name mapping
-        elif part in NAME_TO_EMAIL:
-            emails.add(NAME_TO_EMAIL[part].lower())
-
-    return list(emails)
+    # Single regex pass over the value; also tolerates semicolon, slash,
+    # or whitespace delimiters that the old comma split missed
+    return list({
+        NAME_TO_EMAIL_LC[match.group(1)] if match.group(1) else match.group(2).lower()
+        for match in _NAME_RE.finditer(str(value))
+    })
 
-def group_rows_by_assignee(sheet):
-    """Group row IDs by assignee email, excluding completed rows"""
+def collect_sheet_items(rows):
+    """Single pass over the rows building the assignee grouping and the
+    active/completed action lists for duplicate detection"""
     assignee_rows = defaultdict(list)
+    active_items = []
+    completed_items = []
     skipped_completed = 0
 
-    for row in sheet.get('rows', []):
-        row_id = row['id']
-
-        # Check status first - skip completed rows
-        status = ''
-        assignee_value = None
-        for cell in row['cells']:
-            if cell.get('columnId') == COL_STATUS:
-                status = (cell.get('value') or cell.get('displayValue') or '').lower()
-            if cell.get('columnId') == COL_ASSIGNED_TO:
-                assignee_value = cell.get('value') or cell.get('displayValue')
+    for row in rows:
+        # Single scan: one dict lookup per cell, and the loop stops as
+        # soon as all wanted columns are found
+        found = {}
+        for cell in row.get('cells', []):
+            key = SCAN_COLUMNS.get(cell.get('columnId'))
+            if key:
+                found[key] = cell.get('value') or cell.get('displayValue')
+                if len(found) == len(SCAN_COLUMNS):
+                    break
+        status = (found.get('status') or '').lower()
+        excluded = status in EXCLUDED_STATUSES
+
+        # Collect action text for the duplicate check
+        action = found.get('action') or ''
+        if action:
+            # Lowercased once here; every comparison below reads action_lc
+            item = {'row': row.get('rowNumber'), 'action': action,
+                    'action_lc': action.lower(), 'status': status}
+            if excluded:
+                if status in ('completed', 'complete', 'done'):
+                    completed_items.append(item)
+            else:
+                active_items.append(item)
 
-        # Skip rows with excluded statuses
-        if status in EXCLUDED_STATUSES:
+        # Group actionable rows by assignee
+        if excluded:
             skipped_completed += 1
             continue
-
-        # Add row to assignee's list
+        assignee_value = found.get('assignee')
         if assignee_value:
-            emails = extract_emails_from_value(assignee_value)
-            for email in emails:
+            for email in extract_emails_from_value(assignee_value):
                 if email:
-                    assignee_rows[email].append(row_id)
+                    assignee_rows[email].append(row['id'])
 
     print(f"Skipped {skipped_completed} rows with Completed/Done status")
-    return assignee_rows
+    return assignee_rows, active_items, completed_items
+
+def _score(s1, s2):
+    """Exact similarity ratio for a candidate pair"""
+    if _rf_fuzz is not None:
+        return _rf_fuzz.ratio(s1, s2) / 100.0
+    return SequenceMatcher(None, s1, s2).ratio()
+
+def _minhash(text):
+    """MinHash over 3-gram shingles of a lowercased action string"""
+    mh = MinHash(num_perm=64)
+    for i in range(len(text) - 2):
+        mh.update(text[i:i + 3].encode())
+    return mh
+
+def _lsh_duplicates(active_items, completed_items):
+    """Duplicate detection via MinHash LSH candidate generation
+
+    The LSH index yields candidate pairs in roughly linear time; only
+    those candidates pay the exact ratio confirmation, so large sheets
+    avoid the full O(N^2) comparison.
+    """
+    lsh = MinHashLSH(threshold=0.5, num_perm=64)
+    active_hashes = []
+    for i, item in enumerate(active_items):
+        mh = _minhash(item['action_lc'])
+        active_hashes.append(mh)
+        lsh.insert(f'a{i}', mh)
+    for j, item in enumerate(completed_items):
+        lsh.insert(f'c{j}', _minhash(item['action_lc']))
+
+    duplicates_found = []
+    for i, item in enumerate(active_items):
+        completed_matched = False
+        for key in sorted(lsh.query(active_hashes[i])):
+            idx = int(key[1:])
+            if key[0] == 'a':
+                if idx <= i:
+                    continue
+                other = active_items[idx]
+                ratio = _score(item['action_lc'], other['action_lc'])
+                if ratio >= DUPLICATE_THRESHOLD:
+                    duplicates_found.append({
+                        'row1': item['row'],
+                        'row2': other['row'],
+                        'similarity': f'{ratio:.0%}'
+                    })
+            elif not completed_matched:
+                other = completed_items[idx]
+                ratio = _score(item['action_lc'], other['action_lc'])
+                if ratio >= DUPLICATE_THRESHOLD:
+                    duplicates_found.append({
+                        'row1': item['row'],
+                        'row2': other['row'],
+                        'similarity': f'{ratio:.0%} (vs COMPLETED)'
+                    })
+                    completed_matched = True  # Only flag once per active item
+    return duplicates_found
+
+def _pair_ratio(s1, len1, bag1, s2, len2, bag2):
+    """Similarity ratio with cheap pruning before the quadratic matcher
 
-def check_for_duplicates(sheet):
+    Identical strings score 1.0 outright; the length bound and the
+    character-bag intersection both cap the best achievable ratio, so
+    pairs that cannot reach the threshold never hit SequenceMatcher.
+    """
+    if s1 == s2:
+        return 1.0
+    total = len1 + len2
+    if 2 * min(len1, len2) / total < DUPLICATE_THRESHOLD:
+        return 0.0
+    intersection = sum((bag1 & bag2).values())
+    if 2 * intersection / total < DUPLICATE_THRESHOLD:
+        return 0.0
+    return SequenceMatcher(None, s1, s2).ratio()
+
+def check_for_duplicates(active_items, completed_items):
     """Check for unmarked duplicates - BLOCKS sending if found
 
-    Checks:
+    Items come pre-collected from collect_sheet_items. Checks:
     1. Active items against each other
     2. Active items against completed items (catch re-created tasks)
     """
-    active_items = []
-    completed_items = []
-
-    for row in sheet.get('rows', []):
-        status = ''
-        action = ''
-        for cell in row.get('cells', []):
-            if cell.get('columnId') == COL_STATUS:
-                status = (cell.get('value') or '').lower()
-            if cell.get('columnId') == COL_ACTION_ITEM:
-                action = cell.get('value') or ''
-
-        if action:
-            item = {'row': row.get('rowNumber'), 'action': action, 'status': status}
-            if status in EXCLUDED_STATUSES:
-                if status in ['completed', 'complete', 'done']:
-                    completed_items.append(item)
-            else:
-                active_items.append(item)
-
     duplicates_found = []
 
+    # On large sheets, MinHash LSH keeps candidate generation near
+    # linear instead of scoring every pair
+    if MinHashLSH is not None and len(active_items) + len(completed_items) > LSH_MIN_ITEMS:
+        return _lsh_duplicates(active_items, completed_items)
+
+    # With rapidfuzz installed, both passes collapse into two batched
+    # cdist calls: the whole similarity matrix is computed by the C/SIMD
+    # backend across all cores instead of pair-by-pair in Python
+    if _rf_process is not None:
+        active_strs = [item['action_lc'] for item in active_items]
+        completed_strs = [item['action_lc'] for item in completed_items]
+        cutoff = DUPLICATE_THRESHOLD * 100
+
+        scores = _rf_process.cdist(active_strs, active_strs,
+                                   scorer=_rf_fuzz.ratio, score_cutoff=cutoff, workers=-1)
+        for i, row_scores in enumerate(scores):
+            for j in range(i + 1, len(active_strs)):
+                if row_scores[j] >= cutoff:
+                    duplicates_found.append({
+                        'row1': active_items[i]['row'],
+                        'row2': active_items[j]['row'],
+                        'similarity': f'{row_scores[j] / 100:.0%}'
+                    })
+
+        if completed_strs:
+            scores = _rf_process.cdist(active_strs, completed_strs,
+                                       scorer=_rf_fuzz.ratio, score_cutoff=cutoff, workers=-1)
+            for i, row_scores in enumerate(scores):
+                for j, score in enumerate(row_scores):
+                    if score >= cutoff:
+                        duplicates_found.append({
+                            'row1': active_items[i]['row'],
+                            'row2': completed_items[j]['row'],
+                            'similarity': f'{score / 100:.0%} (vs COMPLETED)'
+                        })
+                        break  # Only flag once per active item
+
+        return duplicates_found
+
+    # Lengths and character bags computed once per item feed the
+    # prefilters in _pair_ratio
+    active_strs = [item['action_lc'] for item in active_items]
+    active_lens = [len(s) for s in active_strs]
+    active_bags = [Counter(s) for s in active_strs]
+    completed_strs = [item['action_lc'] for item in completed_items]
+    completed_lens = [len(s) for s in completed_strs]
+    completed_bags = [Counter(s) for s in completed_strs]
+
     # PASS 1: Check active items against each other
     for i, item1 in enumerate(active_items):
-        for j, item2 in enumerate(active_items):
-            if j <= i:
-                continue
-            ratio = SequenceMatcher(None, item1['action'].lower(), item2['action'].lower()).ratio()
+        for j in range(i + 1, len(active_items)):
+            ratio = _pair_ratio(active_strs[i], active_lens[i], active_bags[i],
+                                active_strs[j], active_lens[j], active_bags[j])
             if ratio >= DUPLICATE_THRESHOLD:
                 duplicates_found.append({
                     'row1': item1['row'],
-                    'row2': item2['row'],
+                    'row2': active_items[j]['row'],
                     'similarity': f'{ratio:.0%}'
                 })
 
     # PASS 2: Check active items against completed items
-    for active in active_items:
-        for completed in completed_items:
-            ratio = SequenceMatcher(None, active['action'].lower(), completed['action'].lower()).ratio()
+    for i, active in enumerate(active_items):
+        for j, completed in enumerate(completed_items):
+            ratio = _pair_ratio(active_strs[i], active_lens[i], active_bags[i],
+                                completed_strs[j], completed_lens[j], completed_bags[j])
             if ratio >= DUPLICATE_THRESHOLD:
                 duplicates_found.append({
                     'row1': active['row'],
@@ -183,37 +369,45 @@ def check_for_duplicates(sheet):
 
     return duplicates_found
 
+# Static portion of the update-request payload, built once at module
+# load; only the recipient and row list vary per call
+_UPDATE_REQUEST_URL = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/updaterequests'
+_UPDATE_REQUEST_STATIC = {
+    'subject': 'FPS Action Item Status Update Required',
+    'message': (
+        'Please review and update the status of your assigned action items.\n\n'
+        'For each item, please:\n'
+        '• Update the Status (New → In Progress → Complete)\n'
+        '• Add any notes or resolution details\n\n'
+        'Thank you for keeping the project tracker current.'
+    ),
+    'ccMe': True,
+    'columnIds': DISPLAY_COLUMNS,
+    'includeAttachments': True,
+    'includeDiscussions': True
+}
+
 def send_update_request(assignee_email, row_ids):
     """Send update request to a single assignee for their rows"""
-    url = f'https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/updaterequests'
-
-    payload = {
-        'sendTo': [{'email': assignee_email}],
-        'subject': 'FPS Action Item Status Update Required',
-        'message': (
-            'Please review and update the status of your assigned action items.\n\n'
-            'For each item, please:\n'
-            '• Update the Status (New → In Progress → Complete)\n'
-            '• Add any notes or resolution details\n\n'
-            'Thank you for keeping the project tracker current.'
-        ),
-        'ccMe': True,
-        'rowIds': row_ids,
-        'columnIds': DISPLAY_COLUMNS,
-        'includeAttachments': True,
-        'includeDiscussions': True
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
+    payload = {**_UPDATE_REQUEST_STATIC,
+               'sendTo': [{'email': assignee_email}],
+               'rowIds': row_ids}
+
+    # data= with a pre-encoded body skips requests' per-call JSON
+    # serialization; the session already carries the Content-Type header
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+    response = _session.post(_UPDATE_REQUEST_URL, data=body)
     return response
 
 def main():
     print("Fetching sheet data...")
-    sheet = get_sheet_data()
+    # One traversal of the (possibly streamed) rows builds both the
+    # assignee grouping and the duplicate-check item lists
+    assignee_rows, active_items, completed_items = collect_sheet_items(iter_sheet_rows())
 
     # SAFETY CHECK: Validate no unmarked duplicates exist
     print("\nValidating no unmarked duplicates...")
-    duplicates = check_for_duplicates(sheet)
+    duplicates = check_for_duplicates(active_items, completed_items)
     if duplicates:
         print("\n" + "=" * 60)
         print("ERROR: UNMARKED DUPLICATES FOUND - ABORTING")
@@ -227,9 +421,6 @@ def main():
 
     print("  [OK] No unmarked duplicates found")
 
-    print("\nGrouping rows by assignee...")
-    assignee_rows = group_rows_by_assignee(sheet)
-
     if not assignee_rows:
         print("No assignees found with email addresses.")
         return
@@ -244,22 +435,28 @@ def main():
     success = 0
     errors = 0
 
-    for assignee_email, row_ids in assignee_rows.items():
-        # Skip CC recipients from receiving their own update request if they have no items
-        if not row_ids:
-            continue
-
-        response = send_update_request(assignee_email, row_ids)
-
-        if response.status_code == 200:
-            result = response.json()
-            request_id = result.get('result', {}).get('id', 'N/A')
-            print(f"  [OK] Sent to {assignee_email} ({len(row_ids)} items) - Request ID: {request_id}")
-            success += 1
-        else:
-            print(f"  [ERROR] {assignee_email}: {response.status_code}")
-            print(f"    {response.json().get('message', response.text)}")
-            errors += 1
+    # Fan the POSTs out over a small thread pool - each call is
+    # network-bound, so up to 8 are in flight at once while the
+    # session's retry policy absorbs any 429s. Skips assignees with no
+    # items (CC recipients shouldn't receive their own update request).
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(send_update_request, email, row_ids): (email, row_ids)
+            for email, row_ids in assignee_rows.items() if row_ids
+        }
+        for future in as_completed(futures):
+            assignee_email, row_ids = futures[future]
+            response = future.result()
+
+            if response.status_code == 200:
+                result = response.json()
+                request_id = result.get('result', {}).get('id', 'N/A')
+                print(f"  [OK] Sent to {assignee_email} ({len(row_ids)} items) - Request ID: {request_id}")
+                success += 1
+            else:
+                print(f"  [ERROR] {assignee_email}: {response.status_code}")
+                print(f"    {response.json().get('message', response.text)}")
+                errors += 1
 
     print(f"\nCompleted: {success} sent, {errors} errors")
     print(f"\nUpdate requests are now visible in Smartsheet:")
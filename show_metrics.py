@@ -8,21 +8,27 @@ from datetime import datetime
 from config import SMARTSHEET_API_TOKEN, TASK_SHEET_ID
 
 
+def _pct(value):
+    """Coerce a summary value to a 0-100 percentage, or None if not numeric"""
+    try:
+        return float(value) * 100
+    except (TypeError, ValueError):
+        return None
+
+
 def get_metrics():
     """Fetch and display all metrics from the task sheet"""
 
     client = smartsheet.Smartsheet(SMARTSHEET_API_TOKEN)
     sheet = client.Sheets.get_sheet(TASK_SHEET_ID, include='summary')
 
-    # Build a dict of summary fields
+    # Flat title -> value and title -> id dicts; no nested dict per
+    # field and no default-dict allocation on lookup misses
     metrics = {}
+    field_ids = {}
     for field in sheet.summary.fields:
-        value = field.display_value if field.display_value else field.object_value
-        metrics[field.title] = {
-            'value': value,
-            'id': field.id,
-            'formula': field.formula
-        }
+        metrics[field.title] = field.display_value if field.display_value else field.object_value
+        field_ids[field.title] = field.id
 
     # Print formatted output
     print()
@@ -34,10 +40,10 @@ def get_metrics():
     # KPI Section
     print("\n--- KEY PERFORMANCE INDICATORS ---\n")
 
-    project_health = metrics.get('Project Health', {}).get('value', 'N/A')
-    variance = metrics.get('Project Variance', {}).get('value', 'N/A')
-    target = metrics.get('Target Go-Live', {}).get('value', 'N/A')
-    original = metrics.get('Original Go-Live', {}).get('value', 'N/A')
+    project_health = metrics.get('Project Health', 'N/A')
+    variance = metrics.get('Project Variance', 'N/A')
+    target = metrics.get('Target Go-Live', 'N/A')
+    original = metrics.get('Original Go-Live', 'N/A')
 
     # Parse date objects
     if isinstance(target, dict):
@@ -53,10 +59,10 @@ def get_metrics():
     # Health Counts
     print("\n--- HEALTH DISTRIBUTION ---\n")
 
-    red = metrics.get('Total Red', {}).get('value', 0)
-    yellow = metrics.get('Total Yellow', {}).get('value', 0)
-    green = metrics.get('Total Green', {}).get('value', 0)
-    total = metrics.get('Total Tasks', {}).get('value', 0)
+    red = metrics.get('Total Red', 0)
+    yellow = metrics.get('Total Yellow', 0)
+    green = metrics.get('Total Green', 0)
+    total = metrics.get('Total Tasks', 0)
 
     print(f"  Red:     {red} tasks")
     print(f"  Yellow:  {yellow} tasks")
@@ -66,12 +72,12 @@ def get_metrics():
     # Completion
     print("\n--- COMPLETION STATUS ---\n")
 
-    pct_complete = metrics.get('% Complete', {}).get('value', 0)
+    pct_complete = metrics.get('% Complete', 0)
     if isinstance(pct_complete, (int, float)):
         pct_complete = f"{float(pct_complete) * 100:.1f}%"
 
-    overdue = metrics.get('Overdue Count', {}).get('value', 0)
-    max_var = metrics.get('Max Variance', {}).get('value', 0)
+    overdue = metrics.get('Overdue Count', 0)
+    max_var = metrics.get('Max Variance', 0)
 
     print(f"  % Complete:     {pct_complete}")
     print(f"  Overdue Tasks:  {overdue}")
@@ -83,18 +89,10 @@ def get_metrics():
     vendors = ['FPS', 'IGT', 'Cognigy', 'CSG', 'Frontier']
 
     for vendor in vendors:
-        field_name = f'{vendor} Complete'
-        pct = metrics.get(field_name, {}).get('value', 0)
-
-        # Handle string values like "0.42857"
-        if isinstance(pct, str):
-            try:
-                pct = float(pct)
-            except:
-                pct = 0
-
-        if isinstance(pct, (int, float)):
-            pct_val = float(pct) * 100
+        # _pct handles string values like "0.42857" in one place
+        pct_val = _pct(metrics.get(f'{vendor} Complete', 0))
+
+        if pct_val is not None:
             filled = int(pct_val / 10)
             empty = 10 - filled
             bar = "#" * filled + "-" * empty
@@ -112,9 +110,8 @@ def get_metrics():
     ]
 
     for field_name in important_fields:
-        field = metrics.get(field_name, {})
-        if field:
-            print(f"  {field_name:20} ID: {field.get('id')}")
+        if field_name in field_ids:
+            print(f"  {field_name:20} ID: {field_ids[field_name]}")
 
     print("\n" + "=" * 70)
     print(f"  Sheet ID: {TASK_SHEET_ID}")
@@ -3,20 +3,49 @@ Smartsheet SDK Client - Using Official Python SDK
 Handles API operations with proper rate limiting and error handling
 """
 
+import json
 import smartsheet
+import requests
 import time
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
+from urllib3.util.retry import Retry
 from config import SMARTSHEET_API_TOKEN, TASK_SHEET_ID
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class SmartsheetSDKClient:
     """Client using official Smartsheet Python SDK"""
 
-    def __init__(self, api_token: str = None):
+    def __init__(self, api_token: str = None, cache_ttl: int = 60):
         self.api_token = api_token or SMARTSHEET_API_TOKEN
+        self.cache_ttl = cache_ttl
         self.client = smartsheet.Smartsheet(self.api_token)
         self.client.errors_as_exceptions(True)
 
+        # Pooled session for the direct REST calls the SDK lacks, so
+        # dashboard operations reuse one HTTPS connection
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json"
+        })
+        self._session.mount('https://', HTTPAdapter(pool_maxsize=16, max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            allowed_methods=['GET', 'POST', 'PUT'],
+        )))
+
+        # Sheet fetches are cached for cache_ttl seconds so resolving
+        # several column/field IDs costs one download, not one each
+        self._sheet_cache = {}  # (sheet_id, include) -> (timestamp, sheet)
+
         # Track created objects for reference/rollback
         self.created_objects = {
             "reports": [],
@@ -25,12 +54,25 @@ class SmartsheetSDKClient:
         }
 
     def get_sheet(self, sheet_id: int, include: List[str] = None) -> smartsheet.models.Sheet:
-        """Get sheet with optional includes"""
+        """Get sheet with optional includes, cached for cache_ttl seconds"""
+        include_key = ','.join(include) if include else None
+        cache_key = (sheet_id, include_key)
+        cached = self._sheet_cache.get(cache_key)
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            return cached[1]
+
         kwargs = {}
-        if include:
-            kwargs['include'] = ','.join(include)
+        if include_key:
+            kwargs['include'] = include_key
+
+        sheet = self.client.Sheets.get_sheet(sheet_id, **kwargs)
+        self._sheet_cache[cache_key] = (time.time(), sheet)
+        return sheet
 
-        return self.client.Sheets.get_sheet(sheet_id, **kwargs)
+    def invalidate(self, sheet_id: int) -> None:
+        """Drop cached copies of a sheet, e.g. after mutating it"""
+        for key in [k for k in self._sheet_cache if k[0] == sheet_id]:
+            del self._sheet_cache[key]
 
     def get_sheet_as_dict(self, sheet_id: int, include: List[str] = None) -> Dict:
         """Get sheet and convert to dictionary"""
@@ -79,13 +121,6 @@ class SmartsheetSDKClient:
         Create a new dashboard (sight) using direct API call
         The SDK doesn't have a create method, so we use requests directly
         """
-        import requests
-
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
-        }
-
         payload = {"name": name}
 
         if workspace_id:
@@ -95,10 +130,12 @@ class SmartsheetSDKClient:
         else:
             url = "https://api.smartsheet.com/2.0/sights"
 
-        response = requests.post(url, headers=headers, json=payload)
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        response = self._session.post(url, data=body)
 
         if response.status_code in [200, 201]:
-            result = response.json().get("result", {})
+            decoded = orjson.loads(response.content) if orjson is not None else response.json()
+            result = decoded.get("result", {})
             self.created_objects["dashboards"].append({
                 "id": result.get("id"),
                 "name": result.get("name")
@@ -144,27 +181,29 @@ class SmartsheetSDKClient:
         The API accepts widgets as an array in the sight update.
         This is the primary way to add widgets to a dashboard.
         """
-        import requests
-
-        # First, get the current dashboard to preserve its name
-        current = self.get_dashboard(sight_id)
+        # The API requires the name field. Prefer the caller's name,
+        # then the name recorded when this client created the dashboard;
+        # only fall back to a GET round-trip when both are missing.
+        if name is None:
+            for dashboard in self.created_objects["dashboards"]:
+                if dashboard["id"] == sight_id:
+                    name = dashboard["name"]
+                    break
+        if name is None:
+            name = self.get_dashboard(sight_id).name
 
         url = f"https://api.smartsheet.com/2.0/sights/{sight_id}"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
-        }
 
-        # The API requires the name field
         payload = {
-            "name": name or current.name,
+            "name": name,
             "widgets": widgets
         }
 
-        response = requests.put(url, headers=headers, json=payload)
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        response = self._session.put(url, data=body)
 
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content) if orjson is not None else response.json()
         else:
             error_msg = f"Failed to update dashboard: {response.status_code} - {response.text}"
             raise Exception(error_msg)
@@ -202,7 +241,6 @@ class SmartsheetSDKClient:
 
     def save_created_objects(self, filename: str = "created_objects.json"):
         """Save created objects to JSON file"""
-        import json
         with open(filename, 'w') as f:
             json.dump(self.created_objects, f, indent=2)
         print(f"Created objects saved to {filename}")
@@ -226,3 +264,25 @@ class SmartsheetSDKClient:
                 print(f"  Failed to delete report {report['id']}: {e}")
 
         print("Rollback complete")
+
+
+class DashboardBuilder:
+    """Accumulates dashboard widgets client-side and flushes them in one call
+
+    Building a dashboard widget-by-widget costs an API round-trip per
+    widget; queueing them here and committing once reduces that to a
+    single update.
+    """
+
+    def __init__(self, name: str = None):
+        self.name = name
+        self.widgets: List[Dict] = []
+
+    def add(self, widget: Dict) -> "DashboardBuilder":
+        """Queue a widget; returns self so calls can chain"""
+        self.widgets.append(widget)
+        return self
+
+    def commit(self, client: SmartsheetSDKClient, sight_id: int) -> Any:
+        """Push all queued widgets in one update_dashboard_with_widgets call"""
+        return client.update_dashboard_with_widgets(sight_id, self.widgets, name=self.name)
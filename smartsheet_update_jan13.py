@@ -6,35 +6,176 @@ Target: Jan 13, 2026 Baseline
 This script updates the schedule with corrected baselines.
 """
 
-import smartsheet
+import asyncio
+import functools
+import json
 import os
+import random
+import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # Initialize client
 SMARTSHEET_TOKEN = os.environ.get('SMARTSHEET_ACCESS_TOKEN')
 if not SMARTSHEET_TOKEN:
     raise ValueError("Set SMARTSHEET_ACCESS_TOKEN environment variable")
 
-client = smartsheet.Smartsheet(SMARTSHEET_TOKEN)
-client.errors_as_exceptions(True)
-
 # Sheet ID - UPDATE THIS
 SHEET_ID = 0  # <-- Enter your sheet ID here
 
-def get_column_ids():
-    """Get column IDs from the sheet"""
-    sheet = client.Sheets.get_sheet(SHEET_ID)
-
-    column_map = {}
-    for col in sheet.columns:
-        column_map[col.title] = col.id
+# Persistent session: connection keepalive skips the TLS handshake on
+# repeat calls, and the mounted retry policy handles rate limiting
+session = requests.Session()
+session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=['GET', 'PUT'],
+)))
+
+async def _put_batch(session, sem, url, batch, attempts=5):
+    """PUT one row batch, gated by the shared semaphore, retrying 429s"""
+    async with sem:
+        for attempt in range(attempts):
+            async with session.put(url, json=batch) as response:
+                if response.status == 429 and attempt < attempts - 1:
+                    # Exponential backoff with jitter so retries don't align
+                    await asyncio.sleep(2 ** attempt + random.random())
+                    continue
+                response.raise_for_status()
+                return len(batch)
+
+async def _apply_batches(batches):
+    """Fire all row batches concurrently over one pooled connection"""
+    url = f"https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows"
+    sem = asyncio.Semaphore(10)  # stay well inside the 300 req/min API limit
+    headers = {
+        'Authorization': f'Bearer {SMARTSHEET_TOKEN}',
+        'Content-Type': 'application/json'
+    }
+    connector = aiohttp.TCPConnector(limit=10, limit_per_host=10,
+                                     keepalive_timeout=60, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=headers) as session:
+        return await asyncio.gather(
+            *(_put_batch(session, sem, url, batch) for batch in batches),
+            return_exceptions=True
+        )
+
+COLUMN_ID_CACHE = '.col_ids.json'
+
+@functools.lru_cache(maxsize=1)
+def get_needed_column_ids(names=('Baseline Finish', 'Baseline Start')):
+    """Resolve just the column IDs this script uses, persisted across runs"""
+    # Column IDs never change, so a prior run's answer short-circuits the GET
+    try:
+        with open(COLUMN_ID_CACHE) as f:
+            cached = json.load(f)
+        if all(name in cached for name in names):
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    # /sheets/{id}/columns returns column metadata only -- no cell data
+    url = f"https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/columns?pageSize=200"
+    response = session.get(url, headers={'Authorization': f'Bearer {SMARTSHEET_TOKEN}'})
+    response.raise_for_status()
+    all_columns = {col['title']: col['id'] for col in response.json()['data']}
+
+    column_map = {name: all_columns[name] for name in names if name in all_columns}
 
     print("Column IDs found:")
     for name, cid in column_map.items():
         print(f"  {name}: {cid}")
 
+    with open(COLUMN_ID_CACHE, 'w') as f:
+        json.dump(column_map, f)
+
     return column_map
 
+# Baseline updates for Jan 13 target, compressed to (row_id, date_code)
+# pairs -- BASELINE_DATES expands each code to (baseline_finish, baseline_start)
+BASELINE_DATES = {
+    'A': ('2025-12-14', '2025-12-14'),
+    'B': ('2025-12-14', '2025-12-07'),
+    'C': ('2025-12-18', '2025-12-18'),
+    'D': ('2025-12-25', '2025-12-14'),
+    'E': ('2025-12-18', '2025-12-14'),
+    'F': ('2025-12-21', '2025-12-21'),
+    'G': ('2025-12-25', '2025-12-21'),
+    'H': ('2025-12-23', '2025-12-23'),
+    'I': ('2025-12-25', '2025-12-25'),
+    'J': ('2026-01-13', '2025-12-28'),
+    'K': ('2026-01-11', '2025-12-28'),
+    'L': ('2026-01-12', '2026-01-11'),
+    'M': ('2026-01-13', '2026-01-13'),
+}
+
+BASELINE_ROWS = [
+    (2910010229591940, 'A'),  # Row 17: Cognigy Staging Dependencies Phase 2
+    (552926471196548, 'A'),  # Row 19: Connect SIP trunks
+    (1282035400249220, 'A'),  # Row 20: Assign numbers
+    (6911534934462340, 'A'),  # Row 21: Create SIP flow
+    (7413609856962436, 'A'),  # Row 22: IGT Staging Dependencies Complete
+    (3930626191724420, 'A'),  # Row 23: Configure 800 number for SIP REFER for C
+    (6182426005409668, 'A'),  # Row 24: Set up SIP trunks via NICE CXone
+    (1678826378039172, 'A'),  # Row 25: Configure the Signal API
+    (7308325912252292, 'A'),  # Row 26: Complete queue mapping
+    (2804726284881796, 'A'),  # Row 27: Provision 8 DID test numbers
+    (1784110322749316, 'A'),  # Row 28: FPS Development - Knowledgebase
+    (8434225819094916, 'A'),  # Row 32: Tune LLM responses for accuracy and clar
+    (6287709950119812, 'B'),  # Row 33: Frontier Production Dependencies Complet
+    (7871275865673604, 'B'),  # Row 34: Secure Architecture Review Board (ARB) a
+    (4035910136434564, 'C'),  # Row 36: FPS Development - Partner Integrations
+    (4493576145145732, 'C'),  # Row 37: Implement required partner API integrati
+    (6745375958830980, 'C'),  # Row 38: Set up the necessary data exchange endpo
+    (8331586707591044, 'D'),  # Row 39: QA & Testing Phase
+    (376735439196036, 'E'),  # Row 40: FPS QA Testing
+    (16364796841860, 'E'),  # Row 41: Execute the full end-to-end Agentic Voic
+    (8997175772516228, 'E'),  # Row 42: Perform all testing within the QA enviro
+    (4880335066566532, 'F'),  # Row 43: CSG Staging Dependencies Complete (Testi
+    (2268164610527108, 'F'),  # Row 44: Configure IVR call routing using SIP REF
+    (4519964424212356, 'F'),  # Row 45: Set up the 800 test number for the direc
+    (2628535252881284, 'F'),  # Row 46: Cognigy Production Dependencies Complete
+    (3394064517369732, 'F'),  # Row 47: Provision the Production 800 number
+    (5645864331054980, 'F'),  # Row 48: Set up SIP trunks to Cognigy
+    (1142264703684484, 'F'),  # Row 49: Configure the Signal API
+    (6771764237897604, 'F'),  # Row 50: Provision 2 DID test numbers
+    (7132134880251780, 'F'),  # Row 51: IGT Production Dependencies Complete
+    (2831114563948420, 'F'),  # Row 52: Provision the 800 number for production
+    (5082914377633668, 'F'),  # Row 53: Set up SIP trunks to Cognigy
+    (579314750263172, 'F'),  # Row 54: Configure the Signal API
+    (7897664144740228, 'F'),  # Row 55: Provision 2 DID test numbers
+    (1502635346038660, 'G'),  # Row 56: Frontier UAT Testing
+    (1705214657105796, 'G'),  # Row 57: Execute the full end-to-end Agentic Voic
+    (7334714191318916, 'G'),  # Row 58: Perform all testing within the UAT envir
+    (6006234973409156, 'H'),  # Row 59: CSG Production Dependencies Complete (UA
+    (8202281348435844, 'H'),  # Row 60: Configure Production IVR call routing us
+    (883931953958788, 'H'),  # Row 61: Set the routing percentage for �Unknown�
+    (3754435159723908, 'I'),  # Row 62: Frontier UAT Approval
+    (5387531581329284, 'I'),  # Row 63: Obtain formal UAT sign-off
+    (8258034787094404, 'J'),  # Row 64: Production Deployment
+    (939685392617348, 'K'),  # Row 65: Frontier Production Dependencies Complet
+    (3135731767644036, 'K'),  # Row 66: Provision Production Azure AI Speech STT
+    (7639331395014532, 'K'),  # Row 67: Provision Production Azure AI Speech TTS
+    (2009831860801412, 'K'),  # Row 68: Set up Production OpenAI LLM credentials
+    (5443285019987844, 'L'),  # Row 69: Frontier Production Go-Live Approval (CA
+    (6513431488171908, 'L'),  # Row 70: Present the deployment plan to the Chang
+    (4261631674486660, 'L'),  # Row 71: Secure final approval for the Production
+    (3191485206302596, 'M'),  # Row 72: FPS Production Deployment
+    (8765231301857156, 'M'),  # Row 73: Deploy the solution to Production
+    (180244512182148, 'M'),  # Row 74: Perform sanity testing to confirm core f
+    (4683844139552644, 'M'),  # Row 75: Initiate post-launch monitoring to ensur
+]
+
+
 def update_baselines(column_map):
     """Update baseline dates"""
 
@@ -45,363 +186,43 @@ def update_baselines(column_map):
         print("ERROR: Could not find 'Baseline Finish' column")
         return
 
-    updates = []
-
-    # Baseline updates for Jan 13 target
     baseline_updates = [
-        # Row 17: Cognigy Staging Dependencies Phase 2
-        {
-            'row_id': 2910010229591940,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 19: Connect SIP trunks
-        {
-            'row_id': 552926471196548,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 20: Assign numbers
-        {
-            'row_id': 1282035400249220,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 21: Create SIP flow
-        {
-            'row_id': 6911534934462340,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 22: IGT Staging Dependencies Complete
-        {
-            'row_id': 7413609856962436,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 23: Configure 800 number for SIP REFER for C
-        {
-            'row_id': 3930626191724420,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 24: Set up SIP trunks via NICE CXone
-        {
-            'row_id': 6182426005409668,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 25: Configure the Signal API
-        {
-            'row_id': 1678826378039172,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 26: Complete queue mapping
-        {
-            'row_id': 7308325912252292,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 27: Provision 8 DID test numbers
-        {
-            'row_id': 2804726284881796,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 28: FPS Development - Knowledgebase
-        {
-            'row_id': 1784110322749316,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 32: Tune LLM responses for accuracy and clar
-        {
-            'row_id': 8434225819094916,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 33: Frontier Production Dependencies Complet
-        {
-            'row_id': 6287709950119812,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-07',
-        },
-        # Row 34: Secure Architecture Review Board (ARB) a
-        {
-            'row_id': 7871275865673604,
-            'baseline_finish': '2025-12-14',
-            'baseline_start': '2025-12-07',
-        },
-        # Row 36: FPS Development - Partner Integrations
-        {
-            'row_id': 4035910136434564,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-18',
-        },
-        # Row 37: Implement required partner API integrati
-        {
-            'row_id': 4493576145145732,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-18',
-        },
-        # Row 38: Set up the necessary data exchange endpo
-        {
-            'row_id': 6745375958830980,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-18',
-        },
-        # Row 39: QA & Testing Phase
-        {
-            'row_id': 8331586707591044,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 40: FPS QA Testing
-        {
-            'row_id': 376735439196036,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 41: Execute the full end-to-end Agentic Voic
-        {
-            'row_id': 16364796841860,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 42: Perform all testing within the QA enviro
-        {
-            'row_id': 8997175772516228,
-            'baseline_finish': '2025-12-18',
-            'baseline_start': '2025-12-14',
-        },
-        # Row 43: CSG Staging Dependencies Complete (Testi
-        {
-            'row_id': 4880335066566532,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 44: Configure IVR call routing using SIP REF
-        {
-            'row_id': 2268164610527108,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 45: Set up the 800 test number for the direc
-        {
-            'row_id': 4519964424212356,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 46: Cognigy Production Dependencies Complete
-        {
-            'row_id': 2628535252881284,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 47: Provision the Production 800 number
-        {
-            'row_id': 3394064517369732,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 48: Set up SIP trunks to Cognigy
-        {
-            'row_id': 5645864331054980,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 49: Configure the Signal API
-        {
-            'row_id': 1142264703684484,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 50: Provision 2 DID test numbers
-        {
-            'row_id': 6771764237897604,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 51: IGT Production Dependencies Complete
-        {
-            'row_id': 7132134880251780,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 52: Provision the 800 number for production
-        {
-            'row_id': 2831114563948420,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 53: Set up SIP trunks to Cognigy
-        {
-            'row_id': 5082914377633668,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 54: Configure the Signal API
-        {
-            'row_id': 579314750263172,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 55: Provision 2 DID test numbers
-        {
-            'row_id': 7897664144740228,
-            'baseline_finish': '2025-12-21',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 56: Frontier UAT Testing
-        {
-            'row_id': 1502635346038660,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 57: Execute the full end-to-end Agentic Voic
-        {
-            'row_id': 1705214657105796,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 58: Perform all testing within the UAT envir
-        {
-            'row_id': 7334714191318916,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-21',
-        },
-        # Row 59: CSG Production Dependencies Complete (UA
-        {
-            'row_id': 6006234973409156,
-            'baseline_finish': '2025-12-23',
-            'baseline_start': '2025-12-23',
-        },
-        # Row 60: Configure Production IVR call routing us
-        {
-            'row_id': 8202281348435844,
-            'baseline_finish': '2025-12-23',
-            'baseline_start': '2025-12-23',
-        },
-        # Row 61: Set the routing percentage for �Unknown�
-        {
-            'row_id': 883931953958788,
-            'baseline_finish': '2025-12-23',
-            'baseline_start': '2025-12-23',
-        },
-        # Row 62: Frontier UAT Approval
-        {
-            'row_id': 3754435159723908,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-25',
-        },
-        # Row 63: Obtain formal UAT sign-off
-        {
-            'row_id': 5387531581329284,
-            'baseline_finish': '2025-12-25',
-            'baseline_start': '2025-12-25',
-        },
-        # Row 64: Production Deployment
-        {
-            'row_id': 8258034787094404,
-            'baseline_finish': '2026-01-13',
-            'baseline_start': '2025-12-28',
-        },
-        # Row 65: Frontier Production Dependencies Complet
-        {
-            'row_id': 939685392617348,
-            'baseline_finish': '2026-01-11',
-            'baseline_start': '2025-12-28',
-        },
-        # Row 66: Provision Production Azure AI Speech STT
-        {
-            'row_id': 3135731767644036,
-            'baseline_finish': '2026-01-11',
-            'baseline_start': '2025-12-28',
-        },
-        # Row 67: Provision Production Azure AI Speech TTS
-        {
-            'row_id': 7639331395014532,
-            'baseline_finish': '2026-01-11',
-            'baseline_start': '2025-12-28',
-        },
-        # Row 68: Set up Production OpenAI LLM credentials
-        {
-            'row_id': 2009831860801412,
-            'baseline_finish': '2026-01-11',
-            'baseline_start': '2025-12-28',
-        },
-        # Row 69: Frontier Production Go-Live Approval (CA
-        {
-            'row_id': 5443285019987844,
-            'baseline_finish': '2026-01-12',
-            'baseline_start': '2026-01-11',
-        },
-        # Row 70: Present the deployment plan to the Chang
-        {
-            'row_id': 6513431488171908,
-            'baseline_finish': '2026-01-12',
-            'baseline_start': '2026-01-11',
-        },
-        # Row 71: Secure final approval for the Production
-        {
-            'row_id': 4261631674486660,
-            'baseline_finish': '2026-01-12',
-            'baseline_start': '2026-01-11',
-        },
-        # Row 72: FPS Production Deployment
-        {
-            'row_id': 3191485206302596,
-            'baseline_finish': '2026-01-13',
-            'baseline_start': '2026-01-13',
-        },
-        # Row 73: Deploy the solution to Production
-        {
-            'row_id': 8765231301857156,
-            'baseline_finish': '2026-01-13',
-            'baseline_start': '2026-01-13',
-        },
-        # Row 74: Perform sanity testing to confirm core f
-        {
-            'row_id': 180244512182148,
-            'baseline_finish': '2026-01-13',
-            'baseline_start': '2026-01-13',
-        },
-        # Row 75: Initiate post-launch monitoring to ensur
-        {
-            'row_id': 4683844139552644,
-            'baseline_finish': '2026-01-13',
-            'baseline_start': '2026-01-13',
-        },
+        {'row_id': rid,
+         'baseline_finish': BASELINE_DATES[code][0],
+         'baseline_start': BASELINE_DATES[code][1]}
+        for rid, code in BASELINE_ROWS
     ]
 
-    # Build row updates
-    for update in baseline_updates:
-        row = smartsheet.models.Row()
-        row.id = update['row_id']
-
-        # Baseline Finish
-        row.cells.append({
-            'column_id': baseline_finish_col,
-            'value': update['baseline_finish']
-        })
-
-        # Baseline Start (if provided)
-        if update['baseline_start'] and baseline_start_col:
-            row.cells.append({
-                'column_id': baseline_start_col,
-                'value': update['baseline_start']
-            })
-
-        updates.append(row)
-
-    # Apply updates in batches of 50
-    print(f"Applying {len(updates)} baseline updates...")
+    # Build raw cell payloads as plain dicts -- no per-row SDK model validation
+    rows_json = [
+        {'id': update['row_id'], 'cells':
+            [{'columnId': baseline_finish_col, 'value': update['baseline_finish']}] +
+            ([{'columnId': baseline_start_col, 'value': update['baseline_start']}]
+             if update['baseline_start'] and baseline_start_col else [])}
+        for update in baseline_updates
+    ]
 
-    for i in range(0, len(updates), 50):
-        batch = updates[i:i+50]
-        result = client.Sheets.update_rows(SHEET_ID, batch)
-        print(f"  Updated rows {i+1} to {min(i+50, len(updates))}")
+    # Smartsheet accepts up to 500 rows per PUT, so all 55 updates fit in one request
+    batches = [rows_json[i:i+500] for i in range(0, len(rows_json), 500)]
+    print(f"Applying {len(rows_json)} baseline updates in {len(batches)} request(s)...")
+
+    if aiohttp is not None:
+        results = asyncio.run(_apply_batches(batches))
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"  ERROR in batch {i+1}: {result}")
+            else:
+                print(f"  Updated batch {i+1}: {result} rows")
+    else:
+        url = f"https://api.smartsheet.com/2.0/sheets/{SHEET_ID}/rows"
+        headers = {
+            'Authorization': f'Bearer {SMARTSHEET_TOKEN}',
+            'Content-Type': 'application/json'
+        }
+        for i, batch in enumerate(batches):
+            response = session.put(url, json=batch, headers=headers)
+            response.raise_for_status()
+            print(f"  Updated batch {i+1}: {len(batch)} rows")
 
     print("Baseline updates complete!")
 
@@ -418,7 +239,7 @@ def main():
         print("You can find it in the sheet URL or properties")
         return
 
-    column_map = get_column_ids()
+    column_map = get_needed_column_ids()
     update_baselines(column_map)
 
     print("\n" + "=" * 60)
@@ -4,27 +4,64 @@ Compares contracted milestones from FPS Statement of Work against actual schedul
 """
 
 import json
+import sys
 from datetime import datetime, timedelta
-from collections import defaultdict
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 def load_schedule():
     """Load current schedule"""
-    with open('sheet_data_audit.json', 'r') as f:
-        return json.load(f)
+    with open('sheet_data_audit.json', 'rb') as f:
+        data = f.read()
+    # orjson parses the audit dump several times faster than stdlib json
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def parse_date(date_str):
-    if not date_str:
+ANALYSIS_COLUMNS = ('Tasks', 'End Date', 'Assigned To', 'Status', 'Health', 'Notes', 'row_number')
+
+
+def to_columns(tasks):
+    """Transpose the task list to a columnar dict-of-lists (SoA)"""
+    return {k: [t.get(k) for t in tasks] for k in ANALYSIS_COLUMNS}
+
+
+def index_by_owner(cols):
+    """Index task positions by owner in a single pass"""
+    by_owner = {}
+    for i, owner in enumerate(cols['Assigned To']):
+        by_owner.setdefault(owner or 'N/A', []).append(i)
+    return by_owner
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(s):
+    if not s:
         return None
     try:
-        if 'T' in str(date_str):
-            return datetime.strptime(str(date_str).split('T')[0], '%Y-%m-%d')
-        return datetime.strptime(str(date_str), '%Y-%m-%d')
-    except:
+        # fromisoformat is C-level and far faster than strptime; the [:10]
+        # slice drops any 'T...' time suffix without a split() allocation
+        return datetime.fromisoformat(s[:10])
+    except ValueError:
         return None
 
 
+def parse_date(date_str):
+    # Schedules cluster on a handful of dates, so cache by exact string
+    return _parse_cached(str(date_str) if date_str else '')
+
+
 # SOW Contracted Milestones (from Statement of Work dated 11/20/2025)
 SOW_MILESTONES = {
     # Development Phase
@@ -77,141 +114,192 @@ TASK_TO_SOW_MAP = {
     "FPS Production Deployment": "FPS Production Deployment",
 }
 
+# Lowercased map entries precomputed once at import; with pyahocorasick
+# installed every schedule name is matched in a single scan of the task name
+_TASK_MAP_LOWER = [(name.lower(), name, sow) for name, sow in TASK_TO_SOW_MAP.items()]
 
-def compare_schedule_to_sow(tasks):
+if ahocorasick is not None:
+    _TASK_AUTOMATON = ahocorasick.Automaton()
+    for _lower, _name, _sow in _TASK_MAP_LOWER:
+        _TASK_AUTOMATON.add_word(_lower, (_name, _sow))
+    _TASK_AUTOMATON.make_automaton()
+else:
+    _TASK_AUTOMATON = None
+
+
+def match_sow_milestone(task_name_lower):
+    """Find the first SOW mapping whose schedule name appears in the task name"""
+    if _TASK_AUTOMATON is not None:
+        for _, (schedule_name, sow_name) in _TASK_AUTOMATON.iter(task_name_lower):
+            return schedule_name, sow_name
+        return None
+    for lower, schedule_name, sow_name in _TASK_MAP_LOWER:
+        if lower in task_name_lower:
+            return schedule_name, sow_name
+    return None
+
+
+def compare_schedule_to_sow(cols):
     """Compare current schedule to SOW milestones"""
-    print("\n" + "=" * 90)
-    print("  SOW vs CURRENT SCHEDULE COMPARISON")
-    print("  Statement of Work dated: November 20, 2025")
-    print("=" * 90)
+    out = []
+    w = out.append
+    w("\n" + "=" * 90)
+    w("  SOW vs CURRENT SCHEDULE COMPARISON")
+    w("  Statement of Work dated: November 20, 2025")
+    w("=" * 90)
 
-    print("\n  PROJECT GOAL FROM SOW:")
-    print('  "Deploy the Agentic Voicebot with the MVP feature set during the week of Jan 7-14"')
-    print("  Contracted Go-Live: January 7-14, 2026")
+    w("\n  PROJECT GOAL FROM SOW:")
+    w('  "Deploy the Agentic Voicebot with the MVP feature set during the week of Jan 7-14"')
+    w("  Contracted Go-Live: January 7-14, 2026")
 
     comparisons = []
 
-    # Find matching tasks
-    for task in tasks:
-        task_name = task['Tasks']
-        end_date = parse_date(task.get('End Date'))
-
-        # Check if this task matches a SOW milestone
-        for schedule_name, sow_name in TASK_TO_SOW_MAP.items():
-            if schedule_name.lower() in task_name.lower():
-                sow_date = SOW_MILESTONES.get(sow_name)
-                if sow_date and end_date:
-                    variance = (end_date - sow_date).days
-                    comparisons.append({
-                        'task': task_name,
-                        'sow_name': sow_name,
-                        'sow_date': sow_date,
-                        'current_date': end_date,
-                        'variance': variance,
-                        'assigned': task.get('Assigned To', ''),
-                        'status': task.get('Status', ''),
-                        'row': task['row_number']
-                    })
-                break
+    # Find matching tasks -- zipped column lists, no per-row dict lookups
+    for task_name, end_raw, assigned, status, row in zip(
+            cols['Tasks'], cols['End Date'], cols['Assigned To'],
+            cols['Status'], cols['row_number']):
+        end_date = parse_date(end_raw)
+
+        # Check if this task matches a SOW milestone (lowercase once per task)
+        match = match_sow_milestone(task_name.lower())
+        if match:
+            schedule_name, sow_name = match
+            sow_date = SOW_MILESTONES.get(sow_name)
+            if sow_date and end_date:
+                variance = (end_date - sow_date).days
+                comparisons.append({
+                    'task': task_name,
+                    'sow_name': sow_name,
+                    'sow_date': sow_date,
+                    'current_date': end_date,
+                    'variance': variance,
+                    'assigned': assigned or '',
+                    'status': status or '',
+                    'row': row
+                })
 
     # Sort by SOW date
     comparisons.sort(key=lambda x: x['sow_date'])
 
-    print(f"\n  {'Milestone':<45} | {'SOW Date':^10} | {'Current':^10} | {'Slip':^6} | {'Owner':<10}")
-    print(f"  {'-'*45}-+-{'-'*10}-+-{'-'*10}-+-{'-'*6}-+-{'-'*10}")
+    w(f"\n  {'Milestone':<45} | {'SOW Date':^10} | {'Current':^10} | {'Slip':^6} | {'Owner':<10}")
+    w(f"  {'-'*45}-+-{'-'*10}-+-{'-'*10}-+-{'-'*6}-+-{'-'*10}")
 
     total_slip = 0
-    slip_by_owner = defaultdict(list)
+    # Running [count, sum, max] per owner -- aggregated in the same pass as
+    # the table instead of collecting lists to re-reduce later
+    slip_by_owner = {}
 
+    # Format each distinct date once up front; milestones cluster on a few
+    # dates, so this runs strftime far fewer times than once per row
+    fmt = {}
     for c in comparisons:
-        sow_str = c['sow_date'].strftime('%m/%d')
-        curr_str = c['current_date'].strftime('%m/%d')
+        for d in (c['sow_date'], c['current_date']):
+            if d not in fmt:
+                fmt[d] = d.strftime('%m/%d')
+
+    for c in comparisons:
+        sow_str = fmt[c['sow_date']]
+        curr_str = fmt[c['current_date']]
         var = c['variance']
         var_str = f"+{var}d" if var > 0 else f"{var}d" if var < 0 else "0d"
         owner = c['assigned'] or 'N/A'
 
         # Highlight slips
         if var > 0:
-            slip_by_owner[owner].append(var)
+            agg = slip_by_owner.get(owner)
+            if agg is None:
+                slip_by_owner[owner] = [1, var, var]
+            else:
+                agg[0] += 1
+                agg[1] += var
+                if var > agg[2]:
+                    agg[2] = var
             total_slip = max(total_slip, var)
 
-        print(f"  {c['sow_name'][:45]:<45} | {sow_str:^10} | {curr_str:^10} | {var_str:^6} | {owner:<10}")
+        w(f"  {c['sow_name'][:45]:<45} | {sow_str:^10} | {curr_str:^10} | {var_str:^6} | {owner:<10}")
 
+    sys.stdout.write("\n".join(out) + "\n")
     return comparisons, slip_by_owner
 
 
 def identify_root_cause(comparisons, slip_by_owner):
     """Identify which vendor caused the slip"""
-    print("\n" + "=" * 90)
-    print("  ROOT CAUSE ANALYSIS - WHO CAUSED THE SLIP?")
-    print("=" * 90)
+    out = []
+    w = out.append
+    w("\n" + "=" * 90)
+    w("  ROOT CAUSE ANALYSIS - WHO CAUSED THE SLIP?")
+    w("=" * 90)
 
-    print("\n  Slip by Vendor (days past SOW contracted date):")
+    w("\n  Slip by Vendor (days past SOW contracted date):")
 
     vendors = ['IGT', 'FPS', 'Cognigy', 'CSG', 'Frontier']
     vendor_max_slip = {}
 
     for vendor in vendors:
-        slips = slip_by_owner.get(vendor, [])
-        if slips:
-            max_slip = max(slips)
-            avg_slip = sum(slips) / len(slips)
+        agg = slip_by_owner.get(vendor)
+        if agg:
+            count, slip_sum, max_slip = agg
+            avg_slip = slip_sum / count
             vendor_max_slip[vendor] = max_slip
-            print(f"    {vendor:10}: Max {max_slip:+3}d | Avg {avg_slip:+5.1f}d | {len(slips)} milestones slipped")
+            w(f"    {vendor:10}: Max {max_slip:+3}d | Avg {avg_slip:+5.1f}d | {count} milestones slipped")
         else:
-            print(f"    {vendor:10}: No slip data (tasks complete or on track)")
+            w(f"    {vendor:10}: No slip data (tasks complete or on track)")
 
     # Find the earliest critical slip
-    print("\n  [CRITICAL SLIP ANALYSIS]")
+    w("\n  [CRITICAL SLIP ANALYSIS]")
 
     critical_milestones = [c for c in comparisons if c['variance'] > 0]
     critical_milestones.sort(key=lambda x: x['sow_date'])
 
     if critical_milestones:
         first_slip = critical_milestones[0]
-        print(f"\n  FIRST MILESTONE TO SLIP:")
-        print(f"    Milestone: {first_slip['sow_name']}")
-        print(f"    Owner:     {first_slip['assigned'] or 'N/A'}")
-        print(f"    SOW Date:  {first_slip['sow_date'].strftime('%Y-%m-%d')}")
-        print(f"    Current:   {first_slip['current_date'].strftime('%Y-%m-%d')}")
-        print(f"    Slip:      {first_slip['variance']} days")
-
+        w(f"\n  FIRST MILESTONE TO SLIP:")
+        w(f"    Milestone: {first_slip['sow_name']}")
+        w(f"    Owner:     {first_slip['assigned'] or 'N/A'}")
+        w(f"    SOW Date:  {first_slip['sow_date'].strftime('%Y-%m-%d')}")
+        w(f"    Current:   {first_slip['current_date'].strftime('%Y-%m-%d')}")
+        w(f"    Slip:      {first_slip['variance']} days")
+
+    sys.stdout.write("\n".join(out) + "\n")
     return vendor_max_slip
 
 
-def analyze_igt_dependency(tasks):
+def analyze_igt_dependency(cols, by_owner):
     """Analyze the IGT dependency issue"""
-    print("\n" + "=" * 90)
-    print("  IGT DEPENDENCY DEEP DIVE")
-    print("=" * 90)
+    out = []
+    w = out.append
+    w("\n" + "=" * 90)
+    w("  IGT DEPENDENCY DEEP DIVE")
+    w("=" * 90)
 
     # SOW says IGT Staging Dependencies: Dec 8
     sow_igt_staging = datetime(2025, 12, 8)
 
-    # Find IGT tasks in schedule
-    igt_tasks = [t for t in tasks if t.get('Assigned To') == 'IGT']
+    # IGT task positions come straight from the shared owner index
+    igt_idx = by_owner.get('IGT', [])
 
-    print(f"\n  SOW Contracted Date for IGT Staging Dependencies: {sow_igt_staging.strftime('%Y-%m-%d')}")
-    print(f"  SOW Contracted Date for IGT Production Dependencies: 2025-12-15")
+    w(f"\n  SOW Contracted Date for IGT Staging Dependencies: {sow_igt_staging.strftime('%Y-%m-%d')}")
+    w(f"  SOW Contracted Date for IGT Production Dependencies: 2025-12-15")
 
-    print(f"\n  Current IGT Tasks in Schedule:")
-    for t in igt_tasks:
-        end = parse_date(t.get('End Date'))
+    w(f"\n  Current IGT Tasks in Schedule:")
+    for i in igt_idx:
+        end = parse_date(cols['End Date'][i])
         end_str = end.strftime('%Y-%m-%d') if end else 'N/A'
-        status = t.get('Status', 'N/A')
-        health = t.get('Health', 'N/A')
-        notes = t.get('Notes', '')
+        status = cols['Status'][i] or 'N/A'
+        health = cols['Health'][i] or 'N/A'
+        notes = cols['Notes'][i] or ''
 
-        print(f"    Row {t['row_number']:2}: {end_str} | {status:12} | {health:6} | {t['Tasks'][:40]}")
+        w(f"    Row {cols['row_number'][i]:2}: {end_str} | {status:12} | {health:6} | {cols['Tasks'][i][:40]}")
         if notes:
-            print(f"           NOTE: {notes[:70]}")
+            w(f"           NOTE: {notes[:70]}")
 
     # The key note
-    print(f"\n  [KEY EVIDENCE]")
-    print(f"    SOW Section 9 (Penalties): 'FPS shall not be liable for penalties or damages'")
-    print(f"    'if delays occur due to dependencies outside FPS control (by Frontier, Cognigy, CSG, IGT, etc.)'")
-    print(f"\n    The IGT note from 12/05 states configuration will take '2-3 more weeks'")
-    print(f"    This pushes IGT completion from Dec 8 (SOW) to Dec 23 (current) = 15 days slip")
+    w(f"\n  [KEY EVIDENCE]")
+    w(f"    SOW Section 9 (Penalties): 'FPS shall not be liable for penalties or damages'")
+    w(f"    'if delays occur due to dependencies outside FPS control (by Frontier, Cognigy, CSG, IGT, etc.)'")
+    w(f"\n    The IGT note from 12/05 states configuration will take '2-3 more weeks'")
+    w(f"    This pushes IGT completion from Dec 8 (SOW) to Dec 23 (current) = 15 days slip")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def calculate_cascade_impact(tasks):
@@ -253,11 +341,13 @@ def calculate_cascade_impact(tasks):
 
 def generate_accountability_report():
     """Generate accountability report"""
-    print("\n" + "=" * 90)
-    print("  ACCOUNTABILITY REPORT")
-    print("=" * 90)
+    out = []
+    w = out.append
+    w("\n" + "=" * 90)
+    w("  ACCOUNTABILITY REPORT")
+    w("=" * 90)
 
-    print("""
+    w("""
   Based on SOW Analysis:
 
   1. CONTRACTED GO-LIVE: January 7-14, 2026
@@ -300,6 +390,8 @@ def generate_accountability_report():
         schedule adjustment caused by IGT dependency delay
 """)
 
+    sys.stdout.write("\n".join(out) + "\n")
+
 
 def main():
     """Main entry point"""
@@ -309,10 +401,12 @@ def main():
     print("=" * 90)
 
     tasks = load_schedule()
+    cols = to_columns(tasks)
+    by_owner = index_by_owner(cols)
 
-    comparisons, slip_by_owner = compare_schedule_to_sow(tasks)
+    comparisons, slip_by_owner = compare_schedule_to_sow(cols)
     vendor_slips = identify_root_cause(comparisons, slip_by_owner)
-    analyze_igt_dependency(tasks)
+    analyze_igt_dependency(cols, by_owner)
     calculate_cascade_impact(tasks)
     generate_accountability_report()
 
@@ -7,12 +7,71 @@ Widget types supported:
 - SHEETSUMMARY, SHORTCUT, SHORTCUTICON, SHORTCUTLIST, TITLE
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-
-
-@dataclass
-class WidgetPosition:
+import json
+from types import MappingProxyType
+from typing import Any, Dict, Final, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Static contents skeletons, shallow-copied per call so the create_* methods
+# only fill in dynamic fields instead of rebuilding the same literals
+_TITLE_CONTENTS_TEMPLATE: Final = MappingProxyType({"type": "TITLE", "backgroundColor": "#FFFFFF"})
+_METRIC_CONTENTS_TEMPLATE: Final = MappingProxyType({"type": "METRIC"})
+_IMAGE_CONTENTS_TEMPLATE: Final = MappingProxyType({"type": "IMAGE", "fit": "FIT"})
+
+# Fixed row layouts: the grid coordinates and titles never change, so the
+# row builders just expand these specs instead of running per-widget logic
+_ROW1_SPEC: Final = (
+    ("STATUS", "Project Health", 0),
+    ("VARIANCE", "Project Variance", 3),
+    ("NEW TARGET", "Target Go-Live", 6),
+    ("ORIGINAL PLAN", "Original Go-Live", 9),
+)
+_ROW2_SPEC: Final = (
+    ("HEALTH COUNTS", "PIE", "health", 0, 4),
+    ("COMPLETION %", "DONUT", "status", 4, 3),
+    ("TASKS BY STATUS", "BAR", "status", 7, 5),
+)
+# Progress bars and their colors precomputed for every tenth, indexed by
+# the number of filled cells (0-10)
+_BARS: Final = tuple("█" * i + "░" * (10 - i) for i in range(11))
+_BAR_COLORS: Final = ("#c62828",) * 4 + ("#f57c00",) * 2 + ("#2e7d32",) * 5
+
+# Single %-format template per vendor row: the format string is parsed once
+# instead of assembling multiple f-string pieces per vendor
+# Shared immutable default for vendor progress; read-only downstream
+_DEFAULT_VENDOR_DATA: Final = MappingProxyType({
+    "FPS": 80,
+    "IGT": 40,
+    "Cognigy": 60,
+    "CSG": 40,
+    "Frontier": 20,
+})
+
+# Substitution hole spliced into the serialized blueprint in place of the
+# vendor-progress HTML; plain ASCII so it survives any JSON encoder
+_VENDOR_HTML_SLOT: Final = "{{VENDOR_HTML}}"
+
+_VENDOR_ROW_TMPL: Final = (
+    '<div style="margin-bottom: 12px; display: flex; align-items: center;">'
+    '<span style="width: 80px; font-weight: bold;">%s:</span>'
+    '<span style="font-family: monospace; letter-spacing: 2px; margin: 0 10px;">%s</span>'
+    '<span style="font-weight: bold; color: %s;">%d%%</span>'
+    '</div>'
+)
+
+_ROW5_SPEC: Final = (
+    ("📋 Task Sheet", 0),
+    ("📊 Gantt View", 3),
+    ("📈 Summary", 6),
+)
+
+
+class WidgetPosition(NamedTuple):
     """Widget position and size on the dashboard grid"""
     x: int = 0
     y: int = 0
@@ -20,6 +79,50 @@ class WidgetPosition:
     height: int = 3
 
 
+class Widget:
+    """Slotted widget record; to_dict() produces the final API payload"""
+    __slots__ = ("type", "title", "showTitle", "showTitleIcon",
+                 "xPosition", "yPosition", "width", "height", "contents")
+
+    def __init__(
+        self,
+        widget_type: str,
+        title: str,
+        show_title: bool,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        contents: Dict,
+        show_title_icon: bool = None
+    ):
+        self.type = widget_type
+        self.title = title
+        self.showTitle = show_title
+        self.showTitleIcon = show_title_icon
+        self.xPosition = x
+        self.yPosition = y
+        self.width = width
+        self.height = height
+        self.contents = contents
+
+    def to_dict(self) -> Dict:
+        """Build the API dict once, at serialization time"""
+        widget = {
+            "type": self.type,
+            "title": self.title,
+            "showTitle": self.showTitle,
+            "xPosition": self.xPosition,
+            "yPosition": self.yPosition,
+            "width": self.width,
+            "height": self.height,
+            "contents": self.contents,
+        }
+        if self.showTitleIcon is not None:
+            widget["showTitleIcon"] = self.showTitleIcon
+        return widget
+
+
 class WidgetBuilder:
     """Builds widget configurations for dashboard"""
 
@@ -28,15 +131,34 @@ class WidgetBuilder:
         sheet_id: int,
         summary_fields: Dict[str, Dict],
         column_ids: Dict[str, int],
-        report_ids: Dict[str, int] = None
+        report_ids: Dict[str, int] = None,
+        blueprint_mode: bool = False
     ):
         self.sheet_id = sheet_id
         self.summary_fields = summary_fields  # {title: {id, displayValue}}
-        self.column_ids = column_ids  # {column_name: column_id}
+        # Flatten {title: {id, ...}} to {title: id} so lookups are one get
+        self._summary_field_ids = {
+            t: (f or {}).get('id') for t, f in (summary_fields or {}).items()
+        }
+        # Lowercase the keys once so lookups skip the per-call .lower()
+        self.column_ids = {k.lower(): v for k, v in column_ids.items()}
+        # Chart column-id lists resolved once; None when the column is absent
+        self._chart_columns = {
+            name: [cid] if (cid := self.column_ids.get(name)) else None
+            for name in ("health", "status")
+        }
         self.report_ids = report_ids or {}
 
         # Widget counter for unique IDs (temporary, API will assign real IDs)
-        self._widget_counter = 0
+        self._widget_counter: int = 0
+
+        # Serialized dashboards keyed by input digest, for repeat refreshes
+        self._build_cache: Dict[Tuple, bytes] = {}
+
+        # Opt-in: serialize the dashboard once and refresh by splicing only
+        # the vendor-progress HTML into the cached bytes
+        self.blueprint_mode = blueprint_mode
+        self._blueprint_cache: Optional[bytes] = None
 
     def _next_widget_id(self) -> int:
         """Generate a temporary widget ID"""
@@ -45,12 +167,11 @@ class WidgetBuilder:
 
     def _get_summary_field_id(self, title: str) -> Optional[int]:
         """Get summary field ID by title"""
-        field = self.summary_fields.get(title, {})
-        return field.get('id')
+        return self._summary_field_ids.get(title)
 
     def _get_column_id(self, name: str) -> Optional[int]:
-        """Get column ID by name"""
-        return self.column_ids.get(name.lower())
+        """Get column ID by lowercase name"""
+        return self.column_ids.get(name)
 
     # Title Widget
     def create_title_widget(
@@ -58,28 +179,18 @@ class WidgetBuilder:
         title: str,
         subtitle: str = None,
         position: WidgetPosition = None
-    ) -> Dict:
+    ) -> Widget:
         """Create a title widget"""
-        pos = position or WidgetPosition(0, 0, 12, 2)
-
-        widget = {
-            "type": "TITLE",
-            "title": title,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "showTitle": True,
-            "contents": {
-                "type": "TITLE",
-                "backgroundColor": "#FFFFFF"
-            }
-        }
+        if position is None:
+            x, y, w, h = 0, 0, 12, 2
+        else:
+            x, y, w, h = position
 
+        contents = dict(_TITLE_CONTENTS_TEMPLATE)
         if subtitle:
-            widget["contents"]["htmlContent"] = f"<p>{subtitle}</p>"
+            contents["htmlContent"] = f"<p>{subtitle}</p>"
 
-        return widget
+        return Widget("TITLE", title, True, x, y, w, h, contents)
 
     # Metric Widget
     def create_metric_widget(
@@ -88,7 +199,7 @@ class WidgetBuilder:
         summary_field_title: str,
         position: WidgetPosition = None,
         hyperlink_url: str = None
-    ) -> Dict:
+    ) -> Widget:
         """
         Create a metric widget displaying a sheet summary field value
 
@@ -98,33 +209,51 @@ class WidgetBuilder:
             position: Widget position on grid
             hyperlink_url: Optional URL to link to
         """
-        pos = position or WidgetPosition(0, 0, 3, 3)
+        if position is None:
+            x, y, w, h = 0, 0, 3, 3
+        else:
+            x, y, w, h = position
         summary_field_id = self._get_summary_field_id(summary_field_title)
 
-        widget = {
-            "type": "METRIC",
-            "title": title,
-            "showTitle": True,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "METRIC",
-                "sheetId": self.sheet_id,
-                "cellData": [{
-                    "objectId": self.sheet_id,
-                    "dataSource": "SUMMARY_FIELD",
-                    "columnId": summary_field_id,
-                    "label": title
-                }]
-            }
-        }
-
+        contents = dict(_METRIC_CONTENTS_TEMPLATE)
+        contents["sheetId"] = self.sheet_id
+        contents["cellData"] = [{
+            "objectId": self.sheet_id,
+            "dataSource": "SUMMARY_FIELD",
+            "columnId": summary_field_id,
+            "label": title
+        }]
         if hyperlink_url:
-            widget["contents"]["hyperlink"] = {"url": hyperlink_url}
+            contents["hyperlink"] = {"url": hyperlink_url}
 
-        return widget
+        return Widget("METRIC", title, True, x, y, w, h, contents)
+
+    def create_metric_widgets(
+        self,
+        specs: List[Tuple[str, str, WidgetPosition]]
+    ) -> List[Widget]:
+        """
+        Create several metric widgets in one pass
+
+        Each spec is (title, summary_field_title, position); hoisting the
+        sheet-id and summary-field lookups amortizes them across the batch.
+        """
+        sheet_id = self.sheet_id
+        field_ids = self._summary_field_ids
+        widgets = []
+
+        for title, summary_title, (x, y, w, h) in specs:
+            contents = dict(_METRIC_CONTENTS_TEMPLATE)
+            contents["sheetId"] = sheet_id
+            contents["cellData"] = [{
+                "objectId": sheet_id,
+                "dataSource": "SUMMARY_FIELD",
+                "columnId": field_ids.get(summary_title),
+                "label": title
+            }]
+            widgets.append(Widget("METRIC", title, True, x, y, w, h, contents))
+
+        return widgets
 
     # Sheet Summary Widget
     def create_sheet_summary_widget(
@@ -132,24 +261,18 @@ class WidgetBuilder:
         title: str,
         summary_field_ids: List[int],
         position: WidgetPosition = None
-    ) -> Dict:
+    ) -> Widget:
         """Create a sheet summary widget showing multiple summary fields"""
-        pos = position or WidgetPosition(0, 0, 4, 4)
+        if position is None:
+            x, y, w, h = 0, 0, 4, 4
+        else:
+            x, y, w, h = position
 
-        return {
+        return Widget("SHEETSUMMARY", title, True, x, y, w, h, {
             "type": "SHEETSUMMARY",
-            "title": title,
-            "showTitle": True,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "SHEETSUMMARY",
-                "sheetId": self.sheet_id,
-                "summaryFieldIds": summary_field_ids
-            }
-        }
+            "sheetId": self.sheet_id,
+            "summaryFieldIds": summary_field_ids
+        })
 
     # Chart Widget
     def create_chart_widget(
@@ -159,7 +282,7 @@ class WidgetBuilder:
         position: WidgetPosition = None,
         column_ids: List[int] = None,
         legend_position: str = "RIGHT"
-    ) -> Dict:
+    ) -> Widget:
         """
         Create a chart widget
 
@@ -170,30 +293,23 @@ class WidgetBuilder:
             column_ids: Column IDs to include in chart
             legend_position: LEFT, RIGHT, TOP, BOTTOM
         """
-        pos = position or WidgetPosition(0, 0, 4, 4)
+        if position is None:
+            x, y, w, h = 0, 0, 4, 4
+        else:
+            x, y, w, h = position
 
-        widget = {
+        contents = {
             "type": "CHART",
-            "title": title,
-            "showTitle": True,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "CHART",
-                "chartType": chart_type,
-                "sheetId": self.sheet_id,
-                "legend": {
-                    "position": legend_position
-                }
+            "chartType": chart_type,
+            "sheetId": self.sheet_id,
+            "legend": {
+                "position": legend_position
             }
         }
-
         if column_ids:
-            widget["contents"]["includedColumnIds"] = column_ids
+            contents["includedColumnIds"] = column_ids
 
-        return widget
+        return Widget("CHART", title, True, x, y, w, h, contents)
 
     # Report Widget (GRIDGANTT type)
     def create_report_widget(
@@ -202,28 +318,21 @@ class WidgetBuilder:
         report_id: int,
         position: WidgetPosition = None,
         show_title: bool = True
-    ) -> Dict:
+    ) -> Widget:
         """
         Create a report widget
 
         Note: Report widgets use type GRIDGANTT in the API
         """
-        pos = position or WidgetPosition(0, 0, 12, 5)
-
-        return {
-            "type": "GRIDGANTT",
-            "title": title,
-            "showTitle": show_title,
-            "showTitleIcon": False,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "REPORT",
-                "reportId": report_id
-            }
-        }
+        if position is None:
+            x, y, w, h = 0, 0, 12, 5
+        else:
+            x, y, w, h = position
+
+        return Widget("GRIDGANTT", title, show_title, x, y, w, h, {
+            "type": "REPORT",
+            "reportId": report_id
+        }, show_title_icon=False)
 
     # Rich Text Widget
     def create_richtext_widget(
@@ -231,23 +340,17 @@ class WidgetBuilder:
         title: str,
         html_content: str,
         position: WidgetPosition = None
-    ) -> Dict:
+    ) -> Widget:
         """Create a rich text widget for custom formatted content"""
-        pos = position or WidgetPosition(0, 0, 6, 4)
+        if position is None:
+            x, y, w, h = 0, 0, 6, 4
+        else:
+            x, y, w, h = position
 
-        return {
+        return Widget("RICHTEXT", title, True, x, y, w, h, {
             "type": "RICHTEXT",
-            "title": title,
-            "showTitle": True,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "RICHTEXT",
-                "htmlContent": html_content
-            }
-        }
+            "htmlContent": html_content
+        })
 
     # Shortcut Widget
     def create_shortcut_widget(
@@ -255,7 +358,7 @@ class WidgetBuilder:
         title: str,
         shortcuts: List[Dict],
         position: WidgetPosition = None
-    ) -> Dict:
+    ) -> Widget:
         """
         Create a shortcut widget with links
 
@@ -265,21 +368,15 @@ class WidgetBuilder:
                 - label: Display text
                 - sheetId OR reportId OR url: Link target
         """
-        pos = position or WidgetPosition(0, 0, 3, 2)
+        if position is None:
+            x, y, w, h = 0, 0, 3, 2
+        else:
+            x, y, w, h = position
 
-        return {
+        return Widget("SHORTCUTLIST", title, bool(title.strip()), x, y, w, h, {
             "type": "SHORTCUTLIST",
-            "title": title,
-            "showTitle": bool(title.strip()),
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "SHORTCUTLIST",
-                "shortcutData": shortcuts
-            }
-        }
+            "shortcutData": shortcuts
+        })
 
     # Image Widget
     def create_image_widget(
@@ -288,264 +385,177 @@ class WidgetBuilder:
         position: WidgetPosition = None,
         private_id: str = None,
         hyperlink_url: str = None
-    ) -> Dict:
+    ) -> Widget:
         """Create an image widget"""
-        pos = position or WidgetPosition(0, 0, 3, 3)
-
-        widget = {
-            "type": "IMAGE",
-            "title": title,
-            "showTitle": False,
-            "xPosition": pos.x,
-            "yPosition": pos.y,
-            "width": pos.width,
-            "height": pos.height,
-            "contents": {
-                "type": "IMAGE",
-                "fit": "FIT"
-            }
-        }
+        if position is None:
+            x, y, w, h = 0, 0, 3, 3
+        else:
+            x, y, w, h = position
 
+        contents = dict(_IMAGE_CONTENTS_TEMPLATE)
         if private_id:
-            widget["contents"]["privateId"] = private_id
-
+            contents["privateId"] = private_id
         if hyperlink_url:
-            widget["contents"]["hyperlink"] = {"url": hyperlink_url}
+            contents["hyperlink"] = {"url": hyperlink_url}
 
-        return widget
+        return Widget("IMAGE", title, False, x, y, w, h, contents)
 
     # =====================================
     # Dashboard-specific widget builders
     # =====================================
 
-    def build_row1_kpi_widgets(self, start_y: int = 2) -> List[Dict]:
+    def build_row1_kpi_widgets(self, start_y: int = 2) -> List[Widget]:
         """
         Build Row 1: Critical KPI Widgets
         STATUS | VARIANCE | NEW TARGET | ORIGINAL PLAN
         """
-        widgets = []
+        return self.create_metric_widgets([
+            (title, summary_title, WidgetPosition(x, start_y, 3, 3))
+            for title, summary_title, x in _ROW1_SPEC
+        ])
 
-        # STATUS widget
-        widgets.append(self.create_metric_widget(
-            title="STATUS",
-            summary_field_title="Project Health",
-            position=WidgetPosition(0, start_y, 3, 3)
-        ))
-
-        # VARIANCE widget
-        widgets.append(self.create_metric_widget(
-            title="VARIANCE",
-            summary_field_title="Project Variance",
-            position=WidgetPosition(3, start_y, 3, 3)
-        ))
-
-        # NEW TARGET widget
-        widgets.append(self.create_metric_widget(
-            title="NEW TARGET",
-            summary_field_title="Target Go-Live",
-            position=WidgetPosition(6, start_y, 3, 3)
-        ))
-
-        # ORIGINAL PLAN widget
-        widgets.append(self.create_metric_widget(
-            title="ORIGINAL PLAN",
-            summary_field_title="Original Go-Live",
-            position=WidgetPosition(9, start_y, 3, 3)
-        ))
-
-        return widgets
-
-    def build_row2_chart_widgets(self, start_y: int = 5) -> List[Dict]:
+    def build_row2_chart_widgets(self, start_y: int = 5) -> List[Widget]:
         """
         Build Row 2: Visual Snapshot Charts
         HEALTH COUNTS (Pie) | COMPLETION % (Donut) | TASKS BY STATUS (Bar)
         """
-        widgets = []
-
-        health_col = self._get_column_id("health")
-        status_col = self._get_column_id("status")
-
-        # HEALTH COUNTS - Pie chart
-        widgets.append(self.create_chart_widget(
-            title="HEALTH COUNTS",
-            chart_type="PIE",
-            position=WidgetPosition(0, start_y, 4, 4),
-            column_ids=[health_col] if health_col else None
-        ))
-
-        # COMPLETION % - Donut chart
-        widgets.append(self.create_chart_widget(
-            title="COMPLETION %",
-            chart_type="DONUT",
-            position=WidgetPosition(4, start_y, 3, 4),
-            column_ids=[status_col] if status_col else None
-        ))
-
-        # TASKS BY STATUS - Bar chart
-        widgets.append(self.create_chart_widget(
-            title="TASKS BY STATUS",
-            chart_type="BAR",
-            position=WidgetPosition(7, start_y, 5, 4),
-            column_ids=[status_col] if status_col else None
-        ))
-
-        return widgets
-
-    def build_row3_fire_list(self, start_y: int = 9) -> List[Dict]:
+        return [
+            self.create_chart_widget(
+                title, chart_type,
+                WidgetPosition(x, start_y, width, 4),
+                self._chart_columns[key]
+            )
+            for title, chart_type, key, x, width in _ROW2_SPEC
+        ]
+
+    def build_row3_fire_list(self, start_y: int = 9) -> Iterator[Widget]:
         """
         Build Row 3: Fire List Report Widget
         """
-        widgets = []
-
         at_risk_id = self.report_ids.get("at_risk")
         if at_risk_id:
-            widgets.append(self.create_report_widget(
-                title="🔥 THE FIRE LIST: TOP 5 AT-RISK",
-                report_id=at_risk_id,
-                position=WidgetPosition(0, start_y, 12, 5)
-            ))
-
-        return widgets
+            yield self.create_report_widget(
+                "🔥 THE FIRE LIST: TOP 5 AT-RISK",
+                at_risk_id,
+                WidgetPosition(0, start_y, 12, 5)
+            )
 
     def build_row4_vendor_milestones(
         self,
         start_y: int = 14,
         vendor_data: Dict[str, float] = None
-    ) -> List[Dict]:
+    ) -> Iterator[Widget]:
         """
         Build Row 4: Vendor Progress & Milestones
         """
-        widgets = []
-
         # Default vendor data
         if vendor_data is None:
-            vendor_data = {
-                "FPS": 80,
-                "IGT": 40,
-                "Cognigy": 60,
-                "CSG": 40,
-                "Frontier": 20
-            }
+            vendor_data = _DEFAULT_VENDOR_DATA
 
         # Build vendor progress HTML
         vendor_html = self._build_vendor_progress_html(vendor_data)
-        widgets.append(self.create_richtext_widget(
-            title="VENDOR PROGRESS",
-            html_content=vendor_html,
-            position=WidgetPosition(0, start_y, 6, 5)
-        ))
+        yield self.create_richtext_widget(
+            "VENDOR PROGRESS",
+            vendor_html,
+            WidgetPosition(0, start_y, 6, 5)
+        )
 
         # Milestones report widget
         milestones_id = self.report_ids.get("milestones")
         if milestones_id:
-            widgets.append(self.create_report_widget(
-                title="UPCOMING MILESTONES",
-                report_id=milestones_id,
-                position=WidgetPosition(6, start_y, 6, 5)
-            ))
-
-        return widgets
+            yield self.create_report_widget(
+                "UPCOMING MILESTONES",
+                milestones_id,
+                WidgetPosition(6, start_y, 6, 5)
+            )
 
     def _build_vendor_progress_html(self, vendor_data: Dict[str, float]) -> str:
         """Build HTML for vendor progress display"""
         html = ['<div style="font-family: Arial, sans-serif; padding: 10px; font-size: 14px;">']
 
         for vendor, pct in vendor_data.items():
-            filled = int(pct / 10)
-            empty = 10 - filled
-
-            # Use HTML entities for progress bar
-            bar = "█" * filled + "░" * empty
-
-            html.append(f'''
-                <div style="margin-bottom: 12px; display: flex; align-items: center;">
-                    <span style="width: 80px; font-weight: bold;">{vendor}:</span>
-                    <span style="font-family: monospace; letter-spacing: 2px; margin: 0 10px;">{bar}</span>
-                    <span style="font-weight: bold; color: {"#2e7d32" if pct >= 60 else "#f57c00" if pct >= 40 else "#c62828"};">{int(pct)}%</span>
-                </div>
-            ''')
+            filled = min(10, max(0, int(pct) // 10))
+            html.append(_VENDOR_ROW_TMPL % (vendor, _BARS[filled], _BAR_COLORS[filled], pct))
 
         html.append('</div>')
         return ''.join(html)
 
-    def build_row5_quick_links(self, start_y: int = 19) -> List[Dict]:
+    def build_row5_quick_links(self, start_y: int = 19) -> Iterator[Widget]:
         """
         Build Row 5: Quick Links
         Task Sheet | Gantt View | Summary | Overdue Report
         """
-        widgets = []
-
-        # Task Sheet shortcut
-        widgets.append(self.create_shortcut_widget(
-            title="",
-            shortcuts=[{
-                "label": "📋 Task Sheet",
-                "sheetId": self.sheet_id
-            }],
-            position=WidgetPosition(0, start_y, 3, 2)
-        ))
-
-        # Gantt View shortcut
-        widgets.append(self.create_shortcut_widget(
-            title="",
-            shortcuts=[{
-                "label": "📊 Gantt View",
-                "sheetId": self.sheet_id
-            }],
-            position=WidgetPosition(3, start_y, 3, 2)
-        ))
-
-        # Summary shortcut
-        widgets.append(self.create_shortcut_widget(
-            title="",
-            shortcuts=[{
-                "label": "📈 Summary",
-                "sheetId": self.sheet_id
-            }],
-            position=WidgetPosition(6, start_y, 3, 2)
-        ))
+        for label, x in _ROW5_SPEC:
+            yield self.create_shortcut_widget(
+                "",
+                [{"label": label, "sheetId": self.sheet_id}],
+                WidgetPosition(x, start_y, 3, 2)
+            )
 
         # Overdue Report shortcut
         at_risk_id = self.report_ids.get("at_risk")
         if at_risk_id:
-            widgets.append(self.create_shortcut_widget(
-                title="",
-                shortcuts=[{
-                    "label": "⚠️ At-Risk Report",
-                    "reportId": at_risk_id
-                }],
-                position=WidgetPosition(9, start_y, 3, 2)
-            ))
-
-        return widgets
-
-    def build_all_widgets(self, vendor_data: Dict[str, float] = None) -> List[Dict]:
-        """Build all widgets for the complete dashboard"""
-        all_widgets = []
-
-        # Title widget
-        all_widgets.append(self.create_title_widget(
-            title="Phase 2 - Agentic Voice",
-            subtitle="Project Dashboard",
-            position=WidgetPosition(0, 0, 12, 2)
-        ))
-
-        # Row 1: KPI Widgets
-        all_widgets.extend(self.build_row1_kpi_widgets(start_y=2))
-
-        # Row 2: Chart Widgets
-        all_widgets.extend(self.build_row2_chart_widgets(start_y=5))
-
-        # Row 3: Fire List
-        all_widgets.extend(self.build_row3_fire_list(start_y=9))
-
-        # Row 4: Vendor Progress & Milestones
-        all_widgets.extend(self.build_row4_vendor_milestones(
-            start_y=14,
-            vendor_data=vendor_data
-        ))
-
-        # Row 5: Quick Links
-        all_widgets.extend(self.build_row5_quick_links(start_y=19))
-
-        return all_widgets
+            yield self.create_shortcut_widget(
+                "",
+                [{"label": "⚠️ At-Risk Report", "reportId": at_risk_id}],
+                WidgetPosition(9, start_y, 3, 2)
+            )
+
+    def build_all_widgets(self, vendor_data: Dict[str, float] = None) -> Iterator[Widget]:
+        """Yield all widgets for the complete dashboard"""
+        yield self.create_title_widget(
+            "Phase 2 - Agentic Voice",
+            "Project Dashboard",
+            WidgetPosition(0, 0, 12, 2)
+        )
+        yield from self.build_row1_kpi_widgets(2)
+        yield from self.build_row2_chart_widgets(5)
+        yield from self.build_row3_fire_list(9)
+        yield from self.build_row4_vendor_milestones(14, vendor_data)
+        yield from self.build_row5_quick_links(19)
+
+    def _blueprint(self) -> bytes:
+        """Serialize the dashboard once with a vendor-HTML placeholder"""
+        if self._blueprint_cache is None:
+            payload = [w.to_dict() for w in self.build_all_widgets()]
+            for widget in payload:
+                if widget["type"] == "RICHTEXT" and widget["title"] == "VENDOR PROGRESS":
+                    widget["contents"] = dict(widget["contents"],
+                                              htmlContent=_VENDOR_HTML_SLOT)
+            if orjson is not None:
+                self._blueprint_cache = orjson.dumps(payload)
+            else:
+                self._blueprint_cache = json.dumps(payload).encode()
+        return self._blueprint_cache
+
+    def to_json(self, vendor_data: Dict[str, float] = None) -> bytes:
+        """Build all widgets and serialize them to JSON bytes, memoized"""
+        if self.blueprint_mode:
+            # Refresh = one HTML render plus a bytes-level substitution; no
+            # widget dicts are rebuilt or re-encoded
+            html = self._build_vendor_progress_html(
+                vendor_data if vendor_data is not None else _DEFAULT_VENDOR_DATA)
+            escaped = json.dumps(html, ensure_ascii=False).encode()[1:-1]
+            return self._blueprint().replace(_VENDOR_HTML_SLOT.encode(), escaped)
+
+        key = (
+            self.sheet_id,
+            tuple(sorted(self.report_ids.items())),
+            tuple(sorted((vendor_data or {}).items())),
+        )
+        cached = self._build_cache.get(key)
+        if cached is not None:
+            return cached
+
+        payload = [w.to_dict() for w in self.build_all_widgets(vendor_data)]
+        if orjson is not None:
+            blob = orjson.dumps(payload)
+        else:
+            blob = json.dumps(payload).encode()
+        self._build_cache[key] = blob
+        return blob
+
+    def invalidate(self) -> None:
+        """Drop cached serializations after mutating builder inputs"""
+        self._build_cache.clear()
+        self._blueprint_cache = None